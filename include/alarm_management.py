@@ -10,9 +10,18 @@ from gi.repository import GLib, Gtk
 
 
 class AlarmManagement:
+    def _alarm_owner_key(self, task):
+        """Key for a task's entry in triggered_alarms"""
+        # Use a stable alarm ID based on task content instead of date/index
+        task_id = task.get("id")
+        if task_id:
+            return task_id
+        # Fallback for old tasks without ID - use description hash
+        return hashlib.md5(task.get("description", "").encode()).hexdigest()[:8]
+
     def check_alarms(self):
         """Check for tasks with alarms that need to trigger"""
-        now = datetime.now().replace(tzinfo=None)
+        now = self._now()
 
         for date_str, tasks in list(self.tasks.items()):
             for i, task in enumerate(tasks):
@@ -20,18 +29,12 @@ class AlarmManagement:
                     alarm_time_str = task.get("alarm_time")
                     acknowledged = task.get("acknowledged", False)
 
-                    # Use a stable alarm ID based on task content instead of date/index
-                    task_id = task.get("id")
-                    if task_id:
-                        alarm_id = f"{task_id}:{alarm_time_str}"
-                    else:
-                        # Fallback for old tasks without ID - use description hash
-                        desc_hash = hashlib.md5(
-                            task.get("description", "").encode()
-                        ).hexdigest()[:8]
-                        alarm_id = f"{desc_hash}:{alarm_time_str}"
-
-                    if not acknowledged and alarm_id not in self.triggered_alarms:
+                    # Triggered alarm times are grouped per task so a task's
+                    # history can be dropped in one step
+                    owner_key = self._alarm_owner_key(task)
+                    triggered = self.triggered_alarms.get(owner_key, ())
+
+                    if not acknowledged and alarm_time_str not in triggered:
                         if alarm_time_str:
                             try:
                                 alarm_time = datetime.fromisoformat(alarm_time_str)
@@ -45,7 +48,9 @@ class AlarmManagement:
 
                                 # Trigger alarm within 60 second window
                                 if 0 <= time_diff <= 60:
-                                    self.triggered_alarms.add(alarm_id)
+                                    self.triggered_alarms.setdefault(
+                                        owner_key, set()
+                                    ).add(alarm_time_str)
                                     GLib.idle_add(
                                         self.show_alarm_notification, date_str, task
                                     )
@@ -113,7 +113,7 @@ class CalendarUI:
     def on_full_sync_clicked(self, button):
         """Handle full sync button click"""
         self.debug_logger.logger.info("Full sync button clicked")
-        if hasattr(self, "multicast_sync"):
+        if self.multicast_sync is not None:
             self.multicast_sync.full_sync()
 
     def on_month_changed(self, combo):
@@ -501,47 +501,28 @@ class CalendarUI:
 
     def on_date_hover_enter(self, widget, event):
         """Handle mouse entering date cell"""
-        if widget.is_today:
-            css_provider = self._css_providers["hover_today"]
-        else:
-            css_provider = self._css_providers["hover_normal"]
-
-        widget.get_style_context().add_provider(
-            css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+        widget.get_style_context().add_class(
+            "calan-hover-today" if widget.is_today else "calan-hover"
         )
         return False
 
     def on_date_hover_leave(self, widget, event):
         """Handle mouse leaving date cell"""
-        if widget.is_today:
-            css_provider = self._css_providers["hover_leave_today"]
-        else:
-            css_provider = self._css_providers["hover_leave_normal"]
-
-        widget.get_style_context().add_provider(
-            css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+        widget.get_style_context().remove_class(
+            "calan-hover-today" if widget.is_today else "calan-hover"
         )
         return False
 
     def on_drag_motion(self, widget, drag_context, x, y, time, date):
         """Handle drag motion over date cell"""
-        widget.get_style_context().add_provider(
-            self._css_providers["drag_motion"], Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        widget.get_style_context().add_class("calan-drag-motion")
 
         Gdk.drag_status(drag_context, Gdk.DragAction.MOVE, time)
         return True
 
     def on_drag_leave(self, widget, drag_context, time, date):
         """Handle drag leaving date cell"""
-        if widget.is_today:
-            css_provider = self._css_providers["drag_leave_today"]
-        else:
-            css_provider = self._css_providers["drag_leave_normal"]
-
-        widget.get_style_context().add_provider(
-            css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        widget.get_style_context().remove_class("calan-drag-motion")
 
     def on_drag_data_received(
         self, widget, drag_context, x, y, data, info, time, target_date
@@ -618,7 +599,7 @@ class CalendarUI:
                     task_to_move["updated_at"] = datetime.now().isoformat()
 
                     # Sync with other instances via multicast
-                    if hasattr(self, "multicast_sync"):
+                    if self.multicast_sync is not None:
                         # Create task update with both old and new dates
                         sync_task = task_to_move.copy()
                         sync_task["date"] = target_date_str
@@ -629,21 +610,9 @@ class CalendarUI:
 
                     # Clean up triggered alarms
                     if hasattr(self, "triggered_alarms"):
-                        task_id = task_to_move.get("id")
-                        if task_id:
-                            self.triggered_alarms = {
-                                alarm_id
-                                for alarm_id in self.triggered_alarms
-                                if not alarm_id.startswith(f"{task_id}:")
-                            }
-                        else:
-                            alarm_time_str = task_to_move.get("alarm_time")
-                            if alarm_time_str:
-                                self.triggered_alarms = {
-                                    alarm_id
-                                    for alarm_id in self.triggered_alarms
-                                    if not alarm_id.startswith(f"{alarm_time_str}:")
-                                }
+                        self.triggered_alarms.pop(
+                            self._alarm_owner_key(task_to_move), None
+                        )
 
                     self.save_tasks()
                     self.update_calendar()
@@ -4,6 +4,7 @@ Handles conversion between internal task format and VTODO format
 """
 
 import os
+import threading
 import uuid
 from datetime import datetime, timezone
 
@@ -17,6 +18,9 @@ class ICSStorage:
         os.makedirs(self.data_dir, exist_ok=True)
         self.ics_file = os.path.join(self.data_dir, "calendar.ics")
         self.debug_logger = debug_logger
+        # Serialized VTODO bytes per date from the last save
+        self._vtodo_cache = {}
+        self._save_lock = threading.Lock()
 
     def _log_info(self, message):
         """Log info message using debug_logger if available, otherwise print"""
@@ -114,8 +118,20 @@ class ICSStorage:
             self._log_error(f"Error loading ICS file: {e}")
             return {}
 
-    def save_tasks(self, tasks):
+    def save_tasks(self, tasks, dates=None):
         """Save tasks to ICS file, converting from internal format"""
+        # Saves come from both the UI and the sync listener thread
+        with self._save_lock:
+            return self._write_tasks(tasks, dates)
+
+    def _write_tasks(self, tasks, dates):
+        """Write tasks to the ICS file - call with _save_lock held"""
+        # With dates given only those days are converted again - the VTODOs of
+        # every other day are reused from the previous save
+
+        # Atomic write: write to temp file first, then rename
+        temp_file = self.ics_file + ".tmp"
+        backup_file = self.ics_file + ".bak"
         try:
             # Create calendar
             cal = Calendar()
@@ -127,18 +143,35 @@ class ICSStorage:
             cal.add("x-wr-caldesc", "Task calendar for CaLAN")
 
             # Add all tasks as VTODO
+            if dates is None:
+                self._vtodo_cache = {}
+                dates = ()
+            for date_str in dates:
+                self._vtodo_cache.pop(date_str, None)
+            for date_str in list(self._vtodo_cache):
+                if date_str not in tasks:
+                    del self._vtodo_cache[date_str]
             for date_str, task_list in tasks.items():
-                for task in task_list:
-                    todo = self._task_to_vtodo(task, date_str)
-                    cal.add_component(todo)
+                if date_str not in self._vtodo_cache:
+                    self._vtodo_cache[date_str] = b"".join(
+                        self._task_to_vtodo(task, date_str).to_ical()
+                        for task in task_list
+                    )
 
-            # Atomic write: write to temp file first, then rename
-            temp_file = self.ics_file + ".tmp"
-            backup_file = self.ics_file + ".bak"
+            # Splice the VTODOs in before the calendar's closing line
+            calendar_head = cal.to_ical().rsplit(b"END:VCALENDAR", 1)[0]
+            ical_data = b"".join(
+                [calendar_head]
+                + [self._vtodo_cache[date_str] for date_str in tasks]
+                + [b"END:VCALENDAR\r\n"]
+            )
 
-            # Write to temporary file
+            # Write to temporary file, on disk before it replaces the original
+            # (saves run on a worker thread, so the fsync doesn't stall the UI)
             with open(temp_file, "wb") as f:
-                f.write(cal.to_ical())
+                f.write(ical_data)
+                f.flush()
+                os.fsync(f.fileno())
 
             # Create backup of original file if it exists
             if os.path.exists(self.ics_file):
@@ -3,13 +3,21 @@ Unicast synchronization with mDNS discovery for CaLAN calendar application
 Provides network synchronization between multiple instances with automatic peer discovery
 """
 
+import ctypes
+import ctypes.util
 import json
 import logging
+import os
+import queue
+import select
 import socket
+import struct
 import subprocess
+import sys
 import threading
 import time
 import uuid
+from dataclasses import dataclass
 
 import gi
 
@@ -23,15 +31,223 @@ gi.require_version("GLib", "2.0")
 from gi.repository import GLib
 
 try:
-    from zeroconf import ServiceInfo, ServiceListener, Zeroconf
+    from zeroconf import IPVersion, ServiceInfo, ServiceListener, Zeroconf
 
     ZEROCONF_AVAILABLE = True
 except ImportError:
     ZEROCONF_AVAILABLE = False
+    IPVersion = None
     ServiceInfo = None
     Zeroconf = None
     ServiceListener = None
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    msgpack = None
+
+
+def _json_dumps(obj):
+    """Serialize obj to UTF-8 JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    # Compact, non-escaped output so both encoders produce the same wire bytes
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode(
+        "utf-8"
+    )
+
+
+def _json_loads(data):
+    """Parse UTF-8 JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def _decode_message(data):
+    """Decode a datagram - JSON objects start with '{', anything else is msgpack"""
+    if data[:1] == b"{" or not MSGPACK_AVAILABLE:
+        return _json_loads(data)
+    return msgpack.unpackb(data, raw=False)
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.c_void_p),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+# sendmmsg() sends one datagram per peer in a single syscall (Linux only)
+try:
+    if not sys.platform.startswith("linux"):
+        raise OSError("sendmmsg is Linux only")
+    _libc_sendmmsg = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True).sendmmsg
+    _libc_sendmmsg.argtypes = [
+        ctypes.c_int,
+        ctypes.POINTER(_MMsgHdr),
+        ctypes.c_uint,
+        ctypes.c_int,
+    ]
+    _libc_sendmmsg.restype = ctypes.c_int
+
+    SENDMMSG_AVAILABLE = True
+except (OSError, AttributeError):
+    SENDMMSG_AVAILABLE = False
+    _libc_sendmmsg = None
+
+
+def _sockaddr_in(ip, port):
+    """Pack an IPv4 address into a struct sockaddr_in buffer (None if invalid)"""
+    try:
+        raw = struct.pack("=H", socket.AF_INET) + struct.pack("!H", port)
+        raw += socket.inet_aton(ip) + bytes(8)
+    except (OSError, TypeError, struct.error):
+        return None
+    return ctypes.create_string_buffer(raw, len(raw))
+
+
+def _sendmmsg(sock, data, names):
+    """Send one payload to prebuilt sockaddr buffers with one sendmmsg() call
+
+    Returns how many datagrams the kernel accepted, which may be fewer
+    than len(names) - the caller sends the rest individually.
+    """
+    count = len(names)
+    payload = ctypes.create_string_buffer(data, len(data))
+    iov = _IOVec(ctypes.addressof(payload), len(data))
+
+    msgs = (_MMsgHdr * count)()
+    for msg, name in zip(msgs, names):
+        msg.msg_hdr.msg_name = ctypes.addressof(name)
+        msg.msg_hdr.msg_namelen = len(name)
+        msg.msg_hdr.msg_iov = ctypes.addressof(iov)
+        msg.msg_hdr.msg_iovlen = 1
+
+    sent = _libc_sendmmsg(sock.fileno(), msgs, count, 0)
+    if sent < 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err))
+    return sent
+
+
+def _timestamp_key(value):
+    """Comparable offset-naive form of an ISO-8601 timestamp string"""
+    # Plain isoformat() output (YYYY-MM-DDTHH:MM:SS[.ffffff]) sorts as text
+    if len(value) in (19, 26) and value[10] == "T":
+        return value
+    # Anything else (UTC offsets, date-only) - parse and drop the offset
+    return datetime.fromisoformat(value).replace(tzinfo=None).isoformat()
+
+
+def _is_same_or_newer(task, other):
+    """Check whether task is at least as recent as other by updated_at"""
+    task_updated = task.get("updated_at")
+    other_updated = other.get("updated_at")
+    if not task_updated or not other_updated:
+        return True  # Nothing to compare - the later arrival wins
+    try:
+        return _timestamp_key(task_updated) >= _timestamp_key(other_updated)
+    except ValueError:
+        return True
+
+
+# Largest UDP datagram we accept, and the target size of bulk task batches
+# (kept under a typical 1500 byte MTU to avoid IP fragmentation)
+RECV_BUFFER_SIZE = 65535
+BULK_PAYLOAD_LIMIT = 1200
+# Positional layout of task rows in bulk_task_update messages (sent along
+# as "fields", so receivers never depend on a hardcoded order)
+SYNC_TASK_FIELDS = (
+    "id",
+    "date",
+    "description",
+    "status",
+    "time",
+    "color",
+    "profile_name",
+    "created_at",
+    "updated_at",
+    "alarm",
+    "alarm_time",
+    "acknowledged",
+)
+
+# Fields filled in on remote tasks that arrive without them
+REMOTE_TASK_DEFAULTS = {
+    "description": "No description",
+    "color": "#4CAF50",
+    "profile_name": "Unknown",
+    "alarm": False,
+    "alarm_time": None,
+    "acknowledged": False,
+}
+
+# Outgoing message queue bound, and how many queued messages the sender
+# thread drains per wakeup
+SEND_QUEUE_SIZE = 1024
+SEND_BATCH_SIZE = 32
+# Task update operations the sender may merge into bulk_task_update
+# ("move" needs old_date, which the bulk row layout doesn't carry)
+BULK_OPERATIONS = ("update", "delete")
+
+# Requested kernel send/receive buffer size (capped by net.core.*mem_max)
+SOCKET_BUFFER_SIZE = 1024 * 1024
+
+# Remote changes are applied to the UI at most once per frame (~60 Hz)
+UI_REFRESH_INTERVAL_MS = 16
+
+# Datagrams already waiting in the socket are handled together, up to this many
+RECV_DRAIN_LIMIT = 64
+
+
+@dataclass
+class Peer:
+    """A discovered CaLAN instance on the local network"""
+
+    # Declared by hand - dataclass(slots=True) needs Python 3.10+
+    __slots__ = ("ip", "port", "last_seen", "name", "msgpack", "bulk")
+
+    ip: str
+    port: int
+    last_seen: float  # time.monotonic()
+    name: str
+    msgpack: bool  # peer advertised msgpack support via mDNS
+    bulk: bool  # peer advertised bulk_task_update support via mDNS
+
+
+def _address_rank(ip):
+    """Sort key for peer addresses: 192.168.x.x first, loopback last"""
+    if ip.startswith("192.168."):
+        return 0
+    if ip.startswith("127."):
+        return 2
+    return 1
+
 
 class MulticastSync:
     def __init__(self, app):
@@ -46,26 +262,41 @@ class MulticastSync:
         self.running = False
         self.socket = None
         self.listener_thread = None
+        self.sender_thread = None
+        self._send_queue = queue.Queue(maxsize=SEND_QUEUE_SIZE)
         self.tasks_lock = threading.RLock()  # Lock for thread-safe task operations
 
         # mDNS discovery configuration
         self.service_port = 1900
         self.service_type = "_calan._udp.local."
-        self.instance_name = (
-            f"{self.app.settings.get('name', 'Unknown')}-{uuid.uuid4().hex[:8]}"
-        )
+        # Display name sent with every message (settings["name"] is fixed at startup)
+        self.sender_name = self.app.settings.get("name", "Unknown")
+        self.instance_name = f"{self.sender_name}-{uuid.uuid4().hex[:8]}"
 
         # Zeroconf
         self.zeroconf = None
         self.service_info = None
 
         # Peer management
-        self.peers = {}  # {instance_id: {"ip": ip, "port": port, "last_seen": timestamp, "name": name}}
+        self.peers = {}  # {instance_id: Peer}
         self.peers_lock = threading.RLock()
+        # Send targets derived from self.peers, rebuilt only when peers change
+        self._peer_targets = []  # [(name, (ip, port), sockaddr_in or None)]
+        self._msgpack_peer_ips = frozenset()
+        self._bulk_peer_ips = frozenset()
 
         # Sync statistics tracking
         self.sync_stats = {"sent": 0, "received": 0, "errors": 0, "error_dates": []}
 
+        # Cached encodings of self.app.tasks, invalidated whenever they change
+        self._tasks_serialized = {}  # {use_msgpack: bytes}
+
+        # Coalesced UI refresh state (filled from listener thread)
+        self._ui_refresh_lock = threading.Lock()
+        self._ui_refresh_pending = False
+        self._ui_refresh_dates = set()
+        self._ui_refresh_task_updates = {}  # {task_id: date_str}
+
         # Sync settings
         self.sync_interval = 30  # seconds
         self.last_sync = None
@@ -77,6 +308,48 @@ class MulticastSync:
         """Get the tasks lock for thread-safe operations from main thread"""
         return self.tasks_lock
 
+    def invalidate_tasks_cache(self):
+        """Drop the cached task serialization after local tasks changed"""
+        with self.tasks_lock:
+            self._tasks_serialized = {}
+
+    def _get_serialized_tasks(self, use_msgpack=False):
+        """Get encoded tasks, serializing only once per change"""
+        with self.tasks_lock:
+            data = self._tasks_serialized.get(use_msgpack)
+            if data is None:
+                data = self._encode_message(self.app.tasks, use_msgpack)
+                self._tasks_serialized[use_msgpack] = data
+            return data
+
+    def _build_sync_response(self, use_msgpack=False):
+        """Build a pre-serialized sync_response around the cached tasks"""
+        envelope = {
+            "type": "sync_response",
+            "sender": self.sender_name,
+            "instance": self.instance_name,
+            "timestamp": datetime.now().isoformat(),
+        }
+        if use_msgpack:
+            # Write the map header for one extra key, then append cached tasks
+            packer = msgpack.Packer(use_bin_type=True)
+            parts = [packer.pack_map_header(len(envelope) + 1)]
+            for key, value in envelope.items():
+                parts.append(packer.pack(key))
+                parts.append(packer.pack(value))
+            parts.append(packer.pack("tasks"))
+            parts.append(self._get_serialized_tasks(True))
+            return b"".join(parts)
+
+        header = _json_dumps(envelope)
+        # Splice the cached tasks JSON into the envelope instead of re-encoding
+        return (
+            header[:-1]
+            + b',"tasks":'
+            + self._get_serialized_tasks()
+            + b"}"
+        )
+
     def start_listening(self):
         """Start listening for unicast sync messages with mDNS discovery"""
         try:
@@ -86,6 +359,15 @@ class MulticastSync:
             )
             self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
 
+            # Larger kernel buffers so bulk sync bursts aren't dropped or refused
+            for option in (socket.SO_SNDBUF, socket.SO_RCVBUF):
+                try:
+                    self.socket.setsockopt(
+                        socket.SOL_SOCKET, option, SOCKET_BUFFER_SIZE
+                    )
+                except OSError as e:
+                    self.logger.debug(f"Could not resize socket buffer: {e}")
+
             # BUGFIX: Set socket timeout for clean shutdown
             self.socket.settimeout(1.0)  # 1 second timeout
 
@@ -100,6 +382,12 @@ class MulticastSync:
             )
             self.listener_thread.start()
 
+            # Start sender thread - UI callers only enqueue outgoing messages
+            self.sender_thread = threading.Thread(
+                target=self._sender_loop, daemon=True
+            )
+            self.sender_thread.start()
+
             # Start mDNS discovery with zeroconf
             self._start_zeroconf()
 
@@ -122,6 +410,15 @@ class MulticastSync:
         """Stop listening for unicast sync messages"""
         self.running = False
 
+        # Let the sender thread flush what is queued, then stop it
+        if self.sender_thread:
+            try:
+                self._send_queue.put(None, timeout=1.0)
+                self.sender_thread.join(timeout=2.0)
+            except queue.Full:
+                pass
+            self.sender_thread = None
+
         # Stop zeroconf
         self._stop_zeroconf()
 
@@ -172,20 +469,24 @@ class MulticastSync:
             return
 
         try:
-            self.zeroconf = Zeroconf()
-
-            # Register our own service with real network IP
             # Get real network IP address (not loopback)
             real_ip = self._get_real_ip()
 
+            # Bind mDNS to the LAN interface only - avoids flooding docker/VPN bridges
+            self.zeroconf = Zeroconf(interfaces=[real_ip], ip_version=IPVersion.V4Only)
+
+            # Register our own service with real network IP
+
             self.service_info = ServiceInfo(
                 self.service_type,
                 f"{self.instance_name}.{self.service_type}",
                 addresses=[socket.inet_aton(real_ip)],
                 port=self.service_port,
                 properties={
-                    "name": self.app.settings.get("name", "Unknown"),
+                    "name": self.sender_name,
                     "instance": self.instance_name,
+                    "codec": "msgpack" if MSGPACK_AVAILABLE else "json",
+                    "bulk": "1",
                 },
             )
 
@@ -233,30 +534,11 @@ class MulticastSync:
             if instance_name == self.instance_name:
                 return
 
-            # Get IP address - prefer 192.168.x.x addresses over others
-            ip = None
-            if info.addresses:
-                # First try to find a 192.168.x.x address
-                for address in info.addresses:
-                    candidate_ip = socket.inet_ntoa(address)
-                    if candidate_ip.startswith("192.168."):
-                        ip = candidate_ip
-                        self.logger.debug(f"Found preferred 192.168.x.x IP: {ip}")
-                        break
-
-                # If no 192.168.x.x found, try any non-loopback address
-                if ip is None:
-                    for address in info.addresses:
-                        candidate_ip = socket.inet_ntoa(address)
-                        if not candidate_ip.startswith("127."):
-                            ip = candidate_ip
-                            self.logger.debug(f"Found non-loopback IP: {ip}")
-                            break
-
-                # If still no good IP found, use the first address
-                if ip is None and info.addresses:
-                    ip = socket.inet_ntoa(info.addresses[0])
-                    self.logger.debug(f"Using first available IP: {ip}")
+            # Get IP address - prefer 192.168.x.x, then non-loopback, then first
+            ips = [socket.inet_ntoa(address) for address in (info.addresses or ())]
+            ip = min(ips, key=_address_rank, default=None)
+            if ip is not None:
+                self.logger.debug(f"Selected peer IP: {ip}")
             else:
                 ip = socket.gethostbyname(info.server)
                 self.logger.debug(f"Using hostname-resolved IP: {ip}")
@@ -280,14 +562,21 @@ class MulticastSync:
 
             port = info.port
             name = info.properties.get(b"name", b"Unknown").decode("utf-8")
+            # Older peers don't advertise a codec and only understand JSON
+            wants_msgpack = info.properties.get(b"codec") == b"msgpack"
+            # ...and take task updates one task_update message at a time
+            takes_bulk = info.properties.get(b"bulk") == b"1"
 
             with self.peers_lock:
-                self.peers[instance_name] = {
-                    "ip": ip,
-                    "port": port,
-                    "last_seen": datetime.now().isoformat(),
-                    "name": name,
-                }
+                self.peers[instance_name] = Peer(
+                    ip=ip,
+                    port=port,
+                    last_seen=time.monotonic(),
+                    name=name,
+                    msgpack=wants_msgpack,
+                    bulk=takes_bulk,
+                )
+                self._rebuild_peer_targets()
 
             self.logger.info(f"Discovered peer: {name} at {ip}:{port}")
 
@@ -300,39 +589,43 @@ class MulticastSync:
             instance_name = info.name.replace(f".{self.service_type}", "")
 
             with self.peers_lock:
-                if instance_name in self.peers:
-                    del self.peers[instance_name]
-                    self.logger.info(f"Peer removed: {instance_name}")
+                removed = self.peers.pop(instance_name, None) is not None
+                if removed:
+                    self._rebuild_peer_targets()
+
+            if removed:
+                self.logger.info(f"Peer removed: {instance_name}")
 
         except Exception as e:
             self.logger.error(f"Error removing service: {e}")
 
     def _cleanup_stale_peers(self):
         """Remove peers that haven't been seen in a while"""
-        cutoff_time = datetime.now().timestamp() - 120  # 2 minutes
+        cutoff_time = time.monotonic() - 120  # 2 minutes
 
         with self.peers_lock:
-            stale_peers = []
-            for instance, peer in self.peers.items():
-                try:
-                    last_seen = datetime.fromisoformat(peer["last_seen"]).timestamp()
-                    if last_seen < cutoff_time:
-                        stale_peers.append(instance)
-                except:
-                    stale_peers.append(instance)
-
-            for instance in stale_peers:
-                del self.peers[instance]
-                self.logger.info(f"Removed stale peer: {instance}")
+            # Rebuild in a single pass - last_seen is a monotonic float
+            before_count = len(self.peers)
+            self.peers = {
+                instance: peer
+                for instance, peer in self.peers.items()
+                if peer.last_seen >= cutoff_time
+            }
+            removed_count = before_count - len(self.peers)
+            if removed_count:
+                self._rebuild_peer_targets()
+
+        if removed_count:
+            self.logger.info(f"Removed {removed_count} stale peers")
 
     def _listener_loop(self):
         """Main listener loop for unicast messages"""
         self.logger.info("Unicast listener loop started")
         while self.running and self.socket:
             try:
-                data, address = self.socket.recvfrom(1024)
+                data, address = self.socket.recvfrom(RECV_BUFFER_SIZE)
                 self.logger.debug(f"Received {len(data)} bytes from {address}")
-                self._handle_message(data, address)
+                self._handle_datagrams(self._drain_socket([(data, address)]))
             except socket.timeout:
                 # BUGFIX: Timeout is normal - continue checking running flag
                 continue
@@ -345,57 +638,119 @@ class MulticastSync:
                 break
         self.logger.info("Unicast listener loop stopped")
 
-    def _handle_message(self, data, address):
-        """Handle incoming unicast message"""
-        try:
-            self.logger.info(
-                f"Received unicast message from {address}, size: {len(data)} bytes"
-            )
-
-            # BUGFIX: Proper JSON decode error handling with early return
+    def _drain_socket(self, batch):
+        """Append datagrams already queued on the socket to batch without blocking"""
+        # The socket has a timeout, so readiness is polled first - a plain
+        # recvfrom would wait out the timeout once the queue is empty
+        while len(batch) < RECV_DRAIN_LIMIT:
+            readable, _, _ = select.select([self.socket], [], [], 0)
+            if not readable:
+                break
+            batch.append(self.socket.recvfrom(RECV_BUFFER_SIZE))
+        return batch
+
+    def _handle_datagrams(self, batch):
+        """Handle a burst of datagrams, applying only the newest update per task"""
+        # Edit bursts from a peer arrive as a run of task_update messages for
+        # the same ids - only the newest state of each task matters. Any other
+        # message flushes the run first so ordering between them is kept
+        updates = {}  # task id -> (message, address)
+        for data, address in batch:
             try:
-                message = json.loads(data.decode("utf-8"))
-            except (json.JSONDecodeError, UnicodeDecodeError) as e:
-                self.logger.warning(f"Invalid message from {address}: {e}")
-                return  # Early return on invalid message
+                message = self._decode_datagram(data, address)
+                if message is None:
+                    continue
 
-            message_type = message.get("type")
+                task_update = message.get("task")
+                if (
+                    message.get("type") == "task_update"
+                    and message.get("operation", "update") == "update"
+                    and task_update
+                    and task_update.get("id")
+                ):
+                    # Datagrams can arrive out of order and two peers can edit
+                    # the same task - keep the update with the newest updated_at
+                    task_id = task_update["id"]
+                    previous = updates.get(task_id)
+                    if previous is None or _is_same_or_newer(
+                        task_update, previous[0]["task"]
+                    ):
+                        # Re-insert so the task keeps the position of this update
+                        updates.pop(task_id, None)
+                        updates[task_id] = (message, address)
+                    continue
 
-            self.logger.info(
-                f"Message received - Type: {message_type}, From: {address}"
-            )
-            if message_type == "task_update":
-                self.logger.debug(f"Task update details: {message}")
-
-            if message_type == "sync_request":
-                self._handle_sync_request(message, address)
-            elif message_type == "sync_response":
-                self._handle_sync_response(message, address)
-            elif message_type == "task_update":
-                self._handle_task_update(message, address)
-            elif message_type == "test_message":
-                self._handle_test_message(message, address)
-            elif message_type == "full_sync_request":
-                self._handle_full_sync_request(message)
-            else:
-                self.logger.warning(f"Unknown message type: {message_type}")
+                self._handle_update_run(updates)
+                updates = {}
+                self._dispatch_message(message, address)
+            except Exception as e:
+                self.logger.error(f"Error handling unicast message: {e}")
 
+        try:
+            self._handle_update_run(updates)
         except Exception as e:
             self.logger.error(f"Error handling unicast message: {e}")
 
+    def _handle_update_run(self, updates):
+        """Apply a run of coalesced task_update messages"""
+        if len(updates) == 1:
+            message, address = next(iter(updates.values()))
+            self._handle_task_update(message, address)
+        elif updates:
+            self.logger.info(f"Applying {len(updates)} coalesced task updates")
+            self._apply_task_update_batch(
+                [message["task"] for message, _ in updates.values()], "update"
+            )
+
+    def _decode_datagram(self, data, address):
+        """Decode a datagram, returning None for invalid messages and our own echoes"""
+        self.logger.info(
+            f"Received unicast message from {address}, size: {len(data)} bytes"
+        )
+
+        # BUGFIX: Proper decode error handling with early return
+        try:
+            message = _decode_message(data)
+        except ValueError as e:
+            self.logger.warning(f"Invalid message from {address}: {e}")
+            return None  # Early return on invalid message
+
+        # Drop our own echoes before any dispatch, merge or UI work
+        if message.get("instance") == self.instance_name:
+            return None
+        return message
+
+    def _dispatch_message(self, message, address):
+        """Route a decoded message to its handler"""
+        message_type = message.get("type")
+
+        self.logger.info(f"Message received - Type: {message_type}, From: {address}")
+        if message_type == "task_update":
+            self.logger.debug(f"Task update details: {message}")
+
+        if message_type == "sync_request":
+            self._handle_sync_request(message, address)
+        elif message_type == "sync_response":
+            self._handle_sync_response(message, address)
+        elif message_type == "task_update":
+            self._handle_task_update(message, address)
+        elif message_type == "bulk_task_update":
+            self._handle_bulk_task_update(message, address)
+        elif message_type == "test_message":
+            self._handle_test_message(message, address)
+        elif message_type == "full_sync_request":
+            self._handle_full_sync_request(message)
+        else:
+            self.logger.warning(f"Unknown message type: {message_type}")
+
     def _handle_sync_request(self, message, address):
         """Handle sync request from another instance"""
         self.logger.info(f"Sync request received from {address}")
 
         # Send our current tasks as response
-        response = {
-            "type": "sync_response",
-            "sender": self.app.settings.get("name", "Unknown"),
-            "timestamp": datetime.now().isoformat(),
-            "tasks": self.app.tasks,
-        }
-
-        self._send_message(response, address)
+        self._send_message(
+            self._build_sync_response(self._peer_wants_msgpack(address)), address
+        )
 
     def _handle_sync_response(self, message, address):
         """Handle sync response from another instance"""
@@ -421,9 +776,7 @@ class MulticastSync:
 
             # Track received sync operations (only from other senders)
             sender = message.get("sender")
-            if operation == "full_sync" and sender != self.app.settings.get(
-                "name", "Unknown"
-            ):
+            if operation == "full_sync" and sender != self.sender_name:
                 self.sync_stats["received"] = self.sync_stats.get("received", 0) + 1
 
             # For full_sync operations, use full merge logic
@@ -437,6 +790,60 @@ class MulticastSync:
                 # Pass the operation to _apply_task_update for normal operations
                 self._apply_task_update(task_update, operation)
 
+    def _handle_bulk_task_update(self, message, address):
+        """Handle a batch of task updates from another instance"""
+        tasks = self._expand_task_data(
+            message.get("fields", ()), message.get("rows", [])
+        )
+        deleted = message.get("deleted", [])  # [[task_id, date_str], ...]
+        operation = message.get("operation", "update")
+        if not tasks and not deleted:
+            return
+
+        self.logger.info(
+            f"Bulk task update received from {message.get('sender', 'Unknown')} - "
+            f"Operation: {operation}, Tasks: {len(tasks)}, Deleted: {len(deleted)}"
+        )
+
+        if operation == "full_sync":
+            self.sync_stats["received"] = (
+                self.sync_stats.get("received", 0) + len(tasks) + len(deleted)
+            )
+
+            # Merge the whole batch at once - one lock, one save, one UI refresh
+            remote_tasks = {}
+            for task_update in tasks:
+                date_str = task_update.get("date")
+                if date_str:
+                    remote_tasks.setdefault(date_str, []).append(task_update)
+            self._full_merge_tasks(
+                remote_tasks, deleted_ids=[task_id for task_id, _ in deleted]
+            )
+        else:
+            self._apply_task_update_batch(tasks, operation, deleted)
+
+    def _apply_task_update_batch(self, tasks, operation, deleted=()):
+        """Apply several task updates with one save and one UI refresh"""
+        # Hold the lock for the whole batch so cached indexes stay valid
+        index_cache = {}
+        pending = {}
+        with self.tasks_lock:
+            for task_update in tasks:
+                self._apply_task_update(task_update, operation, index_cache, pending)
+            for task_id, date_str in deleted:
+                self._apply_task_update(
+                    {"id": task_id, "date": date_str},
+                    "delete",
+                    index_cache,
+                    pending,
+                )
+
+        # One save and one UI refresh for the whole batch
+        if pending.get("save"):
+            self.app.save_tasks()
+        if pending.get("dates"):
+            self._schedule_ui_refresh(pending["dates"], pending.get("task_updates"))
+
     def _merge_tasks(self, remote_tasks):
         """Merge tasks from remote instance with local tasks - preserve local changes"""
         try:
@@ -487,24 +894,9 @@ class MulticastSync:
                                     # If remote task is newer, update local task
                                     if remote_updated and local_updated:
                                         try:
-                                            remote_time = datetime.fromisoformat(
+                                            if _timestamp_key(
                                                 remote_updated
-                                            )
-                                            local_time = datetime.fromisoformat(
-                                                local_updated
-                                            )
-
-                                            # Make both datetimes offset-naive for comparison
-                                            if remote_time.tzinfo is not None:
-                                                remote_time = remote_time.replace(
-                                                    tzinfo=None
-                                                )
-                                            if local_time.tzinfo is not None:
-                                                local_time = local_time.replace(
-                                                    tzinfo=None
-                                                )
-
-                                            if remote_time > local_time:
+                                            ) > _timestamp_key(local_updated):
                                                 # Update local task with remote changes
                                                 for key, value in remote_task.items():
                                                     if (
@@ -531,32 +923,15 @@ class MulticastSync:
                                         local_task["needs_attention"] = True
                                         merged = True
 
+                if merged:
+                    self.invalidate_tasks_cache()
+
             # BUGFIX: Move save_tasks outside the lock to prevent deadlocks
             if merged:
                 self.app.save_tasks()
 
-                # Use idle_add to update UI from main thread safely
-                def safe_update_ui():
-                    try:
-                        if self.app.view_mode == "calendar":
-                            self.app.update_calendar()
-                        elif (
-                            self.app.view_mode == "tasks"
-                            and self.app.selected_date
-                            and self.app.selected_date.isoformat() == date_str
-                        ):
-                            # If we're in task view for the same date, update the task list
-                            self.app._show_task_list()
-                        # Update tray badge from main thread
-                        self.app.update_tray_icon_badge()
-
-                        # Start tray blinking if app is minimized and new tasks were added
-                        if not self.app.get_property("visible"):
-                            self.app.start_tray_blinking()
-                    except Exception as e:
-                        self.logger.error(f"Error updating UI from main thread: {e}")
-
-                GLib.idle_add(safe_update_ui)
+                # Coalesce UI updates from main thread
+                self._schedule_ui_refresh(remote_tasks.keys())
 
         except Exception as e:
             self.logger.error(f"Error in _merge_tasks: {e}")
@@ -567,9 +942,34 @@ class MulticastSync:
                 if error_date not in self.sync_stats["error_dates"]:
                     self.sync_stats["error_dates"].append(error_date)
 
-    def _apply_task_update(self, task_update, operation="update"):
-        """Apply a single task update from remote instance - FIXED RACE CONDITIONS"""
+    def _find_task_index(self, date_str, task_id, index_cache=None):
+        """Find the position of a task in self.app.tasks[date_str]"""
+        if index_cache is None:
+            for i, task in enumerate(self.app.tasks.get(date_str, ())):
+                if task.get("id") == task_id:
+                    return i
+            return None
+
+        # Batched updates build an id -> index map once per date
+        date_index = index_cache.get(date_str)
+        if date_index is None:
+            date_index = index_cache[date_str] = {
+                task.get("id"): i
+                for i, task in enumerate(self.app.tasks.get(date_str, ()))
+            }
+        return date_index.get(task_id)
+
+    def _apply_task_update(
+        self, task_update, operation="update", index_cache=None, pending=None
+    ):
+        """Apply a single task update from remote instance - FIXED RACE CONDITIONS
+
+        Batch callers pass index_cache (held under tasks_lock for the whole
+        batch) and a pending dict that collects the save and UI refresh.
+        """
         needs_save = False
+        needs_ui_update = False
+        task_id = None
         date_str = None
         old_date_str = None
 
@@ -590,28 +990,28 @@ class MulticastSync:
                     )
                     return
 
-                needs_ui_update = False
-
                 if operation == "delete":
                     self.logger.debug(
                         f"DELETE RECEIVED: Task ID: {task_id}, Date: {date_str}"
                     )
                     # Remove task only if it exists
                     if date_str in self.app.tasks:
-                        before_count = len(self.app.tasks[date_str])
-                        # Check if task exists before trying to delete
-                        task_exists = any(
-                            task.get("id") == task_id
-                            for task in self.app.tasks[date_str]
+                        date_tasks = self.app.tasks[date_str]
+                        before_count = len(date_tasks)
+
+                        # Find and pop the task in place instead of rebuilding the list
+                        delete_index = self._find_task_index(
+                            date_str, task_id, index_cache
                         )
+                        task_exists = delete_index is not None
+                        if task_exists:
+                            date_tasks.pop(delete_index)
+                            if index_cache is not None:
+                                # Later positions shifted - rebuild on next lookup
+                                index_cache.pop(date_str, None)
 
                         if task_exists:
-                            self.app.tasks[date_str] = [
-                                task
-                                for task in self.app.tasks[date_str]
-                                if task.get("id") != task_id
-                            ]
-                            after_count = len(self.app.tasks[date_str])
+                            after_count = len(date_tasks)
                             self.logger.debug(
                                 f"DELETE PROCESSED: Tasks before: {before_count}, after: {after_count}"
                             )
@@ -644,36 +1044,28 @@ class MulticastSync:
                         )
                         return
 
-                    # Create copies to work with
-                    old_tasks = self.app.tasks.get(old_date_str, [])[:]
-                    new_tasks = self.app.tasks.get(date_str, [])[:]
-
-                    # Find and remove task from old date
-                    task_to_move = None
-                    old_tasks_updated = []
-                    for task in old_tasks:
-                        if task.get("id") == task_id:
-                            task_to_move = task
-                        else:
-                            old_tasks_updated.append(task)
+                    # Find the task in the old date (both mutations happen under the lock)
+                    old_tasks = self.app.tasks[old_date_str]
+                    move_index = self._find_task_index(
+                        old_date_str, task_id, index_cache
+                    )
 
-                    if task_to_move:
-                        # Update task with new date and timestamp
-                        task_to_move = task_to_move.copy()
+                    if move_index is not None:
+                        # Pop in place and update task with new timestamp
+                        task_to_move = old_tasks.pop(move_index).copy()
+                        if index_cache is not None:
+                            index_cache.pop(old_date_str, None)
+                            index_cache.pop(date_str, None)
                         task_to_move["updated_at"] = datetime.now().isoformat()
                         # Mark as needing attention (moved from remote)
                         task_to_move["needs_attention"] = True
 
-                        # Add to new date
-                        new_tasks.append(task_to_move)
-
-                        # Update both date entries atomically
-                        if old_tasks_updated:
-                            self.app.tasks[old_date_str] = old_tasks_updated
-                        elif old_date_str in self.app.tasks:
+                        # Remove empty source date
+                        if not old_tasks:
                             del self.app.tasks[old_date_str]
 
-                        self.app.tasks[date_str] = new_tasks
+                        # Add to new date
+                        self.app.tasks.setdefault(date_str, []).append(task_to_move)
                         needs_ui_update = True
                         needs_save = True
 
@@ -690,11 +1082,9 @@ class MulticastSync:
                         self.app.tasks[date_str] = []
 
                     # Find existing task or add new one
-                    existing_index = None
-                    for i, task in enumerate(self.app.tasks[date_str]):
-                        if task.get("id") == task_id:
-                            existing_index = i
-                            break
+                    existing_index = self._find_task_index(
+                        date_str, task_id, index_cache
+                    )
 
                     if existing_index is not None:
                         # For normal updates, check timestamp to avoid overwriting newer changes
@@ -706,16 +1096,9 @@ class MulticastSync:
 
                             if remote_updated and local_updated:
                                 try:
-                                    remote_time = datetime.fromisoformat(remote_updated)
-                                    local_time = datetime.fromisoformat(local_updated)
-
-                                    # Make both datetimes offset-naive for comparison
-                                    if remote_time.tzinfo is not None:
-                                        remote_time = remote_time.replace(tzinfo=None)
-                                    if local_time.tzinfo is not None:
-                                        local_time = local_time.replace(tzinfo=None)
-
-                                    if remote_time <= local_time:
+                                    if _timestamp_key(remote_updated) <= _timestamp_key(
+                                        local_updated
+                                    ):
                                         # Skip update if remote is not newer
                                         self.logger.debug(
                                             f"Skip update - local task is newer or same: {task_id}"
@@ -736,6 +1119,10 @@ class MulticastSync:
                         # Mark as needing attention (new task from remote)
                         cleaned_task["needs_attention"] = True
                         self.app.tasks[date_str].append(cleaned_task)
+                        if index_cache is not None and date_str in index_cache:
+                            index_cache[date_str][task_id] = (
+                                len(self.app.tasks[date_str]) - 1
+                            )
 
                     needs_ui_update = True
                     needs_save = True
@@ -744,80 +1131,200 @@ class MulticastSync:
                 self.logger.error(f"Error in _apply_task_update: {e}")
                 self.sync_stats["errors"] = self.sync_stats.get("errors", 0) + 1
 
+            if needs_save:
+                self.invalidate_tasks_cache()
+
+        # Refresh either the old or new date for moves
+        dates = [date_str, old_date_str] if operation == "move" else [date_str]
+        task_updates = {task_id: date_str} if operation != "delete" else None
+
+        if pending is not None:
+            # Batch caller saves and refreshes once for the whole batch
+            pending["save"] = pending.get("save", False) or needs_save
+            if needs_ui_update:
+                pending.setdefault("dates", set()).update(dates)
+                pending.setdefault("task_updates", {}).update(task_updates or {})
+            return
+
         # FIXED: Save tasks outside the lock to prevent deadlocks
         if needs_save:
             self.app.save_tasks()
 
         # UI updates can happen outside the lock
         if needs_ui_update:
+            self._schedule_ui_refresh(dates, task_updates)
 
-            def safe_update_ui():
-                try:
-                    if self.app.view_mode == "calendar":
-                        self.app.update_calendar()
-                    elif (
-                        self.app.view_mode == "tasks"
-                        and self.app.selected_date
-                        and (
-                            self.app.selected_date.isoformat() == date_str
-                            or (
-                                operation == "move"
-                                and self.app.selected_date.isoformat() == old_date_str
-                            )
-                        )
-                    ):
-                        # If we're in task view for either the old or new date, update the task list
+    def _schedule_ui_refresh(self, dates=(), task_updates=None):
+        """Schedule one consolidated UI refresh for a burst of remote changes"""
+        with self._ui_refresh_lock:
+            self._ui_refresh_dates.update(dates)
+            if task_updates:
+                self._ui_refresh_task_updates.update(task_updates)
+
+            # A refresh is already queued - it will pick up these changes
+            if self._ui_refresh_pending:
+                return
+            self._ui_refresh_pending = True
+
+        # Waiting out the rest of the frame lets a burst of datagrams land in
+        # one refresh instead of one per main loop idle
+        GLib.timeout_add(UI_REFRESH_INTERVAL_MS, self._do_ui_refresh)
+
+    def _do_ui_refresh(self):
+        """Apply all queued remote changes to the UI from main thread"""
+        with self._ui_refresh_lock:
+            self._ui_refresh_pending = False
+            dates = self._ui_refresh_dates
+            task_updates = self._ui_refresh_task_updates
+            self._ui_refresh_dates = set()
+            self._ui_refresh_task_updates = {}
+
+        try:
+            if self.app.view_mode == "calendar":
+                self.app.update_calendar()
+            elif self.app.view_mode == "tasks" and self.app.selected_date:
+                selected_str = self.app.selected_date.isoformat()
+                if selected_str in dates:
+                    # If we're in task view for a changed date, update the task list
+                    # Row redraws are issued once after the whole burst
+                    with self.app._batch_ui_updates():
                         self.app._show_task_list()
-                        if operation != "delete":
-                            self.app._update_task_ui(task_id, date_str)
-                    # Update tray badge from main thread
-                    self.app.update_tray_icon_badge()
+                        for task_id, date_str in task_updates.items():
+                            if date_str == selected_str:
+                                self.app._update_task_ui(task_id, date_str)
 
-                    # Start tray blinking if app is minimized and new tasks were added
-                    if not self.app.get_property("visible"):
-                        self.app.start_tray_blinking()
-                except Exception as e:
-                    self.logger.error(f"Error updating UI from main thread: {e}")
+            # Update tray badge from main thread
+            self.app.update_tray_icon_badge()
 
-            GLib.idle_add(safe_update_ui)
+            # Start tray blinking if app is minimized and new tasks were added
+            if not self.app.get_property("visible"):
+                self.app.start_tray_blinking()
+        except Exception as e:
+            self.logger.error(f"Error updating UI from main thread: {e}")
+
+        return False
+
+    def _encode_message(self, message, use_msgpack=False):
+        """Serialize a message for the wire (pre-serialized bytes pass through)"""
+        if isinstance(message, bytes):
+            return message
+        if use_msgpack:
+            return msgpack.packb(message, use_bin_type=True)
+        return _json_dumps(message)
+
+    def _rebuild_peer_targets(self):
+        """Refresh cached send targets - call with peers_lock held"""
+        # Swap in new objects so senders can read them without the lock
+        # sockaddr_in buffers are packed once here instead of on every send
+        self._peer_targets = [
+            (
+                peer.name,
+                (peer.ip, peer.port),
+                _sockaddr_in(peer.ip, peer.port) if SENDMMSG_AVAILABLE else None,
+            )
+            for peer in self.peers.values()
+        ]
+        self._msgpack_peer_ips = frozenset(
+            peer.ip for peer in self.peers.values() if peer.msgpack
+        )
+        self._bulk_peer_ips = frozenset(
+            peer.ip for peer in self.peers.values() if peer.bulk
+        )
 
-    def _send_message(self, message, address=None):
-        """Send unicast message to all discovered peers"""
+    def _peer_wants_msgpack(self, address):
+        """Check whether the peer at address advertised msgpack support"""
+        return MSGPACK_AVAILABLE and address[0] in self._msgpack_peer_ips
+
+    def _send_message(self, message, address=None, targets=None):
+        """Send unicast message to all discovered peers (or the given targets)"""
         try:
             if not self.socket:
                 return
 
-            data = json.dumps(message).encode("utf-8")
-
             if address:
                 # Send to specific address (unicast response)
+                data = self._encode_message(
+                    message, self._peer_wants_msgpack(address)
+                )
                 self.socket.sendto(data, address)
             else:
-                # Send to all discovered peers via unicast
-                with self.peers_lock:
-                    if not self.peers:
-                        self.logger.debug("No peers discovered yet")
-                        return
+                # Cached targets are replaced, never mutated - no lock needed
+                if targets is None:
+                    targets = self._peer_targets
+                msgpack_ips = self._msgpack_peer_ips
 
-                    sent_count = 0
-                    for instance, peer in self.peers.items():
-                        try:
-                            peer_address = (peer["ip"], peer["port"])
-                            self.socket.sendto(data, peer_address)
-                            sent_count += 1
-                            self.logger.debug(
-                                f"Sent to peer {peer['name']} at {peer_address}"
-                            )
-                        except Exception as e:
-                            self.logger.warning(
-                                f"Failed to send to peer {peer['name']}: {e}"
-                            )
+                if not targets:
+                    self.logger.debug("No peers discovered yet")
+                    return
 
-                    self.logger.debug(f"Sent message to {sent_count} peers")
+                # Peers that don't advertise bulk support get the batch as
+                # one plain task_update message per task
+                if (
+                    isinstance(message, dict)
+                    and message.get("type") == "bulk_task_update"
+                ):
+                    bulk_ips = self._bulk_peer_ips
+                    legacy = [t for t in targets if t[1][0] not in bulk_ips]
+                    if legacy:
+                        for task_message in self._split_bulk_message(message):
+                            self._send_message(task_message, targets=legacy)
+                        targets = [t for t in targets if t[1][0] in bulk_ips]
+                        if not targets:
+                            return
+
+                # Group peers by wire format - pre-serialized bytes are JSON,
+                # which every peer understands
+                if (
+                    not MSGPACK_AVAILABLE
+                    or not msgpack_ips
+                    or isinstance(message, bytes)
+                ):
+                    groups = {False: targets}
+                else:
+                    groups = {False: [], True: []}
+                    for target in targets:
+                        groups[target[1][0] in msgpack_ips].append(target)
+
+                sent_count = 0
+                for use_msgpack, group in groups.items():
+                    if group:
+                        data = self._encode_message(message, use_msgpack)
+                        sent_count += self._send_to_peers(data, group)
+
+                self.logger.debug(f"Sent message to {sent_count} peers")
 
         except Exception as e:
             self.logger.error(f"Error sending unicast message: {e}")
 
+    def _send_to_peers(self, data, targets):
+        """Send the same serialized payload to (name, address, sockaddr) targets"""
+        sent_count = 0
+        sockaddrs = [sockaddr for _, _, sockaddr in targets]
+        if (
+            SENDMMSG_AVAILABLE
+            and len(targets) > 1
+            and all(sockaddr is not None for sockaddr in sockaddrs)
+        ):
+            try:
+                sent_count = _sendmmsg(self.socket, data, sockaddrs)
+            except OSError as e:
+                self.logger.debug(f"sendmmsg failed, using sendto: {e}")
+
+        # Fall back to one sendto per peer for anything not yet sent
+        sendto = self.socket.sendto
+        log_debug = self.logger.isEnabledFor(logging.DEBUG)
+        for name, peer_address, _ in targets[sent_count:]:
+            try:
+                sendto(data, peer_address)
+            except OSError as e:
+                self.logger.warning(f"Failed to send to peer {name}: {e}")
+                continue
+            sent_count += 1
+            if log_debug:
+                self.logger.debug(f"Sent to peer {name} at {peer_address}")
+
+        return sent_count
+
     def manual_sync(self):
         """Trigger manual synchronization with other instances"""
         self.logger.info("Manual sync triggered")
@@ -825,22 +1332,16 @@ class MulticastSync:
         # Send sync request to all peers
         request = {
             "type": "sync_request",
-            "sender": self.app.settings.get("name", "Unknown"),
+            "sender": self.sender_name,
+            "instance": self.instance_name,
             "timestamp": datetime.now().isoformat(),
         }
 
-        self._send_message(request)
+        self._queue_message(request)
 
         # Also immediately send our current tasks as a sync response
         # This ensures other instances get our data even if they don't respond
-        response = {
-            "type": "sync_response",
-            "sender": self.app.settings.get("name", "Unknown"),
-            "timestamp": datetime.now().isoformat(),
-            "tasks": self.app.tasks,
-        }
-
-        self._send_message(response)
+        self._queue_message(self._build_sync_response())
 
         # Re-enable sync button after a delay
         def enable_sync_button():
@@ -850,7 +1351,7 @@ class MulticastSync:
         GLib.timeout_add_seconds(3, enable_sync_button)
 
     def full_sync(self):
-        """Trigger full synchronization by sending each task individually"""
+        """Trigger full synchronization by sending all tasks in bulk batches"""
         self.logger.info("Full sync triggered")
 
         # Reset sync statistics
@@ -859,24 +1360,16 @@ class MulticastSync:
         # Mark this as user-initiated sync for UI feedback
         self._is_user_initiated_sync = True
 
-        # Get all tasks including metadata from ICS storage
-        all_tasks = self.app.ics_storage.get_all_tasks_with_metadata()
-
-        # Send each task individually as a task_update
-        task_count = 0
-        for date_str, task_list in all_tasks.items():
-            for task in task_list:
-                # Add date to task for proper handling
-                task_with_date = task.copy()
-                task_with_date["date"] = date_str
+        # Send the in-memory tasks - calendar.ics lags behind pending saves
+        tasks_with_date = self._local_tasks_with_date()
 
-                # Send as individual task update
-                self.broadcast_task_update(task_with_date, operation="full_sync")
-                task_count += 1
+        # Send in MTU-sized batches instead of one datagram per task
+        self.broadcast_bulk_task_updates(tasks_with_date, operation="full_sync")
+        task_count = len(tasks_with_date)
 
         self.sync_stats["sent"] = task_count
         self.logger.info(
-            f"Full sync: sent {task_count} individual tasks to {len(self.peers)} peers"
+            f"Full sync: sent {task_count} tasks to {len(self.peers)} peers"
         )
 
         # Show sync success feedback with statistics
@@ -888,19 +1381,12 @@ class MulticastSync:
             f"Received full sync request from {message.get('sender', 'Unknown')}"
         )
 
-        # Get all our tasks and send them back individually
-        all_tasks = self.app.ics_storage.get_all_tasks_with_metadata()
+        # Get all our tasks and send them back in bulk batches
+        tasks_with_date = self._local_tasks_with_date()
 
-        task_count = 0
-        for date_str, task_list in all_tasks.items():
-            for task in task_list:
-                # Add date to task for proper handling
-                task_with_date = task.copy()
-                task_with_date["date"] = date_str
-
-                # Send as individual task update
-                self.broadcast_task_update(task_with_date, operation="full_sync")
-                task_count += 1
+        # Send in MTU-sized batches instead of one datagram per task
+        self.broadcast_bulk_task_updates(tasks_with_date, operation="full_sync")
+        task_count = len(tasks_with_date)
 
         self.sync_stats["sent"] = task_count
         self.logger.info(
@@ -911,7 +1397,16 @@ class MulticastSync:
         # Clear the user-initiated flag for responses
         self._is_user_initiated_sync = False
 
-    def _full_merge_tasks(self, remote_tasks):
+    def _local_tasks_with_date(self):
+        """Copy every in-memory task with its date added, for a full sync"""
+        with self.tasks_lock:
+            return [
+                {**task, "date": date_str}
+                for date_str, task_list in self.app.tasks.items()
+                for task in task_list
+            ]
+
+    def _full_merge_tasks(self, remote_tasks, deleted_ids=()):
         """Full merge of tasks from remote instance - complete synchronization"""
         try:
             needs_save = False
@@ -922,119 +1417,102 @@ class MulticastSync:
                 updated_count = 0
                 added_count = 0
 
-                # Get all local tasks with metadata
-                local_tasks = self.app.ics_storage.get_all_tasks_with_metadata()
-
-                # Create a map of all remote tasks by ID for easy lookup
-                remote_task_map = {}
-                for date_str, remote_task_list in remote_tasks.items():
-                    for remote_task in remote_task_list:
-                        task_id = remote_task.get("id")
-                        if task_id:
-                            remote_task_map[task_id] = {
-                                "task": remote_task,
-                                "date": date_str,
-                            }
-
-                # Create a map of all local tasks by ID
-                local_task_map = {}
-                for date_str, local_task_list in local_tasks.items():
-                    for local_task in local_task_list:
-                        task_id = local_task.get("id")
-                        if task_id:
-                            local_task_map[task_id] = {
-                                "task": local_task,
-                                "date": date_str,
-                            }
-
-                # Process all remote tasks
-                for task_id, remote_data in remote_task_map.items():
-                    remote_task = remote_data["task"]
-                    remote_date = remote_data["date"]
-
-                    if task_id in local_task_map:
-                        # Task exists locally - check if it's deleted or updated
-                        local_data = local_task_map[task_id]
-                        local_task = local_data["task"]
-
-                        # Check if remote task is deleted
-                        if (
-                            remote_task.get("status") == "DELETED"
-                            and local_task.get("status") != "DELETED"
-                        ):
-                            # Mark local task as deleted
-                            local_task["status"] = "DELETED"
-                            deleted_count += 1
-                            merged = True
-                            needs_save = True
-
-                        # Check if remote task is newer
-                        else:
-                            remote_updated = remote_task.get("updated_at")
-                            local_updated = local_task.get("updated_at")
+                # Merge into the in-memory tasks - calendar.ics lags behind
+                # pending background saves, and changes there would be lost
+                local_tasks = self.app.tasks
+                now_iso = datetime.now().isoformat()
+
+                # Map all remote and local tasks by ID: {task_id: (date_str, task)}
+                remote_task_map = {
+                    task["id"]: (date_str, task)
+                    for date_str, task_list in remote_tasks.items()
+                    for task in task_list
+                    if task.get("id")
+                }
+                local_task_map = {
+                    task["id"]: (date_str, task)
+                    for date_str, task_list in local_tasks.items()
+                    for task in task_list
+                    if task.get("id")
+                }
 
-                            if remote_updated and local_updated:
-                                try:
-                                    remote_time = datetime.fromisoformat(remote_updated)
-                                    local_time = datetime.fromisoformat(local_updated)
+                # Apply compact tombstones first - no fields to compare
+                for task_id in deleted_ids:
+                    local_entry = local_task_map.get(task_id)
+                    if local_entry and local_entry[1].get("status") != "DELETED":
+                        local_entry[1]["status"] = "DELETED"
+                        deleted_count += 1
+                        merged = True
+                        needs_save = True
 
-                                    # Make both datetimes offset-naive for comparison
-                                    if remote_time.tzinfo is not None:
-                                        remote_time = remote_time.replace(tzinfo=None)
-                                    if local_time.tzinfo is not None:
-                                        local_time = local_time.replace(tzinfo=None)
+                # Tasks that exist on both sides - check if deleted or updated
+                for task_id in remote_task_map.keys() & local_task_map.keys():
+                    remote_task = remote_task_map[task_id][1]
+                    local_task = local_task_map[task_id][1]
 
-                                    if remote_time > local_time:
-                                        # Update local task with remote changes
-                                        for key, value in remote_task.items():
-                                            if key != "id":  # Don't change the ID
-                                                local_task[key] = value
-                                        # Mark as needing attention (updated from remote)
-                                        local_task["needs_attention"] = True
-                                        updated_count += 1
-                                        merged = True
-                                        needs_save = True
-                                except ValueError:
-                                    # If timestamp parsing fails, skip update
-                                    pass
+                    # Check if remote task is deleted
+                    if (
+                        remote_task.get("status") == "DELETED"
+                        and local_task.get("status") != "DELETED"
+                    ):
+                        # Mark local task as deleted
+                        local_task["status"] = "DELETED"
+                        deleted_count += 1
+                        merged = True
+                        needs_save = True
 
+                    # Check if remote task is newer
                     else:
-                        # Task doesn't exist locally - add it
-                        if remote_task.get("status") != "DELETED":
-                            if remote_date not in self.app.tasks:
-                                self.app.tasks[remote_date] = []
-
-                            # Ensure task has all required fields
-                            cleaned_task = self._clean_remote_task(remote_task)
-                            # Mark as needing attention (new task from remote)
-                            cleaned_task["needs_attention"] = True
-                            self.app.tasks[remote_date].append(cleaned_task)
-                            added_count += 1
-                            merged = True
-                            needs_save = True
+                        remote_updated = remote_task.get("updated_at")
+                        local_updated = local_task.get("updated_at")
+
+                        if remote_updated and local_updated:
+                            try:
+                                if _timestamp_key(remote_updated) > _timestamp_key(
+                                    local_updated
+                                ):
+                                    # Update local task with remote changes
+                                    for key, value in remote_task.items():
+                                        if key != "id":  # Don't change the ID
+                                            local_task[key] = value
+                                    # Mark as needing attention (updated from remote)
+                                    local_task["needs_attention"] = True
+                                    updated_count += 1
+                                    merged = True
+                                    needs_save = True
+                            except ValueError:
+                                # If timestamp parsing fails, skip update
+                                pass
+
+                # Tasks that don't exist locally - add them (keeping remote order)
+                new_tasks = [
+                    entry
+                    for task_id, entry in remote_task_map.items()
+                    if task_id not in local_task_map
+                ]
+                for remote_date, remote_task in new_tasks:
+                    if remote_task.get("status") != "DELETED":
+                        # Ensure task has all required fields
+                        cleaned_task = self._clean_remote_task(remote_task, now_iso)
+                        # Mark as needing attention (new task from remote)
+                        cleaned_task["needs_attention"] = True
+                        self.app.tasks.setdefault(remote_date, []).append(cleaned_task)
+                        added_count += 1
+                        merged = True
+                        needs_save = True
 
                 # Also check for tasks that exist locally but not in remote (should remain unchanged)
 
+                if needs_save:
+                    self.invalidate_tasks_cache()
+
             # BUGFIX: Save outside the lock
             if needs_save:
                 self.app.save_tasks()
 
-                # Use idle_add to update UI from main thread safely
-                def safe_update_ui():
-                    try:
-                        if self.app.view_mode == "calendar":
-                            self.app.update_calendar()
-                        # Update tray badge from main thread
-                        self.app.update_tray_icon_badge()
-
-                        # Start tray blinking if app is minimized and new tasks were added
-                        if not self.app.get_property("visible"):
-                            self.app.start_tray_blinking()
-                    except Exception as e:
-                        self.logger.error(f"Error updating UI from main thread: {e}")
-                    return False
-
-                GLib.idle_add(safe_update_ui)
+                # Coalesce UI updates from main thread - the refresh for a whole
+                # full sync burst also covers an open task list for these dates
+                self._schedule_ui_refresh(remote_tasks.keys())
 
                 self.logger.info(
                     f"Full sync completed: {added_count} added, {updated_count} updated, {deleted_count} marked as deleted"
@@ -1058,39 +1536,26 @@ class MulticastSync:
                 if error_date not in self.sync_stats["error_dates"]:
                     self.sync_stats["error_dates"].append(error_date)
 
-    def _optimize_task_data(self, tasks):
-        """Optimize task data to reduce message size for multicast"""
-        optimized = {}
-        for date_str, task_list in tasks.items():
-            optimized_tasks = []
-            for task in task_list:
-                # Only include essential fields for sync
-                optimized_task = {
-                    "id": task.get("id"),
-                    "description": task.get("description", ""),
-                    "status": task.get("status", "NEEDS-ACTION"),
-                    "time": task.get("time", ""),
-                    "color": task.get("color", "#4CAF50"),
-                    "profile_name": task.get("profile_name", ""),
-                    "created_at": task.get("created_at"),
-                    "updated_at": task.get("updated_at"),
-                    "alarm": task.get("alarm", False),
-                    "alarm_time": task.get("alarm_time"),
-                    "acknowledged": task.get("acknowledged", False),
-                }
-                # Remove None values to save space
-                optimized_task = {
-                    k: v for k, v in optimized_task.items() if v is not None
-                }
-                optimized_tasks.append(optimized_task)
-
-            if optimized_tasks:  # Only include dates that have tasks
-                optimized[date_str] = optimized_tasks
+    def _optimize_task_data(self, task_list):
+        """Pack tasks into positional rows following SYNC_TASK_FIELDS"""
+        return [
+            tuple(task.get(field) for field in SYNC_TASK_FIELDS) for task in task_list
+        ]
 
-        return optimized
+    def _expand_task_data(self, fields, rows):
+        """Unpack positional task rows back into task dicts"""
+        # None is kept - it may clear a field (e.g. alarm_time) on the receiver.
+        # Only fields missing from the sender's layout are left for the
+        # remote-task defaults
+        return [dict(zip(fields, row)) for row in rows]
 
     def _show_sync_success(self, message, sync_stats=None):
         """Show sync feedback with detailed status and close button"""
+        # Background syncs only log - skip building the dialog widgets entirely
+        if not getattr(self, "_is_user_initiated_sync", False):
+            self.logger.info(message)
+            return
+
         try:
             # Create a custom dialog with detailed information
             dialog = Gtk.Dialog(
@@ -1184,17 +1649,167 @@ class MulticastSync:
 
         message = {
             "type": "task_update",
-            "sender": self.app.settings.get("name", "Unknown"),
+            "sender": self.sender_name,
+            "instance": self.instance_name,
             "timestamp": datetime.now().isoformat(),
             "task": broadcast_task,
             "operation": operation,
         }
 
         self.logger.debug(f"Sending task update to peers: {message}")
-        self._send_message(message)
+        self._queue_message(message)
         self.logger.info(
-            f"Sent task {operation} to {len(self.peers)} peers: {broadcast_task.get('description', 'Unknown')}"
+            f"Queued task {operation} for {len(self.peers)} peers: {broadcast_task.get('description', 'Unknown')}"
+        )
+
+    def broadcast_bulk_task_updates(self, tasks, operation="update"):
+        """Broadcast many task updates packed into as few datagrams as possible"""
+        messages = self._build_bulk_messages(tasks, operation)
+        for message in messages:
+            self._queue_message(message)
+
+        self.logger.info(
+            f"Queued {len(tasks)} task {operation}s in {len(messages)} messages to {len(self.peers)} peers"
+        )
+
+    def _build_bulk_messages(self, tasks, operation):
+        """Split tasks into bulk_task_update messages of about one MTU each"""
+        # FIXED: Same early date validation as broadcast_task_update
+        valid_tasks = [task for task in tasks if "date" in task]
+        if len(valid_tasks) != len(tasks):
+            self.logger.error(
+                f"{len(tasks) - len(valid_tasks)} tasks missing date - skipping them in bulk {operation}"
+            )
+
+        # Deletes only need id and date - ship those as compact tombstones
+        if operation == "delete":
+            upserts, tombstones = [], valid_tasks
+        elif operation == "full_sync":
+            upserts = [t for t in valid_tasks if t.get("status") != "DELETED"]
+            tombstones = [t for t in valid_tasks if t.get("status") == "DELETED"]
+        else:
+            upserts, tombstones = valid_tasks, []
+
+        entries = [("rows", row) for row in self._optimize_task_data(upserts)]
+        entries += [("deleted", [t.get("id"), t["date"]]) for t in tombstones]
+
+        # One timestamp for the whole batch - it is a single sync operation
+        timestamp = datetime.now().isoformat()
+
+        def new_batch():
+            return {
+                "type": "bulk_task_update",
+                "sender": self.sender_name,
+                "instance": self.instance_name,
+                "timestamp": timestamp,
+                "fields": SYNC_TASK_FIELDS,
+                "rows": [],
+                "deleted": [],
+                "operation": operation,
+            }
+
+        # Rows share the datagram with the envelope and field list - only what
+        # is left of the limit once those are encoded is available for them
+        row_budget = BULK_PAYLOAD_LIMIT - len(_json_dumps(new_batch()))
+
+        messages = []
+        batch = None
+        batch_size = 0
+        for key, entry in entries:
+            # JSON size is an upper bound for msgpack peers too
+            entry_size = len(_json_dumps(entry)) + 1
+            if batch is None or batch_size + entry_size > row_budget:
+                batch = new_batch()
+                messages.append(batch)
+                batch_size = 0
+            batch[key].append(entry)
+            batch_size += entry_size
+
+        return messages
+
+    def _split_bulk_message(self, message):
+        """Turn a bulk_task_update back into task_update messages"""
+        operation = message.get("operation", "update")
+        tasks = self._expand_task_data(
+            message.get("fields", ()), message.get("rows", [])
         )
+        tasks += [
+            {"id": task_id, "date": date_str, "status": "DELETED"}
+            for task_id, date_str in message.get("deleted", [])
+        ]
+        return [
+            {
+                "type": "task_update",
+                "sender": message.get("sender"),
+                "instance": message.get("instance"),
+                "timestamp": message.get("timestamp"),
+                "task": task,
+                "operation": operation,
+            }
+            for task in tasks
+        ]
+
+    def _queue_message(self, message):
+        """Hand a message to the sender thread so callers never block on I/O"""
+        if self.sender_thread and self.sender_thread.is_alive():
+            try:
+                self._send_queue.put_nowait(message)
+                return
+            except queue.Full:
+                self.logger.warning("Send queue full - sending inline")
+        self._send_message(message)
+
+    def _sender_loop(self):
+        """Drain the send queue, coalescing bursts of task updates"""
+        self.logger.info("Sender loop started")
+        while True:
+            message = self._send_queue.get()
+            if message is None:
+                break
+
+            # Opportunistically pick up whatever else is already queued
+            batch = [message]
+            try:
+                while len(batch) < SEND_BATCH_SIZE:
+                    batch.append(self._send_queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            stopping = None in batch
+            if stopping:
+                batch = batch[: batch.index(None)]
+            self._flush_send_batch(batch)
+            if stopping:
+                break
+        self.logger.info("Sender loop stopped")
+
+    def _flush_send_batch(self, batch):
+        """Send queued messages, merging runs of same-operation task updates"""
+        index = 0
+        while index < len(batch):
+            message = batch[index]
+            run_end = index + 1
+            if (
+                isinstance(message, dict)
+                and message.get("type") == "task_update"
+                and message.get("operation") in BULK_OPERATIONS
+            ):
+                operation = message["operation"]
+                while (
+                    run_end < len(batch)
+                    and isinstance(batch[run_end], dict)
+                    and batch[run_end].get("type") == "task_update"
+                    and batch[run_end].get("operation") == operation
+                ):
+                    run_end += 1
+
+            if run_end - index > 1:
+                tasks = [queued["task"] for queued in batch[index:run_end]]
+                for bulk_message in self._build_bulk_messages(tasks, operation):
+                    self._send_message(bulk_message)
+            else:
+                self._send_message(message)
+            index = run_end
 
     def _log_delete_operation(self, task, operation):
         """Debug logging for delete operations"""
@@ -1203,44 +1818,18 @@ class MulticastSync:
             f"Date: {task.get('date', 'unknown')}, Description: {task.get('description', 'Unknown')}"
         )
 
-    def _clean_remote_task(self, task):
+    def _clean_remote_task(self, task, now_iso=None):
         """Ensure remote task has all required fields"""
-        cleaned_task = task.copy()
+        # Defaults first so any field the remote task carries wins
+        cleaned_task = {**REMOTE_TASK_DEFAULTS, **task}
 
-        # Ensure required fields exist
         if "id" not in cleaned_task:
-            import uuid
-
             cleaned_task["id"] = str(uuid.uuid4())
 
-        if "description" not in cleaned_task:
-            cleaned_task["description"] = "No description"
-
-        if "color" not in cleaned_task:
-            cleaned_task["color"] = "#4CAF50"
-
-        if "profile_name" not in cleaned_task:
-            cleaned_task["profile_name"] = "Unknown"
-
-        if "created_at" not in cleaned_task:
-            from datetime import datetime
-
-            cleaned_task["created_at"] = datetime.now().isoformat()
-
-        if "updated_at" not in cleaned_task:
-            from datetime import datetime
-
-            cleaned_task["updated_at"] = datetime.now().isoformat()
-
-        # Ensure alarm fields exist
-        if "alarm" not in cleaned_task:
-            cleaned_task["alarm"] = False
-
-        if "alarm_time" not in cleaned_task:
-            cleaned_task["alarm_time"] = None
-
-        if "acknowledged" not in cleaned_task:
-            cleaned_task["acknowledged"] = False
+        if "created_at" not in cleaned_task or "updated_at" not in cleaned_task:
+            now_iso = now_iso or datetime.now().isoformat()
+            cleaned_task.setdefault("created_at", now_iso)
+            cleaned_task.setdefault("updated_at", now_iso)
 
         return cleaned_task
 
@@ -1248,29 +1837,28 @@ class MulticastSync:
         """Test mDNS discovery and peer connectivity"""
         self.logger.info("Testing mDNS discovery...")
 
-        # Show current peers
+        # Show current peers (log from a snapshot, not under peers_lock)
         with self.peers_lock:
-            peer_count = len(self.peers)
-            if peer_count > 0:
-                self.logger.info(f"Discovered {peer_count} peers:")
-                for instance, peer in self.peers.items():
-                    self.logger.info(
-                        f"  - {peer['name']} at {peer['ip']}:{peer['port']}"
-                    )
-            else:
-                self.logger.info(
-                    "No peers discovered yet - discovery may take a few seconds"
-                )
+            peers = list(self.peers.values())
+        if peers:
+            self.logger.info(f"Discovered {len(peers)} peers:")
+            for peer in peers:
+                self.logger.info(f"  - {peer.name} at {peer.ip}:{peer.port}")
+        else:
+            self.logger.info(
+                "No peers discovered yet - discovery may take a few seconds"
+            )
 
         # Send test message to all peers
         test_message = {
             "type": "test_message",
-            "sender": self.app.settings.get("name", "Unknown"),
+            "sender": self.sender_name,
+            "instance": self.instance_name,
             "timestamp": datetime.now().isoformat(),
             "message": "mDNS connectivity test",
         }
 
-        self._send_message(test_message)
+        self._queue_message(test_message)
         self.logger.info("mDNS discovery test completed")
 
 
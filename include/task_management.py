@@ -2,31 +2,84 @@
 Task management functionality for the Calendar App
 """
 
-import json
+import logging
+import math
+import re
+import time
 import uuid
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
 
 from gi.repository import Gdk, GLib, Gtk, Pango
 
+# Valid HH:MM time (00:00 - 23:59)
+_TIME_RE = re.compile(r"(?:[01]\d|2[0-3]):[0-5]\d")
+_NON_DIGIT_RE = re.compile(r"[^0-9]")
+
+# Keys that never change the time entry text
+_TIME_NAVIGATION_KEYS = frozenset(
+    ("Left", "Right", "Home", "End", "Tab", "Shift_L", "Shift_R")
+)
+
+# Delay before edits in the task view are written out
+SAVE_DEBOUNCE_MS = 250
+
+# Seconds an updated_at timestamp is reused across handlers for one edit
+NOW_ISO_TTL = 0.05
+
+# Task rows built per main loop iteration when opening a day
+TASK_ROW_CHUNK = 20
+
+_TWO_PI = math.tau
+
+# Task fields shown by a task row's widgets
+ROW_FIELDS = ("time", "description", "color", "alarm")
+
+
+@lru_cache(maxsize=64)
+def _pretty_date(year, month, day):
+    """Task view title for a date, e.g. 'March 05, 2025'"""
+    return datetime(year, month, day).strftime("%B %d, %Y")
+
+
+def _hex_to_rgb(color_hex):
+    """Convert #RRGGBB to a cairo (r, g, b) tuple, green for anything else"""
+    # Colors arrive from peers too - a bad one must not break the task row
+    if not isinstance(color_hex, str) or len(color_hex) != 7 or color_hex[0] != "#":
+        return _DEFAULT_RGB
+    try:
+        return (
+            int(color_hex[1:3], 16) / 255.0,
+            int(color_hex[3:5], 16) / 255.0,
+            int(color_hex[5:7], 16) / 255.0,
+        )
+    except ValueError:
+        return _DEFAULT_RGB
+
+
+# Cairo color of the default task color #4CAF50
+_DEFAULT_RGB = _hex_to_rgb("#4CAF50")
+
 
 class TaskManagement:
     def show_task_view(self, date):
         """Show clean, functional task management view"""
         # FIXED: Save current tasks before switching to new date
         if (
-            hasattr(self, "selected_date")
-            and self.selected_date
+            self.selected_date
             and self.view_mode == "tasks"
             and self.selected_date != date
         ):
-            self.save_current_tasks()
+            self._flush_pending_save()
+        self._cancel_row_chunks()
 
         # CRITICAL: Set selected_date BEFORE clearing container
         self.selected_date = date
         self.view_mode = "tasks"
+        date_str = date.isoformat()
 
         # Clear needs_attention flag for all tasks on this date
-        date_str = date.isoformat()
         if date_str in self.tasks:
             for task in self.tasks[date_str]:
                 if task.get("needs_attention", False):
@@ -34,16 +87,13 @@ class TaskManagement:
                     # Stop blinking effect for this task
                     self._stop_blinking_for_task(task)
             # Save tasks after clearing attention flags
-            self.save_tasks()
+            self.save_tasks(date_str=date_str)
 
         # Clear container
+        self._release_task_rows()
         for child in self.main_container.get_children():
             self.main_container.remove(child)
 
-        # CRITICAL: Clear task_list reference
-        if hasattr(self, "task_list"):
-            delattr(self, "task_list")
-
         # Header with icon buttons
         header_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
         header_box.set_border_width(12)
@@ -60,7 +110,7 @@ class TaskManagement:
         # Title
         title_label = Gtk.Label()
         title_label.set_markup(
-            f"<span size='x-large'><b>{date.strftime('%B %d, %Y')}</b></span>"
+            f"<span size='x-large'><b>{_pretty_date(date.year, date.month, date.day)}</b></span>"
         )
         title_label.set_xalign(0.5)
         header_box.pack_start(title_label, True, True, 0)
@@ -84,7 +134,7 @@ class TaskManagement:
         self.main_container.pack_start(self.content_box, True, True, 0)
 
         # Show appropriate content
-        task_count = len(self.tasks.get(date.isoformat(), []))
+        task_count = len(self.tasks.get(date_str, []))
         if task_count == 0:
             self._show_empty_state()
         else:
@@ -110,7 +160,24 @@ class TaskManagement:
         self.content_box.pack_start(empty_box, True, True, 0)
 
     def _show_task_list(self):
-        """Show task list"""
+        """Show task list, recycling rows already on screen for this date"""
+        date_str = self.selected_date.isoformat()
+
+        # FIXED: Remote refreshes used to append a second list to the view
+        task_scroll = self.task_scroll
+        if task_scroll is not None and task_scroll.get_parent() is self.content_box:
+            self._cancel_row_chunks()
+            self._reconcile_task_rows(self.tasks.get(date_str, []))
+            return
+
+        # Replace whatever the content area showed before (e.g. the empty state)
+        self._release_task_rows()
+        self._clear_container(self.content_box)
+
+        if not self.tasks.get(date_str):
+            self._show_empty_state()
+            self.content_box.show_all()
+            return
 
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
@@ -120,9 +187,9 @@ class TaskManagement:
 
         self.task_list = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
         self.task_list.set_border_width(12)
+        self._dirty_rows.clear()
 
         # Populate tasks
-        date_str = self.selected_date.isoformat()
         for task in self.tasks[date_str]:
             # BUGGFIX: Ensure task has stable UUID before adding to UI
             if "id" not in task or not task["id"]:
@@ -131,120 +198,223 @@ class TaskManagement:
                     f"Generated UUID for task in task view: {task['id']}"
                 )
 
-            self._add_task_row(task)
+        # First screenful now, the rest from idle so the day opens promptly
+        self._cancel_row_chunks()
+        self._row_chunk_queue = list(self.tasks[date_str])
+        if self._append_rows_chunk():
+            self._row_chunk_source = GLib.idle_add(
+                self._append_rows_chunk, priority=GLib.PRIORITY_LOW
+            )
 
         scrolled.add(self.task_list)
+        self.task_scroll = scrolled
         self.content_box.pack_start(scrolled, True, True, 0)
         self.content_box.set_vexpand(True)
         self.content_box.set_hexpand(True)
 
-    def _is_valid_time(self, time_str):
-        """Check if time string is valid HH:MM format"""
-        if not time_str or len(time_str) != 5 or time_str.count(":") != 1:
-            return False
+        # Lists built while the view is already on screen must be shown here
+        if self.content_box.get_visible():
+            scrolled.show_all()
+
+    def _append_rows_chunk(self):
+        """Build the next batch of deferred task rows"""
+        batch = self._row_chunk_queue[:TASK_ROW_CHUNK]
+        del self._row_chunk_queue[:TASK_ROW_CHUNK]
+
+        # Before the list is first shown its caller's show_all covers new rows
+        list_visible = self.task_list.get_visible()
+        for task in batch:
+            frame = self._add_task_row(task)
+            if list_visible:
+                frame.show_all()
+
+        if self._row_chunk_queue:
+            return GLib.SOURCE_CONTINUE
+        self._row_chunk_source = 0
+        return GLib.SOURCE_REMOVE
+
+    def _cancel_row_chunks(self):
+        """Stop building deferred task rows"""
+        if self._row_chunk_source:
+            GLib.source_remove(self._row_chunk_source)
+            self._row_chunk_source = 0
+        self._row_chunk_queue = []
+
+    def _reconcile_task_rows(self, day_tasks):
+        """Rebind existing rows to the date's tasks, building only the missing ones"""
+        if not day_tasks:
+            self._show_task_list_empty()
+            return
 
-        try:
-            parts = time_str.split(":")
-            if len(parts) != 2:
-                return False
+        rows = {frame.task.get("id"): frame for frame in self.task_list.get_children()}
+        rebound = False
+
+        with self._batch_ui_updates():
+            for position, task in enumerate(day_tasks):
+                frame = rows.pop(task.get("id"), None)
+                if frame is None:
+                    frame = self._add_task_row(task)
+                    frame.show_all()
+                elif frame.task is not task:
+                    # Keep the row's dict as the stored task so UI edits stay bound
+                    changed = not self._row_fields_equal(frame.task, task)
+                    frame.task.update(task)
+                    day_tasks[position] = frame.task
+                    rebound = True
+                    if changed:
+                        self._refresh_task_row(frame)
+                self.task_list.reorder_child(frame, position)
+
+        # The stored tasks now are the row dicts - drop the cached sync payload
+        if rebound and self.multicast_sync is not None:
+            self.multicast_sync.invalidate_tasks_cache()
+
+        # Rows whose tasks are gone
+        for frame in rows.values():
+            self.task_list.remove(frame)
+            self._release_task_row(frame)
+
+    def _clear_container(self, container):
+        """Destroy every child of a container"""
+        # destroy() drops GTK's own references too, so the old subtree is
+        # freed right away instead of lingering as an orphan
+        for child in container.get_children():
+            child.destroy()
+
+    def _show_task_list_empty(self):
+        """Swap the task list for the empty state"""
+        self._release_task_rows()
+        self._clear_container(self.content_box)
+        self._show_empty_state()
+        self.content_box.show_all()
 
-            hours = int(parts[0])
-            minutes = int(parts[1])
+    def _is_valid_time(self, time_str):
+        """Check if time string is valid HH:MM format"""
+        # One keystroke validates the same text several times - reuse the result
+        last_check = self._last_time_check
+        if last_check is not None and last_check[0] == time_str:
+            return last_check[1]
 
-            return 0 <= hours <= 23 and 0 <= minutes <= 59
-        except (ValueError, IndexError):
-            return False
+        is_valid = bool(time_str) and _TIME_RE.fullmatch(time_str) is not None
+        self._last_time_check = (time_str, is_valid)
+        return is_valid
 
     def _add_task_row(self, task):
         """Add a clean task row to the list"""
+        # Widgets get their properties at construction time so each one is a
+        # single g_object_new call instead of a chain of setter round trips
 
         # Main frame
 
-        frame = Gtk.Frame()
-        frame.set_shadow_type(Gtk.ShadowType.ETCHED_IN)
+        frame = Gtk.Frame(shadow_type=Gtk.ShadowType.ETCHED_IN)
         frame.task = task
-
-        # Main container
-
-        main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        main_box.set_border_width(12)
-        frame.add(main_box)
-
-        # Top row: Controls
-
-        controls_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+        frame._handler_ids = []  # (widget, handler id) pairs for _release_task_row
+        self._frame_by_id[task.get("id")] = frame
+        # Values last written to / read from the row's widgets, so remote
+        # refreshes of rows without pending edits skip reading them back
+        frame._last_time = task.get("time", "")
+        frame._last_alarm = task.get("alarm", False)
+        frame._last_desc = task.get("description", "")
+
+        # Main container - one grid instead of nested boxes keeps size
+        # negotiation to a single pass over the row
+        # Row 0: time | color | alarm | user name | delete
+        # Row 1: description spanning all columns
+
+        grid = Gtk.Grid(column_spacing=8, row_spacing=8, border_width=12)
+        frame.add(grid)
 
         # Time input
 
-        time_entry = Gtk.Entry()
-        time_entry.set_placeholder_text("HH:MM")
-        time_entry.set_text(task.get("time", ""))
-        time_entry.set_max_length(5)
-        time_entry.set_width_chars(6)
+        time_entry = Gtk.Entry(
+            placeholder_text="HH:MM",
+            text=task.get("time", ""),
+            max_length=5,
+            width_chars=6,
+        )
         time_entry.task = task
-        time_entry.connect("key-release-event", self.on_time_key_release)
-        time_entry.connect("changed", self.on_time_changed)
-        controls_box.pack_start(time_entry, False, False, 0)
+        time_entry.frame = frame
+        self._connect_row(
+            frame, time_entry, "key-release-event", self.on_time_key_release
+        )
+        # Handler ids are kept so remote refreshes can block them directly
+        frame._time_changed_id = self._connect_row(
+            frame, time_entry, "changed", self.on_time_changed
+        )
+        self._connect_row(frame, time_entry, "changed", self._mark_row_dirty, frame)
+        grid.attach(time_entry, 0, 0, 1, 1)
 
         # Color button
 
-        color_btn = Gtk.Button()
-        color_btn.set_tooltip_text("Change color")
-        color_btn.set_size_request(32, 32)
+        color_btn = Gtk.Button(
+            tooltip_text="Change color", width_request=32, height_request=32
+        )
 
-        color_draw = Gtk.DrawingArea()
-        color_draw.set_size_request(20, 20)
+        color_draw = Gtk.DrawingArea(width_request=20, height_request=20)
         color_draw.task_ref = task  # Store task reference for blinking cleanup
-        color_draw.connect("draw", self.draw_color_circle)
-
-        color_btn.connect(
-            "clicked", lambda w: self.on_color_button_click(task, color_draw)
+        color_hex = task.get("color") or "#4CAF50"
+        color_draw._rgb = (color_hex, _hex_to_rgb(color_hex))
+        self._connect_row(frame, color_draw, "draw", self.draw_color_circle)
+
+        self._connect_row(
+            frame,
+            color_btn,
+            "clicked",
+            lambda w: self.on_color_button_click(task, color_draw),
         )
         color_btn.add(color_draw)
-        controls_box.pack_start(color_btn, False, False, 0)
+        grid.attach(color_btn, 1, 0, 1, 1)
 
         # Alarm box (contains both icon and checkbox)
-
-        alarm_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
+        # Its visibility follows the time validity only, so show_all() must
+        # never touch it - the children are shown up front instead
+
+        is_valid = self._is_valid_time(task.get("time", ""))
+        alarm_box = Gtk.Box(
+            orientation=Gtk.Orientation.HORIZONTAL,
+            spacing=4,
+            no_show_all=True,
+            visible=is_valid,
+        )
 
         # Alarm icon
-        alarm_icon = Gtk.Label(label="🔔")
+        alarm_icon = Gtk.Label(label="🔔", visible=True)
         alarm_box.pack_start(alarm_icon, False, False, 0)
 
         # Alarm checkbox
-        alarm_check = Gtk.CheckButton()
-        alarm_check.set_active(task.get("alarm", False))
-        alarm_check.set_tooltip_text("Set alarm")
+        alarm_check = Gtk.CheckButton(
+            active=task.get("alarm", False), tooltip_text="Set alarm", visible=True
+        )
         alarm_check.time_entry = time_entry
-        alarm_check.connect("toggled", self.on_alarm_toggled, task)
+        alarm_check.frame = frame
+        frame._alarm_toggled_id = self._connect_row(
+            frame, alarm_check, "toggled", self.on_alarm_toggled, task
+        )
+        self._connect_row(frame, alarm_check, "toggled", self._mark_row_dirty, frame)
         alarm_box.pack_start(alarm_check, False, False, 0)
 
-        controls_box.pack_start(alarm_box, False, False, 0)
+        grid.attach(alarm_box, 2, 0, 1, 1)
 
         # Store references for visibility control
         frame.alarm_box = alarm_box
         frame.alarm_check = alarm_check
         frame.alarm_icon = alarm_icon
 
-        # Check initial time validity and set visibility
-        time_str = task.get("time", "")
-        is_valid = self._is_valid_time(time_str)
-
-        alarm_box.set_visible(is_valid)
-        alarm_box.set_no_show_all(not is_valid)
-
         # User name centered between alarm and delete
 
         user_name = task.get("profile_name", self.settings.get("name", ""))
         if user_name and user_name.strip():
-            name_label = Gtk.Label()
-            name_label.set_markup(f"<small>👤 {user_name}</small>")
-            name_label.set_halign(Gtk.Align.CENTER)
+            name_label = Gtk.Label(
+                label=f"<small>👤 {user_name}</small>",
+                use_markup=True,
+                halign=Gtk.Align.CENTER,
+                hexpand=True,
+            )
             name_label.get_style_context().add_class(Gtk.STYLE_CLASS_DIM_LABEL)
-            controls_box.pack_start(name_label, True, True, 0)
+            grid.attach(name_label, 3, 0, 1, 1)
         else:
-            spacer = Gtk.Box()
-            controls_box.pack_start(spacer, True, True, 0)
+            spacer = Gtk.Box(hexpand=True)
+            grid.attach(spacer, 3, 0, 1, 1)
 
         # Delete button
 
@@ -252,37 +422,46 @@ class TaskManagement:
             "edit-delete-symbolic", Gtk.IconSize.BUTTON
         )
         delete_btn.set_tooltip_text("Delete task")
-        delete_btn.connect("clicked", self.delete_task, frame)
-        controls_box.pack_start(delete_btn, False, False, 0)
-
-        main_box.pack_start(controls_box, False, False, 0)
+        self._connect_row(frame, delete_btn, "clicked", self.delete_task, frame)
+        grid.attach(delete_btn, 4, 0, 1, 1)
 
         # Description area
 
-        desc_scroll = Gtk.ScrolledWindow()
-        desc_scroll.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
-        desc_scroll.set_min_content_height(60)
-        desc_scroll.set_max_content_height(120)
-        desc_scroll.set_size_request(-1, 80)
+        desc_scroll = Gtk.ScrolledWindow(
+            hscrollbar_policy=Gtk.PolicyType.AUTOMATIC,
+            vscrollbar_policy=Gtk.PolicyType.AUTOMATIC,
+            min_content_height=60,
+            max_content_height=120,
+            height_request=80,
+        )
+
+        desc_view = Gtk.TextView(
+            wrap_mode=Gtk.WrapMode.WORD,
+            left_margin=8,
+            right_margin=8,
+            top_margin=8,
+            bottom_margin=8,
+        )
 
-        desc_view = Gtk.TextView()
-        desc_view.set_wrap_mode(Gtk.WrapMode.WORD)
-        desc_view.set_left_margin(8)
-        desc_view.set_right_margin(8)
-        desc_view.set_top_margin(8)
-        desc_view.set_bottom_margin(8)
+        desc_view.frame = frame
 
         # Focus handling
-        desc_view.connect("focus-in-event", self._on_desc_focus_in)
-        desc_view.connect("focus-out-event", self._on_desc_focus_out)
+        self._connect_row(frame, desc_view, "focus-in-event", self._on_desc_focus_in)
+        self._connect_row(frame, desc_view, "focus-out-event", self._on_desc_focus_out)
 
         desc_buffer = desc_view.get_buffer()
         desc_buffer.set_text(task.get("description", ""))
+        desc_buffer.set_modified(False)
+        desc_buffer._enforcing = False  # Set while the limit rewrites the text
 
         def enforce_character_limit(buffer):
             """Enforce 10K character limit and handle paste operations"""
             MAX_DESCRIPTION_LENGTH = 10000
 
+            # Character count is cheap - only read the text back when over the limit
+            if buffer.get_char_count() <= MAX_DESCRIPTION_LENGTH:
+                return
+
             # Get current text
             start_iter = buffer.get_start_iter()
             end_iter = buffer.get_end_iter()
@@ -292,7 +471,11 @@ class TaskManagement:
             if len(current_text) > MAX_DESCRIPTION_LENGTH:
                 # Truncate to limit
                 truncated_text = current_text[:MAX_DESCRIPTION_LENGTH]
-                buffer.set_text(truncated_text)
+                buffer._enforcing = True
+                try:
+                    buffer.set_text(truncated_text)
+                finally:
+                    buffer._enforcing = False
 
                 # Move cursor to end
                 end_iter = buffer.get_end_iter()
@@ -305,18 +488,27 @@ class TaskManagement:
 
         def on_description_changed(buffer):
             """Handle text changes with character limit enforcement"""
+            # Changes made by the truncation itself are handled by the outer call
+            if buffer._enforcing:
+                return
             enforce_character_limit(buffer)
-            task["updated_at"] = datetime.now().isoformat()
+            task["updated_at"] = self._now_iso()
+            self._schedule_save()
 
         # Connect change handler
-        desc_buffer.connect("changed", on_description_changed)
+        self._connect_row(frame, desc_buffer, "changed", self._mark_row_dirty, frame)
+        frame._desc_changed_id = self._connect_row(
+            frame, desc_buffer, "changed", on_description_changed
+        )
 
         # Connect paste signal with robust error handling
-        desc_view.connect("paste-clipboard", self.on_paste_clipboard, task)
+        self._connect_row(
+            frame, desc_view, "paste-clipboard", self.on_paste_clipboard, task
+        )
 
         # Add text view directly to scroll (no frame to avoid X11 issues)
         desc_scroll.add(desc_view)
-        main_box.pack_start(desc_scroll, True, True, 0)
+        grid.attach(desc_scroll, 0, 1, 5, 1)
 
         # Store references
         frame.time_entry = time_entry
@@ -324,6 +516,39 @@ class TaskManagement:
         frame.color_draw = color_draw  # Store for blinking cleanup
 
         self.task_list.pack_start(frame, False, False, 0)
+        return frame
+
+    def _connect_row(self, frame, widget, signal, handler, *args):
+        """Connect a task row signal and remember it for _release_task_row"""
+        handler_id = widget.connect(signal, handler, *args)
+        frame._handler_ids.append((widget, handler_id))
+        return handler_id
+
+    def _release_task_row(self, frame):
+        """Disconnect a removed row's handlers so it and its task can be freed"""
+        # The closures and user data (task, frame) would otherwise keep the
+        # whole row alive through reference cycles with the GObjects
+        for widget, handler_id in frame._handler_ids:
+            widget.disconnect(handler_id)
+        frame._handler_ids = []
+        self._dirty_rows.discard(frame)
+        self._ui_dirty.discard(frame.color_draw)
+        task_id = frame.task.get("id")
+        if self._frame_by_id.get(task_id) is frame:
+            del self._frame_by_id[task_id]
+        frame.destroy()
+
+    def _release_task_rows(self):
+        """Release every row of the current task list and drop the list"""
+        self._cancel_row_chunks()
+        if self.task_list is not None:
+            for frame in self.task_list.get_children():
+                self._release_task_row(frame)
+
+        # The list is destroyed or detached by the caller - don't keep
+        # references that later reconciles or adds could touch
+        self.task_list = None
+        self.task_scroll = None
 
     def on_paste_clipboard(self, text_view, clipboard, task):
         """Handle paste operations with robust async error handling"""
@@ -378,12 +603,9 @@ class TaskManagement:
 
         try:
             buffer = text_view.get_buffer()
-            start_iter = buffer.get_start_iter()
-            end_iter = buffer.get_end_iter()
-            current_text = buffer.get_text(start_iter, end_iter, True)
 
             # Calculate available space
-            available_chars = MAX_DESCRIPTION_LENGTH - len(current_text)
+            available_chars = MAX_DESCRIPTION_LENGTH - buffer.get_char_count()
 
             if available_chars <= 0:
                 self._show_paste_error_dialog(
@@ -405,15 +627,19 @@ class TaskManagement:
             buffer.insert_at_cursor(pasted_text)
 
             # Final safety check
-            final_text = buffer.get_text(
-                buffer.get_start_iter(), buffer.get_end_iter(), True
-            )
-            if len(final_text) > MAX_DESCRIPTION_LENGTH:
-                buffer.set_text(final_text[:MAX_DESCRIPTION_LENGTH])
+            if buffer.get_char_count() > MAX_DESCRIPTION_LENGTH:
+                final_text = buffer.get_text(
+                    buffer.get_start_iter(), buffer.get_end_iter(), True
+                )
+                buffer._enforcing = True
+                try:
+                    buffer.set_text(final_text[:MAX_DESCRIPTION_LENGTH])
+                finally:
+                    buffer._enforcing = False
                 buffer.place_cursor(buffer.get_end_iter())
 
             # Update task timestamp
-            task["updated_at"] = datetime.now().isoformat()
+            task["updated_at"] = self._now_iso()
 
         except Exception as e:
             self.debug_logger.logger.error(f"Error processing pasted text: {e}")
@@ -453,26 +679,26 @@ class TaskManagement:
 
     def _on_desc_focus_out(self, text_view, event):
         """Handle focus out from description field"""
-        self.save_current_tasks()
+        self._schedule_save()
         return False
 
     def draw_color_circle(self, widget, cr):
         """Draw clean color circle"""
-        task = widget.task_ref
-        color_hex = task.get("color", "#4CAF50")
+        color_hex = widget.task_ref.get("color") or "#4CAF50"
 
-        # Parse hex color
-        r = int(color_hex[1:3], 16) / 255.0
-        g = int(color_hex[3:5], 16) / 255.0
-        b = int(color_hex[5:7], 16) / 255.0
+        # Hex is only parsed again when the color changed (e.g. remote sync)
+        cached_hex, rgb = widget._rgb
+        if cached_hex != color_hex:
+            rgb = _hex_to_rgb(color_hex)
+            widget._rgb = (color_hex, rgb)
 
         # Draw filled circle
-        cr.arc(10, 10, 6, 0, 2 * 3.14159)
-        cr.set_source_rgb(r, g, b)
+        cr.arc(10, 10, 6, 0, _TWO_PI)
+        cr.set_source_rgb(*rgb)
         cr.fill()
 
         # Draw border
-        cr.arc(10, 10, 6, 0, 2 * 3.14159)
+        cr.arc(10, 10, 6, 0, _TWO_PI)
         cr.set_source_rgb(0.7, 0.7, 0.7)
         cr.set_line_width(1)
         cr.stroke()
@@ -488,20 +714,27 @@ class TaskManagement:
         text = entry.get_text()
 
         # If navigation keys, just validate and return
-        if keyname in ["Left", "Right", "Home", "End", "Tab", "Shift_L", "Shift_R"]:
+        if keyname in _TIME_NAVIGATION_KEYS:
             is_valid = self._is_valid_time(text)
             self._update_alarm_visibility(entry, is_valid)
             return False
 
         # Handle BackSpace/Delete - validate immediately
-        if keyname in ["BackSpace", "Delete"]:
+        if keyname in ("BackSpace", "Delete"):
             is_valid = self._is_valid_time(text)
             self._update_alarm_visibility(entry, is_valid)
             entry.task["time"] = text
-            self.save_current_tasks()
+            self._schedule_save(entry.task)
             return False
 
-        digits = "".join(c for c in text if c.isdigit())
+        # Fast path: empty or already canonical HH:MM needs no reformatting
+        if not text or self._is_valid_time(text):
+            entry.task["time"] = text
+            self._update_alarm_visibility(entry, bool(text))
+            self._schedule_save(entry.task)
+            return False
+
+        digits = _NON_DIGIT_RE.sub("", text)
 
         if len(digits) > 4:
             digits = digits[:4]
@@ -513,7 +746,7 @@ class TaskManagement:
             entry.set_text("")
             entry.task["time"] = ""
             self._update_alarm_visibility(entry, False)
-            self.save_current_tasks()
+            self._schedule_save(entry.task)
             return False
 
         if len(digits) >= 1:
@@ -548,47 +781,36 @@ class TaskManagement:
         is_valid = self._is_valid_time(entry.get_text())
         self._update_alarm_visibility(entry, is_valid)
 
-        self.save_current_tasks()
+        self._schedule_save(entry.task)
         return False
 
     def _update_alarm_visibility(self, time_entry, is_valid):
         """Update visibility of alarm controls based on time validity"""
-        # Find the frame containing this time entry
-        parent = time_entry.get_parent()
-        while parent and not isinstance(parent, Gtk.Frame):
-            parent = parent.get_parent()
-
-        if not parent or not hasattr(parent, "alarm_box"):
-            return
-
-        frame = parent
+        frame = time_entry.frame
         task = time_entry.task
 
         if is_valid:
             # Show alarm controls
             frame.alarm_box.set_visible(True)
-            frame.alarm_box.set_no_show_all(False)
-            frame.alarm_box.show_all()
         else:
             # Hide alarm controls and disable alarm if it was enabled
             if task.get("alarm", False):
                 task["alarm"] = False
                 task["alarm_time"] = None
                 task["acknowledged"] = False
-                if hasattr(frame, "alarm_check"):
-                    frame.alarm_check.set_active(False)
-                self.save_current_tasks()
+                frame.alarm_check.set_active(False)
+                frame._last_alarm = False
+                self._schedule_save(task)
 
             frame.alarm_box.set_visible(False)
-            frame.alarm_box.set_no_show_all(True)
 
     def on_time_changed(self, entry):
         """Update alarm time if alarm is active and time changes"""
         task = entry.task
         time_str = entry.get_text()
 
-        task["updated_at"] = datetime.now().isoformat()
-        self.save_current_tasks()
+        task["updated_at"] = self._now_iso()
+        self._schedule_save(task)
 
         # Only process alarm time if time is valid
         if not self._is_valid_time(time_str):
@@ -607,13 +829,8 @@ class TaskManagement:
                     if alarm_datetime > datetime.now():
                         task["alarm_time"] = alarm_datetime.isoformat()
                         task["acknowledged"] = False
-                        date_str = self.selected_date.isoformat()
-                        self.triggered_alarms = {
-                            aid
-                            for aid in self.triggered_alarms
-                            if not aid.startswith(f"{date_str}:")
-                        }
-                        self.save_current_tasks()
+                        self.triggered_alarms.pop(self._alarm_owner_key(task), None)
+                        self._schedule_save(task)
                     else:
                         # Alarm time is in the past - show warning and disable alarm
                         self.debug_logger.logger.warning(
@@ -622,12 +839,8 @@ class TaskManagement:
                         task["alarm"] = False
                         task["alarm_time"] = None
                         # Update UI to reflect disabled alarm
-                        parent = entry.get_parent()
-                        while parent and not isinstance(parent, Gtk.Frame):
-                            parent = parent.get_parent()
-                        if parent and hasattr(parent, "alarm_check"):
-                            parent.alarm_check.set_active(False)
-                        self.save_current_tasks()
+                        entry.frame.alarm_check.set_active(False)
+                        self._schedule_save(task)
             except (ValueError, AttributeError):
                 pass
 
@@ -638,7 +851,7 @@ class TaskManagement:
 
         # Set current color
         rgba = Gdk.RGBA()
-        if rgba.parse(task.get("color", "#4CAF50")):
+        if rgba.parse(task.get("color") or "#4CAF50"):
             dialog.set_rgba(rgba)
 
         response = dialog.run()
@@ -650,14 +863,14 @@ class TaskManagement:
                 int(selected_color.blue * 255),
             )
             task["color"] = hex_color
-            task["updated_at"] = datetime.now().isoformat()
+            task["updated_at"] = self._now_iso()
+            draw_area._rgb = (
+                hex_color,
+                (selected_color.red, selected_color.green, selected_color.blue),
+            )
             draw_area.queue_draw()
-            self.save_current_tasks()
-
-            # Broadcast color change
-            if hasattr(self, "multicast_sync"):
-                task["date"] = self.selected_date.isoformat()
-                self.multicast_sync.broadcast_task_update(task, "update")
+            # Saved and broadcast with the rest of the day's edits
+            self._schedule_save(task)
 
         dialog.destroy()
 
@@ -728,23 +941,129 @@ class TaskManagement:
                     return
 
             task["alarm"] = new_alarm_state
-            task["updated_at"] = datetime.now().isoformat()
+            task["updated_at"] = self._now_iso()
             self.debug_logger.logger.debug(
                 f"Task alarm set to {new_alarm_state}, saving..."
             )
 
-            self.save_current_tasks()
-
-            # Broadcast alarm change
-            if hasattr(self, "multicast_sync"):
-                task["date"] = self.selected_date.isoformat()
-                self.multicast_sync.broadcast_task_update(task, "update")
+            # Saved and broadcast with the rest of the day's edits
+            self._schedule_save(task)
         elif not task["alarm"] and was_alarm:
             task["alarm_time"] = None
             task["acknowledged"] = False
-            self.save_current_tasks()
+            self._schedule_save(task)
+
+    def _now_iso(self):
+        """Current local time as ISO string, shared by handlers firing for one edit"""
+        now = time.monotonic()
+        stamped_at, now_iso = self._now_iso_cache
+        if not now_iso or now - stamped_at > NOW_ISO_TTL:
+            now_iso = datetime.now().isoformat()
+            self._now_iso_cache = (now, now_iso)
+        return now_iso
+
+    def _mark_row_dirty(self, widget, frame):
+        """Remember that a task row needs to be read back on the next save"""
+        self._dirty_rows.add(frame)
+
+    def _schedule_save(self, task=None):
+        """Coalesce rapid edits into a single deferred save_current_tasks call"""
+        # Handlers that change the task dict directly pass it, since comparing
+        # the row widgets against the task would not notice those edits
+        if task is not None:
+            self._unsaved_tasks[task.get("id")] = task
+            # The dict already changed - sync requests must not get the old copy
+            if self.multicast_sync is not None:
+                self.multicast_sync.invalidate_tasks_cache()
+        if self._save_pending:
+            return
+        self._save_pending = GLib.timeout_add(SAVE_DEBOUNCE_MS, self._flush_save)
+
+    def _flush_save(self):
+        """Run the debounced save"""
+        self._save_pending = 0
+        self.save_current_tasks()
+        return GLib.SOURCE_REMOVE
+
+    def _flush_pending_save(self):
+        """Drop any pending debounced save and save synchronously"""
+        if self._save_pending:
+            GLib.source_remove(self._save_pending)
+            self._save_pending = 0
+        self.save_current_tasks(full_scan=True)
 
-    def save_current_tasks(self):
+    def _sync_row_to_task(self, frame):
+        """Copy a task row's widget state into its task, returning True if it changed"""
+        has_changes = False
+        task = frame.task
+        task_id = task.get("id", "unknown")
+
+        # Get time
+        old_time = task.get("time", "")
+        new_time = frame.time_entry.get_text()
+        if old_time != new_time:
+            self.debug_logger.logger.debug(
+                f"save_current_tasks: Time changed for task {task_id}: '{old_time}' -> '{new_time}'"
+            )
+            task["time"] = new_time
+            task["updated_at"] = self._now_iso()
+            has_changes = True
+        else:
+            task["time"] = new_time
+        frame._last_time = new_time
+
+        # Get description - an unmodified buffer still matches the task
+        buffer = frame.desc_view.get_buffer()
+        if buffer.get_modified():
+            buffer.set_modified(False)
+            start = buffer.get_start_iter()
+            end = buffer.get_end_iter()
+            new_description = buffer.get_text(start, end, False)
+            frame._last_desc = new_description
+
+            # Final safety check: enforce 10K character limit
+            MAX_DESCRIPTION_LENGTH = 10000
+            if len(new_description) > MAX_DESCRIPTION_LENGTH:
+                new_description = new_description[:MAX_DESCRIPTION_LENGTH]
+                self.debug_logger.logger.warning(
+                    f"save_current_tasks: Task description truncated to {MAX_DESCRIPTION_LENGTH} characters"
+                )
+
+            old_description = task.get("description", "")
+            if old_description != new_description:
+                self.debug_logger.logger.debug(
+                    f"save_current_tasks: Description changed for task {task_id}: '{old_description}' -> '{new_description}'"
+                )
+                task["description"] = new_description
+                task["updated_at"] = self._now_iso()
+                has_changes = True
+            else:
+                task["description"] = new_description
+
+        # Get alarm state
+        old_alarm = task.get("alarm", False)
+        new_alarm = frame.alarm_check.get_active()
+        frame._last_alarm = new_alarm
+        if old_alarm != new_alarm:
+            self.debug_logger.logger.debug(
+                f"save_current_tasks: Alarm changed for task {task_id}: {old_alarm} -> {new_alarm}"
+            )
+            task["alarm"] = new_alarm
+            task["updated_at"] = self._now_iso()
+            has_changes = True
+
+        # Clear needs_attention flag
+        if "needs_attention" in task:
+            self.debug_logger.logger.debug(
+                f"save_current_tasks: Clearing needs_attention for task {task_id}"
+            )
+            del task["needs_attention"]
+            self._stop_blinking_for_task(task)
+            has_changes = True
+
+        return has_changes
+
+    def save_current_tasks(self, full_scan=False):
         """Save currently displayed tasks"""
         if self.view_mode != "tasks" or not self.selected_date:
             self.debug_logger.logger.debug(
@@ -752,106 +1071,68 @@ class TaskManagement:
             )
             return
 
-        if not hasattr(self, "task_list") or not self.task_list:
+        if self.task_list is None:
             self.debug_logger.logger.debug("save_current_tasks: No task list")
             return
 
         date_str = self.selected_date.isoformat()
-        tasks = []
         has_changes = False
+        changed_tasks = self._unsaved_tasks
+        self._unsaved_tasks = {}
 
         self.debug_logger.logger.debug(
             f"save_current_tasks: Processing tasks for date {date_str}"
         )
 
-        for frame in self.task_list.get_children():
-            if hasattr(frame, "task"):
-                task = frame.task
-                task_id = task.get("id", "unknown")
-
-                # Get time
-                if hasattr(frame, "time_entry"):
-                    old_time = task.get("time", "")
-                    new_time = frame.time_entry.get_text()
-                    if old_time != new_time:
-                        self.debug_logger.logger.debug(
-                            f"save_current_tasks: Time changed for task {task_id}: '{old_time}' -> '{new_time}'"
-                        )
-                        task["time"] = new_time
-                        task["updated_at"] = datetime.now().isoformat()
-                        has_changes = True
-                    else:
-                        task["time"] = new_time
-
-                # Get description
-                if hasattr(frame, "desc_view"):
-                    buffer = frame.desc_view.get_buffer()
-                    start = buffer.get_start_iter()
-                    end = buffer.get_end_iter()
-                    new_description = buffer.get_text(start, end, False)
-
-                    # Final safety check: enforce 10K character limit
-                    MAX_DESCRIPTION_LENGTH = 10000
-                    if len(new_description) > MAX_DESCRIPTION_LENGTH:
-                        new_description = new_description[:MAX_DESCRIPTION_LENGTH]
-                        self.debug_logger.logger.warning(
-                            f"save_current_tasks: Task description truncated to {MAX_DESCRIPTION_LENGTH} characters"
-                        )
-
-                    old_description = task.get("description", "")
-                    if old_description != new_description:
-                        self.debug_logger.logger.debug(
-                            f"save_current_tasks: Description changed for task {task_id}: '{old_description}' -> '{new_description}'"
-                        )
-                        task["description"] = new_description
-                        task["updated_at"] = datetime.now().isoformat()
-                        has_changes = True
-                    else:
-                        task["description"] = new_description
-
-                # Get alarm state
-                if hasattr(frame, "alarm_check"):
-                    old_alarm = task.get("alarm", False)
-                    new_alarm = frame.alarm_check.get_active()
-                    if old_alarm != new_alarm:
-                        self.debug_logger.logger.debug(
-                            f"save_current_tasks: Alarm changed for task {task_id}: {old_alarm} -> {new_alarm}"
-                        )
-                        task["alarm"] = new_alarm
-                        task["updated_at"] = datetime.now().isoformat()
-                        has_changes = True
-
-                # Clear needs_attention flag
-                if "needs_attention" in task:
-                    self.debug_logger.logger.debug(
-                        f"save_current_tasks: Clearing needs_attention for task {task_id}"
-                    )
-                    del task["needs_attention"]
-                    self._stop_blinking_for_task(task)
-                    has_changes = True
-
-                tasks.append(task)
-
-        if tasks:
-            self.tasks[date_str] = tasks
-        elif date_str in self.tasks:
-            self.debug_logger.logger.debug(
-                f"save_current_tasks: Removing date {date_str} from tasks (no tasks left)"
-            )
-            del self.tasks[date_str]
+        # Only rows touched since the last save need their widgets read back;
+        # the full scan also rebuilds the date's list from the rows on screen
+        if full_scan:
+            frames = self.task_list.get_children()
+        else:
+            frames = [
+                frame
+                for frame in self._dirty_rows
+                if frame.get_parent() is self.task_list
+            ]
+        self._dirty_rows.clear()
+
+        for frame in frames:
+            if self._sync_row_to_task(frame):
+                changed_tasks[frame.task.get("id")] = frame.task
+
+        if not full_scan:
+            tasks = self.tasks.get(date_str, [])
+        else:
+            # Rows still waiting to be built keep their place after the shown ones
+            tasks = [frame.task for frame in frames] + self._row_chunk_queue
+            if tasks:
+                self.tasks[date_str] = tasks
+            elif date_str in self.tasks:
+                self.debug_logger.logger.debug(
+                    f"save_current_tasks: Removing date {date_str} from tasks (no tasks left)"
+                )
+                del self.tasks[date_str]
+                has_changes = True
+
+        # Tasks deleted since the edit are broadcast as deletes elsewhere
+        task_ids = {task.get("id") for task in tasks}
+        changed = [
+            task for task_id, task in changed_tasks.items() if task_id in task_ids
+        ]
+        if changed:
             has_changes = True
 
         if has_changes:
             self.debug_logger.logger.debug(
                 f"save_current_tasks: Saving {len(tasks)} tasks for date {date_str}"
             )
-            self.save_tasks()
+            self.save_tasks(date_str=date_str)
 
-            # Broadcast task updates for all modified tasks
-            if hasattr(self, "multicast_sync"):
-                for task in tasks:
+            # Broadcast only the modified tasks, batched into few datagrams
+            if changed and self.multicast_sync is not None:
+                for task in changed:
                     task["date"] = date_str
-                    self.multicast_sync.broadcast_task_update(task, "update")
+                self.multicast_sync.broadcast_bulk_task_updates(changed, "update")
         else:
             self.debug_logger.logger.debug("save_current_tasks: No changes detected")
 
@@ -864,40 +1145,54 @@ class TaskManagement:
         task_to_remove = getattr(frame, "task", None)
 
         if task_to_remove and date_str in self.tasks:
-            if task_to_remove in self.tasks[date_str]:
+            # Located by id - list.remove() would compare whole task dicts
+            position = self._find_task_position(date_str, task_to_remove.get("id"))
+            if position is not None:
                 # Remove task completely from tasks
-                self.tasks[date_str].remove(task_to_remove)
+                del self.tasks[date_str][position]
                 if not self.tasks[date_str]:
                     del self.tasks[date_str]
+                    self._task_positions.pop(date_str, None)
 
         # Remove from UI
-        if hasattr(self, "task_list"):
+        if self.task_list is not None:
             self.task_list.remove(frame)
+        self._release_task_row(frame)
 
-        # FIXED: Immediate save to prevent data loss
-        self.save_tasks()
+        # FIXED: Save right away (written in the background) to prevent data loss
+        self.save_tasks(date_str=date_str)
 
         # Broadcast delete operation
-        if hasattr(self, "multicast_sync") and task_to_remove:
+        if self.multicast_sync is not None and task_to_remove:
             task_to_remove["date"] = date_str
             self.multicast_sync.broadcast_task_update(task_to_remove, "delete")
 
-        # Update UI if no tasks left
-        date_str = self.selected_date.isoformat()
+        # Update UI if no tasks left - from idle, so the click is handled
+        # before the content area and calendar are rebuilt
         if len(self.tasks.get(date_str, [])) == 0:
-            for child in self.content_box.get_children():
-                self.content_box.remove(child)
-            self._show_empty_state()
-            self.content_box.show_all()
+            GLib.idle_add(self._refresh_after_delete, date_str)
 
-            # Also update calendar view to remove task indicators
-            if hasattr(self, "update_calendar"):
-                self.update_calendar()
+    def _refresh_after_delete(self, date_str):
+        """Show the empty state once the last task of a day is deleted"""
+        if (
+            self.view_mode == "tasks"
+            and self.selected_date
+            and self.selected_date.isoformat() == date_str
+            and not self.tasks.get(date_str)
+        ):
+            self._show_task_list_empty()
+
+        # Also update calendar view to remove task indicators
+        self.update_calendar()
+        return GLib.SOURCE_REMOVE
 
     def close_task_view(self, widget):
         """Close task view and return to calendar"""
         if self.selected_date:
-            self.save_current_tasks()
+            self._flush_pending_save()
+            self.flush_tasks_save()
+        self._cancel_row_chunks()
+        self._release_task_rows()
 
         self.view_mode = "calendar"
         for child in self.main_container.get_children():
@@ -916,6 +1211,7 @@ class TaskManagement:
         if not self.selected_date:
             return
 
+        now_iso = self._now_iso()
         task = {
             "id": str(uuid.uuid4()),
             "time": "",
@@ -923,120 +1219,186 @@ class TaskManagement:
             "color": "#4CAF50",
             "alarm": False,
             "alarm_time": None,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "created_at": now_iso,
+            "updated_at": now_iso,
             "profile_name": self.settings.get("name", ""),
         }
 
         date_str = self.selected_date.isoformat()
-        if date_str not in self.tasks:
-            self.tasks[date_str] = []
-        self.tasks[date_str].append(task)
-
-        if "needs_attention" in task:
-            del task["needs_attention"]
-            self._stop_blinking_for_task(task)
+        self.tasks.setdefault(date_str, []).append(task)
 
-        # FIXED: Save immediately to prevent data loss
-        self.save_tasks()
+        # FIXED: Save right away (written in the background) to prevent data loss
+        self.save_tasks(date_str=date_str)
 
         # Update UI
-        if len(self.tasks[date_str]) == 1:
-            # Clear content box and show task list directly
-            for child in self.content_box.get_children():
-                self.content_box.remove(child)
+        if self.task_list is None:
+            # The empty state is shown - _show_task_list replaces it, and the
+            # content box is already visible, so the new list shows itself
             self._show_task_list()
-            self.content_box.show_all()
-            if hasattr(self, "task_list") and self.task_list:
-                self.task_list.show_all()
-            self.main_container.show_all()
 
-            # Debug: Force immediate refresh and log visibility
-            self.debug_logger.logger.info(
-                f"Content box visible: {self.content_box.get_visible()}"
-            )
-            self.debug_logger.logger.info(
-                f"Content box allocated size: {self.content_box.get_allocated_width()}x{self.content_box.get_allocated_height()}"
-            )
-            self.main_container.queue_draw()
-            while Gtk.events_pending():
-                Gtk.main_iteration()
+            # The new list is allocated on the next frame - log it from there
+            # instead of pumping the main loop from inside this handler
+            if self.debug_logger.logger.isEnabledFor(logging.INFO):
+                GLib.idle_add(
+                    self._finalize_add_task, priority=GLib.PRIORITY_HIGH_IDLE
+                )
 
+        elif self._row_chunk_queue:
+            # Rows are still being built - keep the new task in list order
+            self._row_chunk_queue.append(task)
         else:
-            self._add_task_row(task)
-            self.task_list.show_all()
-            self.main_container.queue_draw()
+            self._add_task_row(task).show_all()
+
+    def _finalize_add_task(self):
+        """Log the task view layout once the first task's list is allocated"""
+        self.debug_logger.logger.info(
+            f"Content box visible: {self.content_box.get_visible()}"
+        )
+        self.debug_logger.logger.info(
+            f"Content box allocated size: {self.content_box.get_allocated_width()}x{self.content_box.get_allocated_height()}"
+        )
+        return GLib.SOURCE_REMOVE
+
+    @contextmanager
+    def _batch_ui_updates(self):
+        """Hold back row redraws until the outermost batch of UI updates ends"""
+        self._ui_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._ui_batch_depth -= 1
+            if not self._ui_batch_depth and self._ui_dirty:
+                dirty, self._ui_dirty = self._ui_dirty, set()
+                for widget in dirty:
+                    widget.queue_draw()
+
+    def _queue_redraw(self, widget):
+        """Redraw a widget now, or once at the end of the current batch"""
+        if self._ui_batch_depth:
+            self._ui_dirty.add(widget)
+        else:
+            widget.queue_draw()
 
     def _update_task_ui(self, task_id, date_str):
         """Update UI for a specific task when synced from multicast"""
-        if not hasattr(self, "task_list") or not self.task_list:
+        if self.task_list is None:
+            return
+
+        # Other days' rows are rebuilt from self.tasks when they are opened
+        if (
+            self.view_mode != "tasks"
+            or not self.selected_date
+            or self.selected_date.isoformat() != date_str
+        ):
+            return
+
+        frame = self._frame_by_id.get(task_id)
+        if frame is None:
             return
 
         # Get the actual task data from storage (not just the UI frame)
-        actual_task = None
-        if date_str in self.tasks:
-            for t in self.tasks[date_str]:
-                if t.get("id") == task_id:
-                    actual_task = t
-                    break
+        position = self._find_task_position(date_str, task_id)
+        if position is None:
+            return
 
-        if not actual_task:
+        # Already bound to the stored task (e.g. by _reconcile_task_rows)
+        actual_task = self.tasks[date_str][position]
+        if frame.task is actual_task:
             return
 
-        # Find the task frame with matching ID
-        for frame in self.task_list.get_children():
-            if hasattr(frame, "task") and frame.task.get("id") == task_id:
-                # Update the frame's task data with the actual data
-                frame.task.update(actual_task)
-                task = frame.task
-
-                # Update alarm checkbox if it exists
-                if hasattr(frame, "alarm_check"):
-                    current_alarm_state = frame.alarm_check.get_active()
-                    new_alarm_state = task.get("alarm", False)
-
-                    if current_alarm_state != new_alarm_state:
-                        # Block signal to avoid triggering save_current_tasks
-                        frame.alarm_check.handler_block_by_func(self.on_alarm_toggled)
-                        frame.alarm_check.set_active(new_alarm_state)
-                        frame.alarm_check.handler_unblock_by_func(self.on_alarm_toggled)
-
-                # Update alarm time if it exists
-                if hasattr(frame, "alarm_time") and task.get("alarm_time"):
-                    current_alarm_time = frame.alarm_time.get_text()
-                    new_alarm_time = task.get("alarm_time", "")
-                    if current_alarm_time != new_alarm_time:
-                        frame.alarm_time.set_text(new_alarm_time)
-
-                # Update time entry if it exists
-                if hasattr(frame, "time_entry"):
-                    current_time = frame.time_entry.get_text()
-                    new_time = task.get("time", "")
-                    if current_time != new_time:
-                        frame.time_entry.set_text(new_time)
-                        # Update alarm visibility based on new time
-                        is_valid = self._is_valid_time(new_time)
-                        self._update_alarm_visibility(frame.time_entry, is_valid)
-
-                # Update description if it exists
-                if hasattr(frame, "desc_view"):
-                    buffer = frame.desc_view.get_buffer()
-                    current_text = buffer.get_text(
-                        buffer.get_start_iter(), buffer.get_end_iter(), False
-                    )
-                    new_text = task.get("description", "")
-                    if current_text != new_text:
-                        buffer.set_text(new_text)
-
-                # Update profile name if it exists (user indicator)
-                if hasattr(frame, "user_label"):
-                    current_user = frame.user_label.get_text()
-                    new_user = task.get("profile_name", "")
-                    if current_user != new_user:
-                        frame.user_label.set_text(new_user)
-
-                # Update color visually (the draw area will update on next redraw)
-                if hasattr(frame, "draw_area"):
-                    frame.draw_area.queue_draw()
-
-                break
+        # Echoes and rebroadcasts often change nothing the row shows
+        changed = not self._row_fields_equal(frame.task, actual_task)
+
+        # Update the frame's task data with the actual data
+        frame.task.update(actual_task)
+        if changed:
+            with self._batch_ui_updates():
+                self._refresh_task_row(frame)
+
+    def _row_fields_equal(self, task, other):
+        """Check whether two versions of a task look the same in a task row"""
+        return all(task.get(field) == other.get(field) for field in ROW_FIELDS)
+
+    def _find_task_position(self, date_str, task_id):
+        """Index of a task in self.tasks[date_str], or None if it is not there"""
+        day_tasks = self.tasks.get(date_str)
+        if not day_tasks:
+            return None
+
+        # Positions go stale when the list changes (e.g. remote sync, deletes),
+        # so a hit is checked against the list and the map rebuilt on a miss
+        positions = self._task_positions.get(date_str)
+        position = positions.get(task_id) if positions is not None else None
+        if (
+            position is None
+            or position >= len(day_tasks)
+            or day_tasks[position].get("id") != task_id
+        ):
+            positions = self._task_positions[date_str] = {
+                task.get("id"): i for i, task in enumerate(day_tasks)
+            }
+            position = positions.get(task_id)
+        return position
+
+    def _refresh_task_row(self, frame):
+        """Push a row's task data into its widgets"""
+        task = frame.task
+
+        # Widgets of a row with unsaved edits may differ from the cached
+        # values, so only those rows are read back
+        was_dirty = frame in self._dirty_rows
+
+        # Update alarm checkbox
+        if was_dirty:
+            current_alarm_state = frame.alarm_check.get_active()
+        else:
+            current_alarm_state = frame._last_alarm
+        new_alarm_state = task.get("alarm", False)
+
+        if current_alarm_state != new_alarm_state:
+            # Block signal to avoid triggering save_current_tasks
+            frame.alarm_check.handler_block(frame._alarm_toggled_id)
+            frame.alarm_check.set_active(new_alarm_state)
+            frame.alarm_check.handler_unblock(frame._alarm_toggled_id)
+        frame._last_alarm = new_alarm_state
+
+        # Update time entry
+        if was_dirty:
+            current_time = frame.time_entry.get_text()
+        else:
+            current_time = frame._last_time
+        new_time = task.get("time", "")
+        if current_time != new_time:
+            # Remote data is not a local edit - don't restamp and echo it back
+            frame.time_entry.handler_block(frame._time_changed_id)
+            frame.time_entry.set_text(new_time)
+            frame.time_entry.handler_unblock(frame._time_changed_id)
+            frame._last_time = new_time
+            # Update alarm visibility based on new time
+            is_valid = self._is_valid_time(new_time)
+            self._update_alarm_visibility(frame.time_entry, is_valid)
+
+        # Update description - the buffer is only copied out for edited rows
+        buffer = frame.desc_view.get_buffer()
+        if was_dirty:
+            current_text = buffer.get_text(
+                buffer.get_start_iter(), buffer.get_end_iter(), False
+            )
+        else:
+            current_text = frame._last_desc
+        new_text = task.get("description", "")
+        if current_text != new_text:
+            # Remote data is not a local edit - don't restamp and echo it back
+            buffer.handler_block(frame._desc_changed_id)
+            buffer.set_text(new_text)
+            buffer.handler_unblock(frame._desc_changed_id)
+            buffer.set_modified(False)
+            frame._last_desc = new_text
+
+        # Writing remote values is not an edit - the widgets match the cache
+        if not was_dirty:
+            self._dirty_rows.discard(frame)
+
+        # Update color visually - rows that are not mapped draw when shown
+        if frame.color_draw.get_mapped():
+            self._queue_redraw(frame.color_draw)
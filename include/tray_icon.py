@@ -2,57 +2,154 @@
 Modern tray icon functionality using proper app indicators
 """
 
-import io
-import logging
+import math
 import os
 import sys
-from datetime import datetime
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
 
 from gi.repository import Gdk, GdkPixbuf, GLib, Gtk
 
-# Try to import PIL for badge functionality
+# Badges are drawn with cairo straight onto a surface; PIL is the fallback
 try:
-    from PIL import Image, ImageDraw, ImageFont
+    import cairo
 
-    PIL_AVAILABLE = True
+    CAIRO_AVAILABLE = True
 except ImportError:
-    PIL_AVAILABLE = False
+    CAIRO_AVAILABLE = False
+
+# PIL is only needed to render badges, so it is imported on first use
+# (see _load_pil) - None until the import has been tried
+PIL_AVAILABLE = None
+Image = ImageDraw = ImageFont = None
 
 # Import debug logger
 from include.debug_logger import get_debug_logger
 
+# Rendered badge icons kept for reuse, keyed by the displayed count - large
+# enough for every count a badge can show (0-99)
+BADGE_CACHE_SIZE = 100
+
+# Larger icons are scaled down to this size (or the tray's, if bigger) before
+# badges are drawn - the badge keeps its proportions down to about 50 px
+BADGE_ICON_SIZE = 64
+
+# Badge fill colour (#f44336) as cairo RGB components
+BADGE_RGB = (0xF4 / 255, 0x43 / 255, 0x36 / 255)
+
+# Badge update requests within this window are collapsed into one update
+BADGE_UPDATE_DELAY_MS = 50
+
+# Badge font resolved on an earlier run, so warm starts skip font discovery
+FONT_PATH_CACHE_FILE = os.path.join(
+    os.path.expanduser("~/.cache"), "calan", "fontpath"
+)
+
+
+def _load_pil():
+    """Import PIL for badge functionality, returning whether it is available"""
+    global PIL_AVAILABLE, Image, ImageDraw, ImageFont
+    if PIL_AVAILABLE is None:
+        try:
+            from PIL import Image, ImageDraw, ImageFont
+
+            PIL_AVAILABLE = True
+            # Pillow-SIMD reports its own version here (e.g. "9.0.0.post1")
+            get_debug_logger().logger.debug(
+                "Loaded Pillow %s for badge rendering", Image.__version__
+            )
+        except ImportError:
+            PIL_AVAILABLE = False
+    return PIL_AVAILABLE
+
+
+@dataclass
+class _BlinkState:
+    """Icons and timer of an active tray icon blink"""
+
+    __slots__ = (
+        "timer_id",
+        "state",
+        "original_icon",
+        "badge_icon",
+        "transparent_icon",
+        "badge_pixbuf",
+        "transparent_pixbuf",
+    )
+
+    timer_id: Optional[int]  # GLib source id, None until the timer is started
+    state: bool  # True when the next tick shows the badge icon
+    original_icon: str
+    badge_icon: str
+    transparent_icon: str
+    badge_pixbuf: object  # GdkPixbuf.Pixbuf, StatusIcon only
+    transparent_pixbuf: object
+
 
 class TrayIcon:
-    def create_tray_icon(self):
-        """Create system tray icon using modern approach"""
+    def init_tray_state(self):
+        """Set up badge and blink state, before the tray icon itself exists"""
         self.debug_logger = get_debug_logger()
-        self.debug_logger.logger.info("Creating modern tray icon")
-        self.debug_logger.logger.info(f"Platform: {sys.platform}")
 
         # Store reference to main app
         self.main_app = self
 
-        # FIXED: Cache font paths during initialization for better performance
-        self.font_paths_cache = self._discover_font_paths()
-        self.debug_logger.logger.debug(
-            f"Cached {len(self.font_paths_cache)} font paths"
-        )
+        # Badge font paths, None until discovered - loaded fonts are memoized
+        # by size
+        self.font_paths_cache = None
+        self._font_path = None
+        self._font_by_size = {}
+
+        # Only PIL badges need a font file (cairo badges never do), and finding
+        # one may run fc-match, so it is done off the UI thread
+        if not CAIRO_AVAILABLE:
+            threading.Thread(
+                target=self._discover_fonts_in_background, daemon=True
+            ).start()
+
+        # Blinking state for tray icon, None while not blinking
+        self._blink = None
+
+        # Source id of the queued badge update, 0 if none (schedule_badge_update)
+        self._badge_update_pending = 0
 
-        # Blinking state for tray icon
-        self.tray_blink_timer_id = None
-        self.tray_blink_state = False
-        self.tray_blink_original_icon = None
-        self.tray_blink_badge_icon = None
-        self.tray_blink_transparent_icon = None
+        # Badge pixbufs by displayed count (least recently shown first),
+        # rendered from the (icon path, mtime) in _badge_cache_icon
+        self._badge_pixbuf_cache = OrderedDict()
+        self._badge_cache_icon = None
+
+        # Base icon loaded for badge rendering, kept while icon_path is unchanged
+        self._cached_base_img = None
+        self._cached_base_path = None
+
+        # (wall clock time the day ends, today's YYYY-MM-DD) for _today_str
+        self._today_cache = (0.0, "")
+
+        # Set by create_tray_icon - badge and blink updates wait for it
+        self._tray_created = False
+
+    def create_tray_icon(self):
+        """Create system tray icon using modern approach"""
+        self.debug_logger.logger.info("Creating modern tray icon")
+        self.debug_logger.logger.info("Platform: %s", sys.platform)
 
         # Log icon path for debugging
         if hasattr(self, "icon_path"):
             self.debug_logger.logger.debug(
-                f"Icon path: {self.icon_path}, exists: {os.path.exists(self.icon_path)}"
+                "Icon path: %s, exists: %s",
+                self.icon_path,
+                os.path.exists(self.icon_path),
             )
         else:
             self.debug_logger.logger.warning("No icon_path attribute found")
 
+        # Tray icon resolved once and reused by the tray and blink code
+        self._resolved_icon_name = self._get_icon_name()
+
         # First try AppIndicator3 if on Linux
         if sys.platform.startswith("linux"):
             # Force StatusIcon for better badge support
@@ -68,13 +165,19 @@ class TrayIcon:
         # Fallback to native GTK StatusIcon
         if self._try_gtk_status_icon():
             self.debug_logger.logger.info("Using Gtk.StatusIcon for tray")
-            return
         else:
             self.debug_logger.logger.info("StatusIcon failed, using fallback")
 
-        # Last resort: simple fallback
-        self.debug_logger.logger.warning("Using fallback tray implementation")
-        self._create_fallback_tray()
+            # Last resort: simple fallback
+            self.debug_logger.logger.warning("Using fallback tray implementation")
+            self._create_fallback_tray()
+
+        self._tray_created = True
+
+        # Initial badge update now that the tray icon exists
+        self.debug_logger.logger.debug("Performing initial badge update")
+        self.update_tray_icon_badge()
+        return False  # Run once when used as an idle callback
 
     def _try_app_indicator(self):
         """Try to use AppIndicator3 (Linux)"""
@@ -82,10 +185,13 @@ class TrayIcon:
             # Import AppIndicator3
             from gi.repository import AppIndicator3
 
+            # Kept for quit_application, so the module is imported only once
+            self._AppIndicator3 = AppIndicator3
+
             # Create app indicator
             self.app_indicator = AppIndicator3.Indicator.new(
                 "calendar-app-indicator",
-                self._get_icon_name(),
+                self._resolved_icon_name,
                 AppIndicator3.IndicatorCategory.APPLICATION_STATUS,
             )
             self.app_indicator.set_status(AppIndicator3.IndicatorStatus.ACTIVE)
@@ -110,7 +216,7 @@ class TrayIcon:
             and self.icon_path is not None
             and os.path.exists(self.icon_path)
         ):
-            self.debug_logger.logger.debug(f"Using custom icon: {self.icon_path}")
+            self.debug_logger.logger.debug("Using custom icon: %s", self.icon_path)
             return self.icon_path
 
         # Fallback to system icon names
@@ -120,20 +226,46 @@ class TrayIcon:
             "calendar",
             "gtk-preferences",
         ]
+        theme = getattr(self, "_icon_theme", None)
+        if theme is None:
+            theme = self._icon_theme = Gtk.IconTheme.get_default()
+            # The resolved name only goes stale when the icon theme changes
+            theme.connect("changed", self._on_icon_theme_changed)
         for icon_name in system_icons:
-            theme = Gtk.IconTheme.get_default()
             if theme.has_icon(icon_name):
-                self.debug_logger.logger.debug(f"Using system icon: {icon_name}")
+                self.debug_logger.logger.debug("Using system icon: %s", icon_name)
                 return icon_name
 
         self.debug_logger.logger.warning("No suitable icon found, using fallback")
         return "gtk-missing-image"
 
+    def _on_icon_theme_changed(self, theme):
+        """Re-resolve the tray icon name for the new icon theme"""
+        icon_name = self._get_icon_name()
+        if icon_name == getattr(self, "_resolved_icon_name", None):
+            return
+        self._resolved_icon_name = icon_name
+
+        # A blinking icon restores the original icon saved when it started
+        if self._blink is None:
+            if hasattr(self, "app_indicator"):
+                self.app_indicator.set_icon(icon_name)
+            elif hasattr(self, "tray_icon") and self.tray_icon:
+                self._set_status_icon(icon_name)
+
     def _create_app_indicator_menu(self):
         """Create menu for AppIndicator3"""
         try:
             menu = Gtk.Menu()
 
+            # Task count display (non-clickable), shown only while tasks are due
+            self._count_item = Gtk.MenuItem(label="")
+            self._count_item.set_sensitive(False)
+            menu.append(self._count_item)
+
+            self._count_separator = Gtk.SeparatorMenuItem()
+            menu.append(self._count_separator)
+
             # Show/Hide item
             show_item = Gtk.MenuItem(label="Show/Hide")
             show_item.connect("activate", self._on_show_hide)
@@ -149,6 +281,9 @@ class TrayIcon:
             menu.append(quit_item)
 
             menu.show_all()
+            self._count_item.hide()
+            self._count_separator.hide()
+            self._menu = menu
             self.app_indicator.set_menu(menu)
 
         except Exception as e:
@@ -160,18 +295,18 @@ class TrayIcon:
             self.tray_icon = Gtk.StatusIcon()
 
             # Set icon using the same method
-            icon_name = self._get_icon_name()
+            icon_name = self._resolved_icon_name
 
             # Check if it's a file path or icon name
             if icon_name is not None and os.path.exists(icon_name):
                 self.tray_icon.set_from_file(icon_name)
                 self.debug_logger.logger.debug(
-                    f"StatusIcon: Set from file: {icon_name}"
+                    "StatusIcon: Set from file: %s", icon_name
                 )
             else:
                 self.tray_icon.set_from_icon_name(icon_name)
                 self.debug_logger.logger.debug(
-                    f"StatusIcon: Set from icon name: {icon_name}"
+                    "StatusIcon: Set from icon name: %s", icon_name
                 )
 
             self.tray_icon.set_tooltip_text("CaLAN")
@@ -230,55 +365,66 @@ class TrayIcon:
         # Disabled to prevent conflicts with left-click activation
         pass
 
+    def schedule_badge_update(self):
+        """Queue one badge update for a burst of task changes"""
+        if self._badge_update_pending:
+            return
+        self._badge_update_pending = GLib.timeout_add(
+            BADGE_UPDATE_DELAY_MS, self._run_pending_badge_update
+        )
+
+    def _run_pending_badge_update(self):
+        """Run the badge update queued by schedule_badge_update"""
+        self._badge_update_pending = 0
+        self.update_tray_icon_badge()
+        return False
+
     def update_tray_icon_badge(self):
         """Update tray icon with task count badge - FIXED NULL REFERENCE"""
+        if not self._tray_created:
+            return False  # create_tray_icon does the first update
+
         try:
             # Count today's tasks
-            today_str = datetime.now().strftime("%Y-%m-%d")
-            task_count = len(self.main_app.tasks.get(today_str, []))
+            task_count = self._count_today_tasks()
 
             # Always update _last_badge_count to ensure blinking uses correct count
             self._last_badge_count = task_count
 
-            # Only update visual badge if task count has changed
-            if (
-                hasattr(self, "_previous_badge_count")
-                and self._previous_badge_count == task_count
-            ):
+            # Only update visual badge if task count has changed - this is the
+            # whole cost of an update whether or not the window is visible
+            previous_count = getattr(self, "_previous_badge_count", None)
+            if previous_count == task_count:
                 return False  # FIXED: Return False to prevent infinite loop
 
-            self._previous_badge_count = task_count
-
             # Stop any active blinking to ensure badge is updated correctly
-            if self.tray_blink_timer_id is not None:
+            if self._blink is not None:
                 self.stop_tray_blinking()
 
-            # If app is minimized and task count increased, start blinking
+            # BUGFIX: Compare against the count from before this update, which
+            # was previously overwritten first so blinking could never start
             if (
                 not self.main_app.get_property("visible")
-                and hasattr(self, "_previous_badge_count")
-                and task_count > self._previous_badge_count
+                and previous_count is not None
+                and task_count > previous_count
             ):
-                self.start_tray_blinking()
+                self.start_tray_blinking(task_count)
 
             self._previous_badge_count = task_count
 
             # Log which tray implementation we're using
             if hasattr(self, "app_indicator"):
-                if self.debug_logger.logger.isEnabledFor(logging.INFO):
-                    self.debug_logger.logger.info(
-                        f"Updating AppIndicator badge with {task_count} tasks"
-                    )
+                self.debug_logger.logger.info(
+                    "Updating AppIndicator badge with %s tasks", task_count
+                )
             elif hasattr(self, "tray_icon") and self.tray_icon:
-                if self.debug_logger.logger.isEnabledFor(logging.INFO):
-                    self.debug_logger.logger.info(
-                        f"Updating StatusIcon badge with {task_count} tasks"
-                    )
+                self.debug_logger.logger.info(
+                    "Updating StatusIcon badge with %s tasks", task_count
+                )
             else:
-                if self.debug_logger.logger.isEnabledFor(logging.WARNING):
-                    self.debug_logger.logger.warning(
-                        "No tray implementation found for badge update"
-                    )
+                self.debug_logger.logger.warning(
+                    "No tray implementation found for badge update"
+                )
 
             # Update based on which tray method we're using
             if hasattr(self, "app_indicator"):
@@ -291,7 +437,7 @@ class TrayIcon:
 
         return False  # FIXED: Always return False when used as idle callback
 
-    def _create_blinking_icons(self):
+    def _create_blinking_icons(self, blink):
         """Create both normal and transparent icons with badges for blinking"""
         try:
             if (
@@ -299,195 +445,183 @@ class TrayIcon:
                 and self.icon_path
                 and os.path.exists(self.icon_path)
             ):
-                # Load original icon to get dimensions
-                import tempfile
-
-                from PIL import Image, ImageDraw
-
-                original_img = Image.open(self.icon_path).convert("RGBA")
-                width, height = original_img.size
-
-                # Create transparent image with same dimensions
-                transparent_img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-
                 # Create normal icon with badge
-                badge_img = original_img.copy()
                 task_count = getattr(self, "_last_badge_count", 0)
+                badge_pixbuf = self._render_badge_pixbuf(
+                    str(self.icon_path), task_count
+                )
+                if badge_pixbuf is None:
+                    raise RuntimeError("Could not render badge icon")
 
-                if task_count > 0:
-                    draw = ImageDraw.Draw(badge_img)
-                    # Draw badge
-                    badge_size = max(int(width * 0.65), 32)
-                    badge_x = width - badge_size - 2
-                    badge_y = 2
-
-                    draw.ellipse(
-                        [badge_x, badge_y, badge_x + badge_size, badge_y + badge_size],
-                        fill="#f44336",
-                        outline="white",
-                        width=3,
-                    )
-
-                    # Draw number
-                    font = self._get_font(int(badge_size * 0.7))
-                    text = str(min(task_count, 99))
-
-                    if font:
-                        bbox = draw.textbbox((0, 0), text, font=font)
-                        text_width = bbox[2] - bbox[0]
-                        text_height = bbox[3] - bbox[1]
+                # Create transparent image with same dimensions
+                transparent_pixbuf = GdkPixbuf.Pixbuf.new(
+                    GdkPixbuf.Colorspace.RGB,
+                    True,
+                    8,
+                    badge_pixbuf.get_width(),
+                    badge_pixbuf.get_height(),
+                )
+                transparent_pixbuf.fill(0x00000000)
 
-                        text_x = badge_x + (badge_size - text_width) // 2
-                        text_y = badge_y + (badge_size - text_height) // 2 - bbox[1]
+                # StatusIcon blinks between pixbufs built once here, instead
+                # of loading a PNG file from disk on every tick
+                blink.transparent_pixbuf = transparent_pixbuf
+                blink.badge_pixbuf = badge_pixbuf
 
-                        draw.text((text_x, text_y), text, fill="white", font=font)
-                    else:
-                        # Fallback text drawing
-                        text_width = len(text) * 8
-                        text_height = 12
-                        text_x = badge_x + (badge_size - text_width) // 2
-                        text_y = badge_y + (badge_size - text_height) // 2
-                        draw.text((text_x, text_y), text, fill="white")
+                # AppIndicator only takes icon paths
+                if hasattr(self, "app_indicator"):
+                    import tempfile
 
-                # Save icons to temporary files
-                temp_dir = tempfile.gettempdir()
+                    temp_dir = tempfile.gettempdir()
 
-                # Save transparent icon
-                transparent_path = os.path.join(temp_dir, "calan_transparent_icon.png")
-                transparent_img.save(transparent_path, "PNG")
-                self.tray_blink_transparent_icon = transparent_path
+                    # Save transparent icon
+                    transparent_path = os.path.join(
+                        temp_dir, "calan_transparent_icon.png"
+                    )
+                    transparent_pixbuf.savev(transparent_path, "png", [], [])
+                    blink.transparent_icon = transparent_path
 
-                # Save badge icon
-                badge_path = os.path.join(temp_dir, "calan_badge_icon.png")
-                badge_img.save(badge_path, "PNG")
-                self.tray_blink_badge_icon = badge_path
+                    # Save badge icon
+                    badge_path = os.path.join(temp_dir, "calan_badge_icon.png")
+                    badge_pixbuf.savev(badge_path, "png", [], [])
+                    blink.badge_icon = badge_path
 
-                self.debug_logger.logger.debug(
-                    f"Created blinking icons: transparent={transparent_path}, badge={badge_path}"
-                )
+                self.debug_logger.logger.debug("Created blinking icons")
 
             else:
                 # Fallback: use icon names if available
-                self.tray_blink_transparent_icon = "image-missing"
-                self.tray_blink_badge_icon = self.tray_blink_original_icon
+                blink.transparent_icon = "image-missing"
+                blink.badge_icon = blink.original_icon
 
         except Exception as e:
-            self.debug_logger.logger.error(f"Failed to create blinking icons: {e}")
+            self.debug_logger.logger.error("Failed to create blinking icons: %s", e)
             # Fallback to using original icon (no blinking)
-            self.tray_blink_transparent_icon = self.tray_blink_original_icon
-            self.tray_blink_badge_icon = self.tray_blink_original_icon
+            blink.transparent_icon = blink.original_icon
+            blink.badge_icon = blink.original_icon
+            blink.transparent_pixbuf = None
+            blink.badge_pixbuf = None
+
+    def _image_to_pixbuf(self, img):
+        """Convert an RGBA PIL image to a GdkPixbuf from its raw pixels"""
+        width, height = img.size
+        return GdkPixbuf.Pixbuf.new_from_bytes(
+            GLib.Bytes.new(img.tobytes()),
+            GdkPixbuf.Colorspace.RGB,
+            True,
+            8,
+            width,
+            height,
+            width * 4,
+        )
+
+    def _count_today_tasks(self):
+        """Number of tasks on today's date"""
+        tasks = self.main_app.tasks
+        today_str = self._today_str()
+        return len(tasks[today_str]) if today_str in tasks else 0
+
+    def _today_str(self):
+        """Today's date as YYYY-MM-DD, formatted once per day"""
+        day_ends_at, today_str = self._today_cache
+        if time.time() >= day_ends_at:
+            now = datetime.now()
+            today_str = now.strftime("%Y-%m-%d")
+            midnight = datetime.combine(
+                now.date() + timedelta(days=1), datetime.min.time()
+            )
+            self._today_cache = (midnight.timestamp(), today_str)
+        return today_str
 
-    def start_tray_blinking(self):
+    def start_tray_blinking(self, task_count=None):
         """Start blinking tray icon when app is minimized and new updates arrive"""
-        if self.tray_blink_timer_id is not None:
-            return  # Already blinking
+        if self._blink is not None or not self._tray_created:
+            return  # Already blinking, or no tray icon to blink yet
 
         self.debug_logger.logger.info("Starting tray icon blinking")
         self.debug_logger.log_tray_blink(True, "new_updates_detected")
 
         # Store original icon state
-        self.tray_blink_original_icon = self._get_icon_name()
-        self.tray_blink_state = True
+        original_icon = self._resolved_icon_name
+        blink = _BlinkState(
+            timer_id=None,
+            state=True,
+            original_icon=original_icon,
+            badge_icon=original_icon,
+            transparent_icon=original_icon,
+            badge_pixbuf=None,
+            transparent_pixbuf=None,
+        )
 
         # Ensure _last_badge_count is up to date before creating blinking icons
-        today_str = datetime.now().strftime("%Y-%m-%d")
-        task_count = len(self.main_app.tasks.get(today_str, []))
+        if task_count is None:
+            task_count = self._count_today_tasks()
         self._last_badge_count = task_count
 
         # Create blinking icons (with and without badges)
-        self._create_blinking_icons()
+        self._create_blinking_icons(blink)
 
-        def blink_callback():
-            if self.tray_blink_timer_id is None:
-                return False
+        # Blink once a second - second timers let GLib batch the wakeups
+        blink.timer_id = GLib.timeout_add_seconds(1, self._on_blink_tick)
+        self._blink = blink
 
-            # Toggle between badge icon and transparent icon
-            if hasattr(self, "app_indicator"):
-                # For AppIndicator, toggle between icons
-                if self.tray_blink_state:
-                    self.app_indicator.set_icon(self.tray_blink_badge_icon)
-                else:
-                    self.app_indicator.set_icon(self.tray_blink_transparent_icon)
-            elif hasattr(self, "tray_icon") and self.tray_icon:
-                # For StatusIcon, toggle between icons
-                if self.tray_blink_state:
-                    if self.tray_blink_badge_icon and os.path.exists(
-                        self.tray_blink_badge_icon
-                    ):
-                        self.tray_icon.set_from_file(self.tray_blink_badge_icon)
-                    else:
-                        self.tray_icon.set_from_icon_name(self.tray_blink_original_icon)
-                else:
-                    if self.tray_blink_transparent_icon and os.path.exists(
-                        self.tray_blink_transparent_icon
-                    ):
-                        self.tray_icon.set_from_file(self.tray_blink_transparent_icon)
-                    else:
-                        self.tray_icon.set_from_icon_name("image-missing")  # Fallback
-
-            self.tray_blink_state = not self.tray_blink_state
-            return True  # Continue blinking
-
-        # Start blinking every 500ms
-        self.tray_blink_timer_id = GLib.timeout_add(500, blink_callback)
+    def _on_blink_tick(self):
+        """Toggle the tray icon between its badge and transparent icons"""
+        b = self._blink
+        if b is None:
+            return False
+
+        # Toggle between badge icon and transparent icon
+        if hasattr(self, "app_indicator"):
+            # For AppIndicator, toggle between icons
+            if b.state:
+                self.app_indicator.set_icon(b.badge_icon)
+            else:
+                self.app_indicator.set_icon(b.transparent_icon)
+        elif hasattr(self, "tray_icon") and self.tray_icon:
+            # For StatusIcon, toggle between icons
+            pixbuf = b.badge_pixbuf if b.state else b.transparent_pixbuf
+            if pixbuf is not None:
+                self.tray_icon.set_from_pixbuf(pixbuf)
+            else:
+                self._set_status_icon(b.badge_icon if b.state else b.transparent_icon)
+
+        b.state = not b.state
+        return True  # Continue blinking
 
     def stop_tray_blinking(self):
         """Stop blinking tray icon and restore normal state"""
-        if self.tray_blink_timer_id is not None:
+        blink = self._blink
+        if blink is not None:
             self.debug_logger.logger.info("Stopping tray icon blinking")
             self.debug_logger.log_tray_blink(False, "app_restored")
-            GLib.source_remove(self.tray_blink_timer_id)
-            self.tray_blink_timer_id = None
+            GLib.source_remove(blink.timer_id)
+            self._blink = None
 
             # Restore original icon and badge
             if hasattr(self, "app_indicator"):
-                self.app_indicator.set_icon(self.tray_blink_original_icon)
+                self.app_indicator.set_icon(blink.original_icon)
             elif hasattr(self, "tray_icon") and self.tray_icon:
-                if self.tray_blink_original_icon and os.path.exists(
-                    self.tray_blink_original_icon
-                ):
-                    self.tray_icon.set_from_file(self.tray_blink_original_icon)
-                else:
-                    self.tray_icon.set_from_icon_name(self.tray_blink_original_icon)
+                self._set_status_icon(blink.original_icon)
                 # Restore badge using the normal update method
                 self._update_status_icon_badge(self._last_badge_count)
 
-            self.tray_blink_state = False
-            self.tray_blink_original_icon = None
-            self.tray_blink_transparent_icon = None
-            self.tray_blink_badge_icon = None
+    def _set_status_icon(self, icon):
+        """Set the StatusIcon from an icon file path or icon name"""
+        if icon and os.path.exists(icon):
+            self.tray_icon.set_from_file(icon)
+        else:
+            self.tray_icon.set_from_icon_name(icon or "image-missing")
 
     def _update_app_indicator_badge(self, task_count):
         """Update AppIndicator badge"""
         try:
-            # For AppIndicator, update the menu to show task count
-            menu = Gtk.Menu()
-
-            # Task count display (non-clickable)
-            if task_count > 0:
-                count_label = f"Tasks today: {task_count}"
-                count_item = Gtk.MenuItem(label=count_label)
-                count_item.set_sensitive(False)
-                menu.append(count_item)
-
-                separator1 = Gtk.SeparatorMenuItem()
-                menu.append(separator1)
-
-            # Show/Hide
-            show_item = Gtk.MenuItem(label="Show/Hide")
-            show_item.connect("activate", self._on_show_hide)
-            menu.append(show_item)
-
-            separator2 = Gtk.SeparatorMenuItem()
-            menu.append(separator2)
-
-            # Quit
-            quit_item = Gtk.MenuItem(label="Quit")
-            quit_item.connect("activate", self._on_quit)
-            menu.append(quit_item)
-
-            menu.show_all()
-            self.app_indicator.set_menu(menu)
+            # For AppIndicator, update the count item of the existing menu
+            count_item = getattr(self, "_count_item", None)
+            if count_item is not None:
+                if task_count > 0:
+                    count_item.set_label(f"Tasks today: {task_count}")
+                count_item.set_visible(task_count > 0)
+                self._count_separator.set_visible(task_count > 0)
 
             # Also update tooltip
             tooltip = (
@@ -505,92 +639,56 @@ class TrayIcon:
 
     def _update_status_icon_badge(self, task_count):
         """Update StatusIcon badge - FIXED NULL REFERENCE"""
-        if self.debug_logger.logger.isEnabledFor(logging.INFO):
-            self.debug_logger.logger.info(
-                f"StatusIcon badge update with {task_count} tasks"
-            )
+        self.debug_logger.logger.info(
+            "StatusIcon badge update with %s tasks", task_count
+        )
 
-        if not PIL_AVAILABLE:
-            if self.debug_logger.logger.isEnabledFor(logging.WARNING):
-                self.debug_logger.logger.warning("PIL not available for badge update")
+        if not CAIRO_AVAILABLE and not _load_pil():
+            self.debug_logger.logger.warning(
+                "Neither cairo nor PIL available for badge update"
+            )
             return
 
         try:
             # FIXED: Proper null reference check for icon_path
             if not hasattr(self, "icon_path") or not self.icon_path:
-                if self.debug_logger.logger.isEnabledFor(logging.WARNING):
-                    self.debug_logger.logger.warning(
-                        "No valid icon_path available for badge update"
-                    )
+                self.debug_logger.logger.warning(
+                    "No valid icon_path available for badge update"
+                )
                 return
 
             icon_path = str(self.icon_path)  # Ensure it's a string
-            if not os.path.exists(icon_path):
-                if self.debug_logger.logger.isEnabledFor(logging.WARNING):
-                    self.debug_logger.logger.warning(
-                        f"Icon path does not exist: {icon_path}"
-                    )
-                return
-
-            if self.debug_logger.logger.isEnabledFor(logging.INFO):
-                self.debug_logger.logger.info(
-                    f"Updating badge with {task_count} tasks using icon: {icon_path}"
-                )
-
-            # Load and modify icon with badge
             try:
-                img = Image.open(icon_path).convert("RGBA")
-            except Exception as e:
-                self.debug_logger.logger.error(f"Failed to load icon {icon_path}: {e}")
+                icon_mtime = os.stat(icon_path).st_mtime
+            except OSError:
+                self.debug_logger.logger.warning(
+                    "Icon path does not exist: %s", icon_path
+                )
                 return
 
-            if task_count > 0:
-                draw = ImageDraw.Draw(img)
-                width, height = img.size
-
-                # Draw badge
-                badge_size = max(int(width * 0.65), 32)
-                badge_x = width - badge_size - 2
-                badge_y = 2
-
-                draw.ellipse(
-                    [badge_x, badge_y, badge_x + badge_size, badge_y + badge_size],
-                    fill="#f44336",
-                    outline="white",
-                    width=3,
-                )
+            self.debug_logger.logger.info(
+                "Updating badge with %s tasks using icon: %s", task_count, icon_path
+            )
 
-                # Draw number
-                font = self._get_font(int(badge_size * 0.7))
-                text = str(min(task_count, 99))
-
-                if font:
-                    bbox = draw.textbbox((0, 0), text, font=font)
-                    text_width = bbox[2] - bbox[0]
-                    text_height = bbox[3] - bbox[1]
-
-                    text_x = badge_x + (badge_size - text_width) // 2
-                    text_y = badge_y + (badge_size - text_height) // 2 - bbox[1]
-
-                    draw.text((text_x, text_y), text, fill="white", font=font)
-                else:
-                    # Fallback text drawing
-                    text_width = len(text) * 8
-                    text_height = 12
-                    text_x = badge_x + (badge_size - text_width) // 2
-                    text_y = badge_y + (badge_size - text_height) // 2
-                    draw.text((text_x, text_y), text, fill="white")
-
-            # Convert to pixbuf and update icon
-            buffer = io.BytesIO()
-            img.save(buffer, format="PNG")
-            buffer.seek(0)
-
-            loader = GdkPixbuf.PixbufLoader.new_with_type("png")
-            loader.write(buffer.read())
-            loader.close()
-
-            pixbuf = loader.get_pixbuf()
+            # Badges for recently shown counts are reused as rendered, until
+            # the icon file is replaced or edited
+            icon_key = (icon_path, icon_mtime)
+            if self._badge_cache_icon != icon_key:
+                self._badge_pixbuf_cache.clear()
+                self._badge_cache_icon = icon_key
+                self._cached_base_path = None  # Reload the base icon too
+            cache_key = min(task_count, 99)
+            pixbuf = self._badge_pixbuf_cache.get(cache_key)
+            if pixbuf is None:
+                pixbuf = self._render_badge_pixbuf(icon_path, task_count)
+                if pixbuf is None:
+                    return
+                if len(self._badge_pixbuf_cache) >= BADGE_CACHE_SIZE:
+                    # Drop the least recently shown entry
+                    self._badge_pixbuf_cache.popitem(last=False)
+                self._badge_pixbuf_cache[cache_key] = pixbuf
+            else:
+                self._badge_pixbuf_cache.move_to_end(cache_key)
             self.tray_icon.set_from_pixbuf(pixbuf)
 
             # Update tooltip
@@ -601,31 +699,228 @@ class TrayIcon:
             )
             self.tray_icon.set_tooltip_text(tooltip)
 
-            if self.debug_logger.logger.isEnabledFor(logging.INFO):
-                self.debug_logger.logger.info("Badge update completed successfully")
+            self.debug_logger.logger.info("Badge update completed successfully")
 
         except Exception as e:
             self.debug_logger.log_exception(e, "_update_status_icon_badge")
 
-    def _get_font(self, size):
-        """Get font for badge text - FIXED: Use cached font paths for performance"""
-        # FIXED: Use cached font paths instead of discovering every time
-        for font_path in self.font_paths_cache:
-            if os.path.exists(font_path):
-                try:
-                    return ImageFont.truetype(font_path, size)
-                except Exception:
-                    continue
-
-        # Fallback to default font if no cached fonts work
+    def _render_badge_pixbuf(self, icon_path, task_count):
+        """Draw the task count badge onto the icon and return it as a pixbuf"""
+        if CAIRO_AVAILABLE:
+            return self._render_badge_cairo(icon_path, task_count)
+        if _load_pil():
+            return self._render_badge_pil(icon_path, task_count)
+        return None
+
+    def _load_base_icon(self, icon_path):
+        """Load the icon to draw badges on, once per icon path"""
+        if self._cached_base_path == icon_path:
+            return self._cached_base_img
+
+        # Draw on no more pixels than the tray shows
+        size = BADGE_ICON_SIZE
+        if hasattr(self, "tray_icon") and self.tray_icon:
+            size = max(size, self.tray_icon.get_size())
+
+        # Pixbuf for cairo rendering, RGBA image for the PIL fallback
         try:
-            return ImageFont.load_default()
-        except Exception:
+            if CAIRO_AVAILABLE:
+                base = GdkPixbuf.Pixbuf.new_from_file(icon_path)
+                width, height = base.get_width(), base.get_height()
+                if max(width, height) > size:
+                    scale = size / max(width, height)
+                    base = base.scale_simple(
+                        max(1, round(width * scale)),
+                        max(1, round(height * scale)),
+                        GdkPixbuf.InterpType.HYPER,
+                    )
+            else:
+                base = Image.open(icon_path).convert("RGBA")
+                base.thumbnail((size, size))
+        except Exception as e:
+            self.debug_logger.logger.error("Failed to load icon %s: %s", icon_path, e)
+            return None
+
+        self._cached_base_img = base
+        self._cached_base_path = icon_path
+        return base
+
+    def _render_badge_cairo(self, icon_path, task_count):
+        """Draw the badge with cairo, without any image encode/decode round trip"""
+        base = self._load_base_icon(icon_path)
+        if base is None:
+            return None
+
+        width, height = base.get_width(), base.get_height()
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
+        cr = cairo.Context(surface)
+        Gdk.cairo_set_source_pixbuf(cr, base, 0, 0)
+        cr.paint()
+
+        if task_count > 0:
+            # Same geometry as _draw_badge_on
+            badge_size = max(int(width * 0.65), 32)
+            radius = badge_size / 2
+            center_x = width - badge_size - 2 + radius
+            center_y = 2 + radius
+
+            # White outline drawn inside the badge bounds, like PIL does
+            cr.arc(center_x, center_y, radius - 1.5, 0, 2 * math.pi)
+            cr.set_source_rgb(*BADGE_RGB)
+            cr.fill_preserve()
+            cr.set_source_rgb(1, 1, 1)
+            cr.set_line_width(3)
+            cr.stroke()
+
+            # Draw number
+            text = str(min(task_count, 99))
+            cr.select_font_face("Sans", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
+            cr.set_font_size(int(badge_size * 0.7))
+            extents = cr.text_extents(text)
+            cr.move_to(
+                center_x - extents.width / 2 - extents.x_bearing,
+                center_y - extents.height / 2 - extents.y_bearing,
+            )
+            cr.show_text(text)
+
+        surface.flush()
+        return Gdk.pixbuf_get_from_surface(surface, 0, 0, width, height)
+
+    def _render_badge_pil(self, icon_path, task_count):
+        """Draw the badge with PIL, used when cairo is not available"""
+        # Copy the loaded icon and draw the badge on it
+        base = self._load_base_icon(icon_path)
+        if base is None:
             return None
+        img = base.copy()
+
+        self._draw_badge_on(img, task_count)
+
+        # Convert to pixbuf
+        return self._image_to_pixbuf(img)
+
+    def _draw_badge_on(self, img, task_count):
+        """Draw the red task count badge onto a PIL image in place (PIL fallback)"""
+        if task_count <= 0:
+            return
+
+        draw = ImageDraw.Draw(img)
+        width, height = img.size
+
+        # Draw badge
+        badge_size = max(int(width * 0.65), 32)
+        badge_x = width - badge_size - 2
+        badge_y = 2
+
+        draw.ellipse(
+            [badge_x, badge_y, badge_x + badge_size, badge_y + badge_size],
+            fill="#f44336",
+            outline="white",
+            width=3,
+        )
+
+        # Draw number
+        font = self._get_font(int(badge_size * 0.7))
+        text = str(min(task_count, 99))
+
+        if font:
+            bbox = draw.textbbox((0, 0), text, font=font)
+            text_width = bbox[2] - bbox[0]
+            text_height = bbox[3] - bbox[1]
+
+            text_x = badge_x + (badge_size - text_width) // 2
+            text_y = badge_y + (badge_size - text_height) // 2 - bbox[1]
+
+            draw.text((text_x, text_y), text, fill="white", font=font)
+        else:
+            # Fallback text drawing
+            text_width = len(text) * 8
+            text_height = 12
+            text_x = badge_x + (badge_size - text_width) // 2
+            text_y = badge_y + (badge_size - text_height) // 2
+            draw.text((text_x, text_y), text, fill="white")
+
+    def _get_font(self, size):
+        """Get font for badge text, memoized by size"""
+        font = self._font_by_size.get(size)
+        if font is not None:
+            return font
+
+        # Fonts are still being discovered - use the default font for now
+        # without memoizing it
+        if self.font_paths_cache is None:
+            try:
+                return ImageFont.load_default()
+            except Exception:
+                return None
+
+        # Load the resolved font path, moving on to the next cached path if
+        # it turns out to be unusable
+        while self._font_path:
+            try:
+                font = ImageFont.truetype(self._font_path, size)
+                break
+            except Exception:
+                paths = self.font_paths_cache
+                index = paths.index(self._font_path) + 1
+                self._font_path = paths[index] if index < len(paths) else None
+
+        if font is None:
+            # Fallback to default font if no cached fonts work
+            try:
+                font = ImageFont.load_default()
+            except Exception:
+                return None
+        self._font_by_size[size] = font
+        return font
+
+    def _discover_fonts_in_background(self):
+        """Discover badge fonts on a worker thread and hand them to the UI"""
+        GLib.idle_add(self._on_fonts_discovered, self._discover_font_paths())
+
+    def _on_fonts_discovered(self, font_paths):
+        """Switch to the discovered badge font, redrawing any earlier badge"""
+        self._resolve_font_paths(font_paths)
+        self._font_by_size.clear()
+
+        # Badges drawn so far used the default font
+        if self._badge_pixbuf_cache:
+            self._badge_pixbuf_cache.clear()
+            if self._blink is None and hasattr(self, "tray_icon") and self.tray_icon:
+                self._update_status_icon_badge(getattr(self, "_last_badge_count", 0))
+        return False
+
+    def _resolve_font_paths(self, font_paths):
+        """Store discovered font paths and pick the first as the badge font"""
+        self.font_paths_cache = font_paths
+        self._font_path = font_paths[0] if font_paths else None
+        self.debug_logger.logger.debug("Cached %s font paths", len(font_paths))
 
     def _discover_font_paths(self):
         """Discover available font paths dynamically across different systems - OPTIMIZED"""
+        # Step 1: the font resolved on a previous run
+        try:
+            with open(FONT_PATH_CACHE_FILE, encoding="utf-8") as f:
+                cached_font = f.read().strip()
+            if cached_font and os.path.exists(cached_font):
+                return [cached_font]
+        except OSError:
+            pass
+
+        # Step 2: system fontconfig - authoritative wherever it is installed
+        system_font = self._match_system_font()
+        if system_font:
+            try:
+                os.makedirs(os.path.dirname(FONT_PATH_CACHE_FILE), exist_ok=True)
+                with open(FONT_PATH_CACHE_FILE, "w", encoding="utf-8") as f:
+                    f.write(system_font)
+            except OSError as e:
+                self.debug_logger.logger.debug("Could not cache font path: %s", e)
+            return [system_font]
+
+        # Step 3 (rare): look for known bold fonts in the usual directories
         font_paths = []
+        seen = set()
 
         # Common font directories across different systems - LIMITED SET for performance
         font_dirs = [
@@ -639,9 +934,10 @@ class TrayIcon:
             # macOS font directories
             "/Library/Fonts",
             "/System/Library/Fonts",
-            # Windows font directory (if running under WSL or similar)
-            "/mnt/c/Windows/Fonts",
         ]
+        # Windows font directory (if running under WSL or similar)
+        if sys.platform.startswith("linux"):
+            font_dirs.append("/mnt/c/Windows/Fonts")
 
         # Common bold font names to look for - LIMITED SET for performance
         bold_font_files = [
@@ -663,26 +959,39 @@ class TrayIcon:
             "Helvetica-Bold.ttf",
         ]
 
-        # Expand home directories and check which font directories exist
-        existing_font_dirs = []
+        # FIXED: Non-recursive search for performance - each directory is
+        # listed once and matched against the known names, in their order.
+        # Missing directories fail the scandir itself, and is_file() is
+        # answered from the directory listing, so no separate stat calls
+        font_rank = {name: rank for rank, name in enumerate(bold_font_files)}
         for font_dir in font_dirs:
-            expanded_dir = os.path.expanduser(font_dir)
-            if os.path.exists(expanded_dir) and os.path.isdir(expanded_dir):
-                existing_font_dirs.append(expanded_dir)
-
-        # FIXED: Non-recursive search for performance
-        for font_dir in existing_font_dirs:
-            for font_file in bold_font_files:
+            font_dir = os.path.expanduser(font_dir)
+            try:
+                with os.scandir(font_dir) as entries:
+                    found = [
+                        entry.name
+                        for entry in entries
+                        if entry.name in font_rank and entry.is_file()
+                    ]
+            except OSError:
+                continue
+            found.sort(key=font_rank.__getitem__)
+            for font_file in found:
                 font_path = os.path.join(font_dir, font_file)
-                if os.path.exists(font_path):
+                if font_path not in seen:
+                    seen.add(font_path)
                     font_paths.append(font_path)
-                    # Early exit if we found enough fonts
-                    if len(font_paths) >= 3:
-                        break
-            if len(font_paths) >= 3:
-                break
 
-        # Also try to use system fontconfig if available - MOST EFFICIENT
+        # Log font discovery summary
+        if hasattr(self, "debug_logger"):
+            self.debug_logger.logger.debug(
+                "Found %s fonts for badge text", len(font_paths)
+            )
+
+        return font_paths
+
+    def _match_system_font(self):
+        """Ask fontconfig for the system bold sans font, or None if unavailable"""
         try:
             import subprocess
 
@@ -692,40 +1001,35 @@ class TrayIcon:
                 text=True,
                 timeout=1,  # Shorter timeout
             )
-            if result.returncode == 0 and os.path.exists(result.stdout.strip()):
-                system_font = result.stdout.strip()
-                if system_font not in font_paths:
-                    font_paths.insert(0, system_font)  # Prioritize system font
         except Exception:
-            pass  # fontconfig not available, continue with other methods
-
-        # Log font discovery summary
-        if hasattr(self, "debug_logger") and self.debug_logger.logger.isEnabledFor(
-            logging.DEBUG
-        ):
-            self.debug_logger.logger.debug(
-                f"Found {len(font_paths)} fonts for badge text"
-            )
-
-        return font_paths
+            return None  # fontconfig not available, continue with other methods
+        system_font = result.stdout.strip()
+        if result.returncode == 0 and system_font and os.path.exists(system_font):
+            return system_font
+        return None
 
     def quit_application(self):
         """Clean application quit"""
         self.debug_logger.logger.debug("TrayIcon: Cleaning up")
 
         # Stop blinking timer
-        if self.tray_blink_timer_id is not None:
-            GLib.source_remove(self.tray_blink_timer_id)
-            self.tray_blink_timer_id = None
+        if self._blink is not None:
+            GLib.source_remove(self._blink.timer_id)
+            self._blink = None
+
+        # Drop a queued badge update
+        if self._badge_update_pending:
+            GLib.source_remove(self._badge_update_pending)
+            self._badge_update_pending = 0
 
         # Hide tray icons
         if hasattr(self, "tray_icon") and self.tray_icon:
             self.tray_icon.set_visible(False)
 
-        if hasattr(self, "app_indicator"):
+        if hasattr(self, "app_indicator") and hasattr(self, "_AppIndicator3"):
             try:
-                from gi.repository import AppIndicator3
-
-                self.app_indicator.set_status(AppIndicator3.IndicatorStatus.PASSIVE)
+                self.app_indicator.set_status(
+                    self._AppIndicator3.IndicatorStatus.PASSIVE
+                )
             except:
                 pass
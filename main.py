@@ -13,17 +13,24 @@ Features: Visual calendar, task management, alarms, system tray, ICS storage, mu
         For everyone who calls on the name of the Lord will be saved.
 """
 
+import functools
 import logging
 import os
+import threading
+import time
+import unicodedata
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 
 import gi
 
 gi.require_version("Gtk", "3.0")
 gi.require_version("Gdk", "3.0")
 import calendar
+import colorsys
 import hashlib
+import importlib.util
 import io
-import json
 import secrets
 import subprocess
 import uuid
@@ -33,15 +40,89 @@ from datetime import datetime, timedelta
 import cairo
 from gi.repository import Gdk, GdkPixbuf, GLib, GObject, Gtk, Pango
 
-# Try to import PIL for badge functionality
-try:
-    from PIL import Image, ImageDraw, ImageFont
+# PIL provides badge functionality - the tray imports it on first use
+PIL_AVAILABLE = importlib.util.find_spec("PIL") is not None
+
+# Silence GTK deprecation noise (e.g. Gtk.StatusIcon) - PyGObject reports it
+# against the calling module, so the filter covers CaLAN's own modules and gi
+warnings.filterwarnings(
+    "ignore",
+    category=DeprecationWarning,
+    module=r"(__main__|main|include|gi)(\.|$)",
+)
+
+# CaLAN's install directory, holding icon.png and the ical data directory
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(SCRIPT_DIR, "ical")
+ICON_PATH = os.path.join(SCRIPT_DIR, "icon.png")
+
+# Style classes shared by all windows, loaded by CalendarApp._install_css
+CALENDAR_CSS = b"""
+/* Date cell hover - leaving removes the class again */
+.calan-hover-today {
+    background-color: rgba(33, 150, 243, 0.15);
+}
+.calan-hover {
+    background-color: rgba(33, 150, 243, 0.05);
+}
+
+/* Date cell under a dragged task - after hover so it wins */
+.calan-drag-motion {
+    background-color: rgba(76, 175, 80, 0.3);
+    border: 2px solid #4CAF50;
+}
+
+/* Blink animation for attention indicator */
+@keyframes blink {
+    0% { opacity: 1; }
+    50% { opacity: 0.3; }
+    100% { opacity: 1; }
+}
+
+/* Delete button */
+.calan-delete-button {
+    background-color: #f44336;
+    color: white;
+    border-radius: 8px;
+    padding: 0px;
+    min-width: 0px;
+    min-height: 0px;
+    font-size: 10px;
+    font-weight: bold;
+    border: none;
+    transition: all 200ms ease;
+}
+.calan-delete-button:hover {
+    background-color: #ff5252;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.3);
+}
+.calan-delete-button label {
+    padding: 0px;
+    margin: 0px;
+}
+
+/* Sync success button */
+.calan-sync-success {
+    background-color: #4CAF50;
+    color: white;
+    border-radius: 4px;
+    font-weight: bold;
+    transition: all 200ms ease;
+}
+"""
+
+# Set once icon.png is the default icon of every window in the process
+_ICON_LOADED = False
 
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+# Saves requested within this window are written to disk together
+SAVE_COALESCE_MS = 200
 
-warnings.filterwarnings("ignore", category=DeprecationWarning)
+# datetime.now() results are reused by timer callbacks for this long
+NOW_CACHE_SECONDS = 0.25
+
+# The day change check sleeps until midnight, but never longer than this so a
+# resume from suspend or a clock change is still noticed
+DAY_CHANGE_MAX_WAIT_S = 600
 
 # Import modules from include directory
 from include.alarm_management import AlarmManagement
@@ -60,6 +141,9 @@ class CalendarApp(
     TrayIcon,
     AlarmManagement,
 ):
+    # CSS sheet parsed once per process and shared by all windows
+    _css_provider_cache = None
+
     def __init__(self):
         Gtk.Window.__init__(self, title="CaLAN")
         self.set_default_size(900, 650)
@@ -77,32 +161,43 @@ class CalendarApp(
             )
 
         # Data storage
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-
         # Support multiple instances on same machine
         instance_id = os.environ.get("CALAN_INSTANCE", "1")
         if instance_id != "1":
-            data_dir = os.path.join(script_dir, "ical", f"instance_{instance_id}")
+            data_dir = os.path.join(DATA_DIR, f"instance_{instance_id}")
         else:
-            data_dir = os.path.join(script_dir, "ical")
+            data_dir = DATA_DIR
 
         # Initialize ICS storage BEFORE loading tasks
         self.ics_storage = ICSStorage(data_dir)
+        self.multicast_sync = None  # Started once tasks are loaded
+
+        # ICS writes run on one worker thread, so saves stay in request order
+        self._save_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="calan-save"
+        )
+        self._save_state_lock = threading.Lock()  # Guards the two fields below
+        self._save_timer_id = 0  # Pending coalesced save source id
+        self._save_dates = set()  # Dates changed since the last save, None = all
 
         # Initialize settings with default name
         self.settings = {"name": os.environ.get("USER", "User")}
 
         # Set application icon - use absolute path and verify it exists
-        self.icon_path = os.path.join(script_dir, "icon.png")
-        self.icon_path = os.path.abspath(self.icon_path)  # Convert to absolute path
+        self.icon_path = ICON_PATH
 
         # Log icon status
         if os.path.exists(self.icon_path):
-            self.debug_logger.logger.info(f"Icon found: {self.icon_path}")
-            self.set_icon_from_file(self.icon_path)
+            self.debug_logger.logger.info("Icon found: %s", self.icon_path)
+            # Decoded once as the default icon, which GTK reuses for this and
+            # every later window (dialogs included)
+            global _ICON_LOADED
+            if not _ICON_LOADED:
+                Gtk.Window.set_default_icon_from_file(self.icon_path)
+                _ICON_LOADED = True
         else:
             self.debug_logger.logger.debug(
-                f"Icon not found at {self.icon_path}, using system default"
+                "Icon not found at %s, using system default", self.icon_path
             )
             # Try to use a system icon as fallback
             try:
@@ -129,28 +224,45 @@ class CalendarApp(
         )  # What month/year user is viewing in calendar
         self.selected_date = None
         self.view_mode = "calendar"
-        self.triggered_alarms = set()
-        self.tray_blink_timer_id = None
-        self.tray_blink_state = False
+        self.triggered_alarms = {}  # Alarm owner key -> triggered alarm times
+        self._blink = None  # Active tray icon blink (see TrayIcon)
+        self._attention_widgets = weakref.WeakSet()  # Widgets needing attention
+        self._attention_tick_id = None  # Shared attention blink timer source id
+        self._attention_phase = False  # True while attention widgets are dimmed
+        self._now_cache = (0.0, None)  # (time.monotonic(), datetime) for _now
+        self._quit_dialog = None  # Open quit confirmation dialog
+        self._save_pending = 0  # Debounced task view save source id
+        self._dirty_rows = set()  # Task view rows edited since the last save
+        self._unsaved_tasks = {}  # Task id -> task changed outside its row widgets
+        self._now_iso_cache = (0.0, "")  # (monotonic time, ISO timestamp)
+        self._row_chunk_source = 0  # Idle source building deferred task rows
+        self._row_chunk_queue = []  # Tasks whose rows are not built yet
+        self.alarm_timer_id = None  # Alarm check timer source id
+        self.day_change_timer_id = None  # Midnight check timer source id
+        self.periodic_state_timer_id = None  # Debug state log timer source id
+        self._ui_batch_depth = 0  # Nesting of _batch_ui_updates blocks
+        self._ui_dirty = set()  # Widgets to redraw when the batch ends
+        self.task_list = None  # Task view row container, None outside the view
+        self.task_scroll = None  # Scrolled window holding task_list
+        self._last_time_check = None  # (text, is_valid) from _is_valid_time
+        self._frame_by_id = {}  # Task id -> task view row
+        self._task_positions = {}  # Date -> {task id: index in self.tasks[date]}
 
         # Log initial state (debug only)
         self.debug_logger.log_comprehensive_state()
 
-        # Create reusable CSS providers for performance
-        self._css_providers = self._create_css_providers()
+        # Reusable style classes, parsed once per process
+        type(self)._install_css()
 
         # Initialize multicast sync AFTER tasks are loaded but BEFORE UI is built
         self.multicast_sync = MulticastSync(self)
         self.multicast_sync.start_listening()
         self.debug_logger.logger.info("Multicast sync initialized")
 
-        # System tray icon - MUST be created before building UI
-        self.debug_logger.logger.info("Creating modern tray icon")
-        self.create_tray_icon()
-
-        # Initial badge update after tray icon is created
-        self.debug_logger.logger.debug("Performing initial badge update")
-        GLib.idle_add(self.update_tray_icon_badge)
+        # Tray state must exist before building UI, but the icon itself is
+        # created once the window has painted (it also does the first badge)
+        self.init_tray_state()
+        GLib.idle_add(self.create_tray_icon, priority=GLib.PRIORITY_LOW)
 
         # Build UI
         self.main_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
@@ -162,116 +274,41 @@ class CalendarApp(
         self.debug_logger.log_timer_operations("alarm_checker", "start")
         self.alarm_timer_id = GLib.timeout_add_seconds(1, self.check_alarms)
 
-        # Start day change checker (check every minute)
+        # Start day change checker (wakes up at midnight)
         self.debug_logger.log_timer_operations("day_change_checker", "start")
-        self.day_change_timer_id = GLib.timeout_add_seconds(60, self.check_day_change)
+        self._schedule_day_change_check()
 
         # Connect window signals
         self.connect("delete-event", self.on_delete_event)
         self.connect("window-state-event", self.on_window_state_event)
 
-        # Start periodic state logging (every 5 minutes)
-        self.debug_logger.log_timer_operations("periodic_state_log", "start")
-        self.periodic_state_timer_id = GLib.timeout_add_seconds(
-            300, self._periodic_state_log
-        )
-
-    def _create_css_providers(self):
-        """Create reusable CSS providers for better performance"""
-        providers = {}
-
-        # Hover effects
-        providers["hover_today"] = Gtk.CssProvider()
-        providers["hover_today"].load_from_data(
-            b"* { background-color: rgba(33, 150, 243, 0.15); }"
-        )
-
-        # Blink animation for attention indicator
-        providers["blink_animation"] = Gtk.CssProvider()
-        providers["blink_animation"].load_from_data(
-            b"""
-            @keyframes blink {
-                0% { opacity: 1; }
-                50% { opacity: 0.3; }
-                100% { opacity: 1; }
-            }
-            """
-        )
-
-        providers["hover_normal"] = Gtk.CssProvider()
-        providers["hover_normal"].load_from_data(
-            b"* { background-color: rgba(33, 150, 243, 0.05); }"
-        )
-
-        providers["hover_leave_today"] = Gtk.CssProvider()
-        providers["hover_leave_today"].load_from_data(
-            b"* { background-color: rgba(33, 150, 243, 0.1); }"
-        )
-
-        providers["hover_leave_normal"] = Gtk.CssProvider()
-        providers["hover_leave_normal"].load_from_data(
-            b"* { background-color: transparent; }"
-        )
-
-        # Drag motion
-        providers["drag_motion"] = Gtk.CssProvider()
-        providers["drag_motion"].load_from_data(
-            b"* { background-color: rgba(76, 175, 80, 0.3); border: 2px solid #4CAF50; }"
-        )
-
-        # Drag leave
-        providers["drag_leave_today"] = Gtk.CssProvider()
-        providers["drag_leave_today"].load_from_data(
-            b"* { background-color: rgba(33, 150, 243, 0.1); border: 1px solid #1a1a1a; }"
-        )
-
-        providers["drag_leave_normal"] = Gtk.CssProvider()
-        providers["drag_leave_normal"].load_from_data(
-            b"* { background-color: transparent; border: 1px solid #1a1a1a; }"
-        )
-
-        # Delete button CSS (reusable)
-        providers["delete_button"] = Gtk.CssProvider()
-        providers["delete_button"].load_from_data(
-            b"""
-            button {
-                background-color: #f44336;
-                color: white;
-                border-radius: 8px;
-                padding: 0px;
-                min-width: 0px;
-                min-height: 0px;
-                font-size: 10px;
-                font-weight: bold;
-                border: none;
-                transition: all 200ms ease;
-            }
-            button:hover {
-                background-color: #ff5252;
-                box-shadow: 0 2px 4px rgba(0,0,0,0.3);
-            }
-            button label {
-                padding: 0px;
-                margin: 0px;
-            }
-        """
-        )
+        # Start periodic state logging (every 5 minutes) - its output is debug
+        # only, so there is no timer at all at higher log levels
+        if self.debug_logger.logger.isEnabledFor(logging.DEBUG):
+            self.debug_logger.log_timer_operations("periodic_state_log", "start")
+            self.periodic_state_timer_id = GLib.timeout_add_seconds(
+                300, self._periodic_state_log
+            )
 
-        # Sync success button CSS
-        providers["sync_success"] = Gtk.CssProvider()
-        providers["sync_success"].load_from_data(
-            b"""
-            .success {
-                background-color: #4CAF50;
-                color: white;
-                border-radius: 4px;
-                font-weight: bold;
-                transition: all 200ms ease;
-            }
-        """
-        )
+    @classmethod
+    def _install_css(cls):
+        """Add the shared CSS sheet to the screen, once per process"""
+        if cls._css_provider_cache is None:
+            cls._css_provider_cache = cls._create_css_provider()
+            # Above the per-widget base styles so state classes override them
+            Gtk.StyleContext.add_provider_for_screen(
+                Gdk.Screen.get_default(),
+                cls._css_provider_cache,
+                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION + 1,
+            )
+        return cls._css_provider_cache
 
-        return providers
+    @staticmethod
+    def _create_css_provider():
+        """Create the CSS provider holding all reusable style classes"""
+        provider = Gtk.CssProvider()
+        provider.load_from_data(CALENDAR_CSS)
+        return provider
 
     def _set_cursor(self, widget, event, cursor_type=Gdk.CursorType.HAND2):
         """Set cursor on widget"""
@@ -280,13 +317,13 @@ class CalendarApp(
             window.set_cursor(Gdk.Cursor.new(cursor_type))
         return False
 
-    def _get_user_color(self, username):
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _get_user_color(username):
         """Generate a consistent, vibrant pastel color based on username"""
         if not username:
             return (200, 200, 200)
 
-        import unicodedata
-
         name = unicodedata.normalize("NFC", username.strip())
 
         if not name:
@@ -302,29 +339,9 @@ class CalendarApp(
         saturation = 0.7
         lightness = 0.30
 
-        # Convert HSL to RGB
-        def hsl_to_rgb(h, s, l):
-            h = h / 360.0
-            c = (1 - abs(2 * l - 1)) * s
-            x = c * (1 - abs((h * 6) % 2 - 1))
-            m = l - c / 2
-
-            if h < 1 / 6:
-                r, g, b = c, x, 0
-            elif h < 2 / 6:
-                r, g, b = x, c, 0
-            elif h < 3 / 6:
-                r, g, b = 0, c, x
-            elif h < 4 / 6:
-                r, g, b = 0, x, c
-            elif h < 5 / 6:
-                r, g, b = x, 0, c
-            else:
-                r, g, b = c, 0, x
-
-            return (int((r + m) * 255), int((g + m) * 255), int((b + m) * 255))
-
-        return hsl_to_rgb(hue, saturation, lightness)
+        # Convert HSL to RGB (colorsys takes hue as 0-1 and lightness first)
+        r, g, b = colorsys.hls_to_rgb(hue / 360.0, lightness, saturation)
+        return (int(r * 255), int(g * 255), int(b * 255))
 
     def on_window_state_event(self, widget, event):
         """Handle window state changes (minimize)"""
@@ -334,6 +351,9 @@ class CalendarApp(
 
     def _periodic_state_log(self):
         """Periodic comprehensive state logging"""
+        # Skip the introspection while the log level is raised at runtime
+        if not self.debug_logger.logger.isEnabledFor(logging.DEBUG):
+            return True
         self.debug_logger.log_comprehensive_state()
         self.debug_logger.log_performance_metrics()
         return True
@@ -342,40 +362,38 @@ class CalendarApp(
         """Properly quit the application"""
         self.debug_logger.logger.debug("Application quitting")
 
+        # Flush any debounced task edits before sync stops
+        if self.view_mode == "tasks":
+            self._flush_pending_save()
+
         # Stop multicast sync
-        if hasattr(self, "multicast_sync"):
+        if self.multicast_sync is not None:
             self.multicast_sync.stop_listening()
 
+        # Write out pending task saves before the process exits
+        self.flush_tasks_save(wait=True)
+        self._save_executor.shutdown()
+
         # Stop alarm and day change timers
-        if hasattr(self, "alarm_timer_id") and self.alarm_timer_id is not None:
+        if self.alarm_timer_id is not None:
             GLib.source_remove(self.alarm_timer_id)
             self.alarm_timer_id = None
-        if (
-            hasattr(self, "day_change_timer_id")
-            and self.day_change_timer_id is not None
-        ):
+        if self.day_change_timer_id is not None:
             GLib.source_remove(self.day_change_timer_id)
             self.day_change_timer_id = None
-        if (
-            hasattr(self, "periodic_state_timer_id")
-            and self.periodic_state_timer_id is not None
-        ):
+        if self.periodic_state_timer_id is not None:
             GLib.source_remove(self.periodic_state_timer_id)
             self.periodic_state_timer_id = None
 
-        # Clean up all blinking timers
-        if hasattr(self, "_attention_blink_timers"):
-            for timer_id in self._attention_blink_timers.values():
-                GLib.source_remove(timer_id)
-            self._attention_blink_timers.clear()
+        # Clean up the attention blinking timer
+        if self._attention_tick_id is not None:
+            GLib.source_remove(self._attention_tick_id)
+            self._attention_tick_id = None
 
         # Clean up tray blinking timer
-        if (
-            hasattr(self, "tray_blink_timer_id")
-            and self.tray_blink_timer_id is not None
-        ):
-            GLib.source_remove(self.tray_blink_timer_id)
-            self.tray_blink_timer_id = None
+        if self._blink is not None:
+            GLib.source_remove(self._blink.timer_id)
+            self._blink = None
 
         # Log final state (debug only)
         self.debug_logger.log_comprehensive_state()
@@ -386,10 +404,10 @@ class CalendarApp(
 
         Gtk.main_quit()
 
-    def start_tray_blinking(self):
+    def start_tray_blinking(self, task_count=None):
         """Start blinking tray icon when app is minimized and new updates arrive"""
         # Delegate to TrayIcon class
-        super().start_tray_blinking()
+        super().start_tray_blinking(task_count)
 
     def stop_tray_blinking(self):
         """Stop blinking tray icon and restore normal state"""
@@ -398,6 +416,11 @@ class CalendarApp(
 
     def on_delete_event(self, widget, event):
         """Handle window close - show quit dialog"""
+        # A dialog is already open - just bring it back to the front
+        if self._quit_dialog is not None:
+            self._quit_dialog.present()
+            return True
+
         self.debug_logger.logger.info("Window close requested - showing quit dialog")
 
         # Create quit confirmation dialog
@@ -415,20 +438,51 @@ class CalendarApp(
         content_area.set_margin_top(30)
         content_area.set_margin_bottom(10)
 
-        response = dialog.run()
+        # Answered through the response signal rather than dialog.run(), whose
+        # nested main loop held up alarms and sync until the user clicked
+        dialog.connect("response", self._on_quit_dialog_response)
+        self._quit_dialog = dialog
+        dialog.show()
+        return True  # The window only closes once quitting is confirmed
+
+    def _on_quit_dialog_response(self, dialog, response):
+        """Quit or keep running depending on the quit dialog answer"""
+        self._quit_dialog = None
         dialog.destroy()
 
         if response == Gtk.ResponseType.YES:
             self.debug_logger.logger.info("User confirmed quit")
             self.quit_application()
-            return False  # Allow the window to close
         else:
             self.debug_logger.logger.info("User canceled quit - keeping window open")
-            return True  # Prevent window close
+
+    def _now(self):
+        """Current local time, read at most once per NOW_CACHE_SECONDS"""
+        stamp, now = self._now_cache
+        monotonic = time.monotonic()
+        if now is None or monotonic - stamp > NOW_CACHE_SECONDS:
+            now = datetime.now()
+            self._now_cache = (monotonic, now)
+        return now
+
+    def _schedule_day_change_check(self):
+        """Arm the day change timer for just after the next local midnight"""
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        delay = int((midnight - now).total_seconds()) + 1
+        self.day_change_timer_id = GLib.timeout_add_seconds(
+            min(delay, DAY_CHANGE_MAX_WAIT_S), self._on_day_change_timer
+        )
+
+    def _on_day_change_timer(self):
+        """Run the day change check and re-arm the timer"""
+        self.check_day_change()
+        self._schedule_day_change_check()
+        return GLib.SOURCE_REMOVE
 
     def check_day_change(self):
         """Check if day has changed and update calendar if needed"""
-        now = datetime.now()
+        now = self._now()
 
         # FIXED: Compare against actual current_date (not viewing_date)
         if now.date() != self.current_date.date():
@@ -441,11 +495,13 @@ class CalendarApp(
                 self.update_calendar()
 
             self.debug_logger.logger.debug(
-                f"Day changed from {old_date.date()} to {now.date()} - calendar redrawn, viewing_date unchanged"
+                "Day changed from %s to %s - calendar redrawn, viewing_date unchanged",
+                old_date.date(),
+                now.date(),
             )
 
             # Update tray badge for new day
-            GLib.idle_add(self.update_tray_icon_badge)
+            self.schedule_badge_update()
 
         return True
 
@@ -453,79 +509,102 @@ class CalendarApp(
         """Load tasks from ICS file"""
         return self.ics_storage.load_tasks()
 
-    def save_tasks(self):
-        """Save tasks to ICS file"""
+    def save_tasks(self, date_str=None):
+        """Save tasks to ICS file (pass date_str when only that day changed)"""
+        # Tasks changed - drop the cached sync payload
+        if self.multicast_sync is not None:
+            self.multicast_sync.invalidate_tasks_cache()
+
+        # Bursts of saves (bulk sync, quick edits) become one background write
+        with self._save_state_lock:
+            if date_str is None:
+                self._save_dates = None
+            elif self._save_dates is not None:
+                self._save_dates.add(date_str)
+            if not self._save_timer_id:
+                self._save_timer_id = GLib.timeout_add(
+                    SAVE_COALESCE_MS, self._start_background_save
+                )
+
+        # Badge updates from a burst of saves are coalesced into one idle update
+        self.schedule_badge_update()
+
+    def _start_background_save(self):
+        """Snapshot the tasks and hand them to the save worker"""
+        with self._save_state_lock:
+            self._save_timer_id = 0
+            dates, self._save_dates = self._save_dates, set()
+
+        # The worker gets its own copies - the UI and sync keep editing these
+        snapshot = {
+            date_str: [dict(task) for task in list(task_list)]
+            for date_str, task_list in list(self.tasks.items())
+        }
+        self._save_executor.submit(self._write_tasks_snapshot, snapshot, dates)
+        return GLib.SOURCE_REMOVE
+
+    def _write_tasks_snapshot(self, tasks, dates):
+        """Write a tasks snapshot to the ICS file - runs on the save worker"""
         try:
-            self.ics_storage.save_tasks(self.tasks)
+            self.ics_storage.save_tasks(tasks, dates)
 
             # Log task save
-            today_str = datetime.now().strftime("%Y-%m-%d")
-            task_count = len(self.tasks.get(today_str, []))
-            self.debug_logger.logger.debug(
-                f"Tasks saved to ICS, today's task count: {task_count}"
-            )
-
-            # Force badge update immediately
+            today_str = self._today_str()
+            task_count = len(tasks.get(today_str, []))
             self.debug_logger.logger.debug(
-                "Forcing tray icon badge update after task save"
+                "Tasks saved to ICS, today's task count: %d", task_count
             )
-            self.update_tray_icon_badge()
         except Exception as e:
             self.debug_logger.log_exception(e, "save_tasks")
 
+    def flush_tasks_save(self, wait=False):
+        """Start any pending task save now, optionally waiting until it is written"""
+        with self._save_state_lock:
+            timer_id = self._save_timer_id
+        if timer_id:
+            GLib.source_remove(timer_id)
+            self._start_background_save()
+        if wait:
+            # Runs after every save queued before it
+            self._save_executor.submit(lambda: None).result()
+
     def _add_blinking_effect(self, widget):
         """Add blinking effect to a widget - FIXED: Remove self-assignment and add validation"""
-        if not hasattr(self, "_attention_blink_timers"):
-            self._attention_blink_timers = {}
-
-        widget_id = id(widget)
-
         # FIXED: Validate task_ref is set instead of self-assignment
         if not hasattr(widget, "task_ref"):
             self.debug_logger.logger.warning(
-                f"Widget {widget_id} missing task_ref - blinking cleanup may fail"
+                "Widget %s missing task_ref - blinking cleanup may fail", id(widget)
+            )
+
+        # Weakly held, so widgets that are dropped leave the set by themselves
+        self._attention_widgets.add(widget)
+
+        # All attention widgets blink together from one shared timer, once a
+        # second like the tray icon - second timers let GLib batch the wakeups
+        if self._attention_tick_id is None:
+            self._attention_tick_id = GLib.timeout_add_seconds(
+                1, self._on_attention_blink_tick
             )
 
-        def blink_callback():
-            if (
-                hasattr(self, "_attention_blink_timers")
-                and widget_id in self._attention_blink_timers
-            ):
-                current_opacity = widget.get_opacity()
-                new_opacity = 0.3 if current_opacity > 0.5 else 1.0
-                widget.set_opacity(new_opacity)
-                return True
+    def _on_attention_blink_tick(self):
+        """Toggle the opacity of every widget that needs attention"""
+        widgets = self._attention_widgets
+        if not widgets:
+            self._attention_tick_id = None
             return False
 
-        timer_id = GLib.timeout_add(500, blink_callback)
-        self._attention_blink_timers[widget_id] = timer_id
-
-        if not hasattr(self, "_attention_widgets"):
-            self._attention_widgets = {}
-        self._attention_widgets[widget_id] = widget
-
-        # Add destroy callback to clean up timer when widget is destroyed
-        def on_widget_destroy(widget):
-            if (
-                hasattr(self, "_attention_blink_timers")
-                and widget_id in self._attention_blink_timers
-            ):
-                GLib.source_remove(self._attention_blink_timers[widget_id])
-                del self._attention_blink_timers[widget_id]
-            if (
-                hasattr(self, "_attention_widgets")
-                and widget_id in self._attention_widgets
-            ):
-                del self._attention_widgets[widget_id]
-
-        widget.connect("destroy", on_widget_destroy)
+        self._attention_phase = not self._attention_phase
+        opacity = 0.3 if self._attention_phase else 1.0
+        for widget in widgets:
+            # Nothing to repaint while the window sits in the tray or the
+            # widget's view is not shown (or it was destroyed) - skip the redraw
+            if widget.get_mapped():
+                widget.set_opacity(opacity)
+        return True
 
     def _stop_blinking_for_task(self, task):
         """Stop blinking effect for a specific task - FIXED: Improved cleanup with task ID matching"""
-        if (
-            not hasattr(self, "_attention_blink_timers")
-            or not self._attention_blink_timers
-        ):
+        if not self._attention_widgets:
             return
 
         # Use task ID for matching to avoid reference issues
@@ -534,39 +613,31 @@ class CalendarApp(
             return
 
         widgets_to_remove = []
-        for widget_id, widget in getattr(self, "_attention_widgets", {}).items():
+        for widget in self._attention_widgets:
             # Match by task ID instead of object identity
             if hasattr(widget, "task_ref"):
                 widget_task_id = widget.task_ref.get("id")
                 if widget_task_id == task_id:
-                    widgets_to_remove.append(widget_id)
-
-        # Remove only the timers and widgets for this specific task
-        for widget_id in widgets_to_remove:
-            if widget_id in self._attention_blink_timers:
-                GLib.source_remove(self._attention_blink_timers[widget_id])
-                del self._attention_blink_timers[widget_id]
-            if widget_id in self._attention_widgets:
-                # FIXED: Properly clean up widget state
-                widget = self._attention_widgets[widget_id]
-                widget.set_opacity(1.0)
-                # Disconnect any signals
-                if hasattr(widget, "_blink_connections"):
-                    for conn_id in widget._blink_connections:
-                        try:
-                            widget.disconnect(conn_id)
-                        except:
-                            pass
-                del self._attention_widgets[widget_id]
+                    widgets_to_remove.append(widget)
+
+        # Remove only the widgets for this specific task
+        for widget in widgets_to_remove:
+            # FIXED: Properly clean up widget state
+            widget.set_opacity(1.0)
+            # Disconnect any signals
+            if hasattr(widget, "_blink_connections"):
+                for conn_id in widget._blink_connections:
+                    try:
+                        widget.disconnect(conn_id)
+                    except:
+                        pass
+            self._attention_widgets.discard(widget)
 
         # FIXED: Additional cleanup to prevent memory leaks
-        if (
-            hasattr(self, "_attention_blink_timers")
-            and not self._attention_blink_timers
-        ):
-            del self._attention_blink_timers
-        if hasattr(self, "_attention_widgets") and not self._attention_widgets:
-            del self._attention_widgets
+        if not self._attention_widgets:
+            if self._attention_tick_id is not None:
+                GLib.source_remove(self._attention_tick_id)
+                self._attention_tick_id = None
 
 
 def main():
@@ -0,0 +1,81 @@
+"""Tests for include/multicast_sync.py"""
+
+import importlib.util
+import json
+import logging
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+GI_AVAILABLE = importlib.util.find_spec("gi") is not None
+if GI_AVAILABLE:
+    from include.multicast_sync import MulticastSync
+
+
+def _make_sync():
+    """MulticastSync with just the state _handle_datagrams needs"""
+    sync = MulticastSync.__new__(MulticastSync)
+    sync.logger = logging.getLogger("test_multicast_sync")
+    sync.instance_name = "local-00000000"
+    sync.applied = []
+    sync._handle_task_update = lambda message, address: sync.applied.append(
+        message["task"]
+    )
+    sync._apply_task_update_batch = lambda tasks, operation: sync.applied.extend(
+        tasks
+    )
+    return sync
+
+
+def _task_update(description, updated_at):
+    """Encoded task_update datagram for the same task from a remote peer"""
+    message = {
+        "type": "task_update",
+        "sender": "Remote",
+        "instance": "remote-11111111",
+        "operation": "update",
+        "task": {
+            "id": "task-1",
+            "date": "2026-10-15",
+            "description": description,
+            "updated_at": updated_at,
+        },
+    }
+    return json.dumps(message).encode("utf-8"), ("192.168.1.2", 1900)
+
+
+@unittest.skipUnless(GI_AVAILABLE, "PyGObject is not installed")
+class HandleDatagramsTest(unittest.TestCase):
+    def test_handle_datagrams_keeps_newest_update_when_out_of_order(self):
+        sync = _make_sync()
+
+        sync._handle_datagrams(
+            [
+                _task_update("newer", "2026-10-15T10:00:05"),
+                _task_update("older", "2026-10-15T10:00:01"),
+            ]
+        )
+
+        self.assertEqual(
+            [task["description"] for task in sync.applied], ["newer"]
+        )
+
+    def test_handle_datagrams_keeps_later_arrival_for_newer_timestamp(self):
+        sync = _make_sync()
+
+        sync._handle_datagrams(
+            [
+                _task_update("older", "2026-10-15T10:00:01"),
+                _task_update("newer", "2026-10-15T10:00:05"),
+            ]
+        )
+
+        self.assertEqual(
+            [task["description"] for task in sync.applied], ["newer"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()